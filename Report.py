@@ -3,14 +3,12 @@ from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
 import csv
 import os
-from fpdf import FPDF
 
 
 class HotelReportsPage(ctk.CTkFrame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
-        self.db = controller.db
 
         # Configure grid layout
         self.grid_rowconfigure(0, weight=1)
@@ -25,54 +23,84 @@ class HotelReportsPage(ctk.CTkFrame):
             "new_customers_list": []
         }
 
+        # Change-feed marker the charts were built from
+        self.change_marker = None
+
         self.create_sidebar()
         self.create_main_content()
         self.refresh_data()
         self.after(30000, self.auto_refresh)
 
+    @property
+    def db(self):
+        """The app's DatabaseManager; only read on worker threads, since first use connects"""
+        return self.controller.db
+
     def refresh_data(self):
-        """Refresh all data from database"""
-        try:
-            # Get data from database
-            customer_growth = self.db.get_customer_growth() or {}
-            total_customers = self._calculate_cumulative_customers(customer_growth)
-            booking_trends = self.db.get_booking_trends() or {}
-            revenue_trends = self.db.get_revenue_trends() or {}
-
-            self.reports_data = {
-                "new_customers": customer_growth,
-                "total_customers": total_customers,
-                "revenue_data": revenue_trends,
-                "booking_data": booking_trends,
-                "new_customers_list": self.db.get_recent_customers(5) or []
-            }
-
-            # Fill in missing months with zeros
-            months = self._get_last_six_months()
-            for metric in ["new_customers", "total_customers", "revenue_data", "booking_data"]:
-                for month in months:
-                    if month not in self.reports_data[metric]:
-                        self.reports_data[metric][month] = 0
+        """Refresh all data from database (in the background)"""
+        self.controller.db_executor.submit(
+            self._fetch_report_bundle,
+            on_success=self._apply_report_bundle,
+            on_error=self._on_refresh_error,
+            key="reports:refresh"
+        )
 
-            self.update_ui()
+    def _fetch_report_bundle(self):
+        """Worker thread: fold new rows into the rollup, then read every series
+        and the recent customers in a single round trip"""
+        marker = self.db.get_change_marker()
+        # Unthrottled, so the charts cover every change up to ``marker``;
+        # if the fold fails, leave the marker unset so the next check retries
+        if not self.db.refresh_monthly_metrics(force=True):
+            marker = None
+        bundle = self.db.get_report_bundle(6)
+        bundle["marker"] = marker
+        return bundle
+
+    def _fetch_report_changes(self, since):
+        """Worker thread: a new bundle only if customers, reservations or
+        transactions changed since marker ``since`` (None otherwise)"""
+        marker = self.db.get_change_marker()
+        if marker is not None and marker == since:
+            return None
+        return self._fetch_report_bundle()
+
+    def _apply_report_bundle(self, bundle):
+        """Tk thread: turn a report bundle into chart data and redraw"""
+        if bundle is None:
+            return  # Nothing changed since the last refresh
+        self.change_marker = bundle["marker"]
+        months = [datetime.strptime(key, "%Y-%m").strftime('%b') for key in bundle["months"]]
+        customer_growth = dict(zip(months, bundle["new_customers"]))
 
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load data: {str(e)}")
-            months = self._get_last_six_months()
-            self.reports_data = {
-                "new_customers": {month: 0 for month in months},
-                "total_customers": {month: 0 for month in months},
-                "revenue_data": {month: 0 for month in months},
-                "booking_data": {month: 0 for month in months},
-                "new_customers_list": []
-            }
-            self.update_ui()
+        self.reports_data = {
+            "new_customers": customer_growth,
+            "total_customers": self._calculate_cumulative_customers(customer_growth),
+            "revenue_data": dict(zip(months, bundle["revenue"])),
+            "booking_data": dict(zip(months, bundle["bookings"])),
+            "new_customers_list": bundle["recent_customers"]
+        }
+
+        self.update_ui()
+
+    def _on_refresh_error(self, e):
+        """Tk thread: show the error and fall back to empty charts"""
+        messagebox.showerror("Database Error", f"Failed to load data: {str(e)}")
+        months = self._get_last_six_months()
+        self.reports_data = {
+            "new_customers": {month: 0 for month in months},
+            "total_customers": {month: 0 for month in months},
+            "revenue_data": {month: 0 for month in months},
+            "booking_data": {month: 0 for month in months},
+            "new_customers_list": []
+        }
+        self.update_ui()
 
     def _calculate_cumulative_customers(self, customer_growth):
-        """Calculate cumulative total customers from growth data"""
+        """Calculate cumulative total customers from growth data (in month order)"""
         total = 0
         cumulative = {}
-        for month, count in sorted(customer_growth.items()):
+        for month, count in customer_growth.items():
             total += count
             cumulative[month] = total
         return cumulative
@@ -327,8 +355,13 @@ class HotelReportsPage(ctk.CTkFrame):
         )
 
     def auto_refresh(self):
-        """Auto-refresh data at intervals"""
-        self.refresh_data()
+        """Auto-refresh at intervals; an idle check costs one change-feed query"""
+        self.controller.db_executor.submit(
+            self._fetch_report_changes,
+            self.change_marker,
+            on_success=self._apply_report_bundle,
+            key="reports:refresh"
+        )
         self.after(30000, self.auto_refresh)
 
     def create_sidebar(self):
@@ -716,6 +749,8 @@ class HotelReportsPage(ctk.CTkFrame):
 
     def _create_pdf_report(self, file_path):
         """Helper method to create PDF report"""
+        from fpdf import FPDF  # only needed for exports
+
         pdf = FPDF()
         pdf.add_page()
         pdf.set_font("Arial", size=12)
@@ -1,7 +1,8 @@
 import customtkinter as ctk
 from tkinter import ttk, messagebox
 from datetime import datetime, date
-from db_helper import DatabaseManager
+from reservation_model import Reservation, ReservationStore, parse_amount, parse_date, format_date
+from search_controller import SearchController
 
 
 class HotelReservationsPage(ctk.CTkFrame):
@@ -9,12 +10,30 @@ class HotelReservationsPage(ctk.CTkFrame):
         super().__init__(parent)
         self.controller = controller
 
-        # Initialize data
-        self.reservations = []
+        # Initialize data: Reservation records keyed by ID; the tree uses
+        # the same IDs as item ids so single rows can be patched in place
+        self.store = ReservationStore()
         self.selected_reservation_id = None
+
+        # Change-feed position of self.store and whose rows they are;
+        # reloads after the first only fetch what changed since
+        self.change_version = None
+        self.loaded_user_id = None
         self.sort_column = None
         self.sort_descending = False
 
+        # Reservations are already in memory, so search is local and only
+        # debounced; refinements filter the previous matches
+        self.search = SearchController(
+            self,
+            get_query=lambda: self.search_entry.get().lower(),
+            fetch=lambda query: [r for r in self.store.values() if self._reservation_matches(r, query)],
+            match=self._reservation_matches,
+            on_results=self.display_reservations,
+            on_clear=self.display_reservations,
+            key="reservations:search"
+        )
+
         # Configure grid layout
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -27,101 +46,151 @@ class HotelReservationsPage(ctk.CTkFrame):
         self.bind("<Visibility>", lambda e: self.load_data())
 
     def load_data(self):
-        """Load reservations data from database"""
-        try:
-            # Ensure database connection
-            if not hasattr(self.controller, 'db'):
-                self.controller.db = DatabaseManager()
-
-            if not self.controller.db.connection.is_connected():
-                self.controller.db.connect()
-
-            with self.controller.db.connection.cursor(dictionary=True) as cursor:
-                cursor.execute("""
-                    SELECT 
-                        reservation_id as id,
-                        guest_name as name,
-                        DATE_FORMAT(checkin_date, '%b %d, %Y') as checkin,
-                        CONCAT('$', FORMAT(booking_amount, 2)) as amount
-                    FROM reservations
-                    WHERE user_id = %s
-                    ORDER BY checkin_date DESC
-                """, (self.controller.current_user['user_id'],))
-                self.reservations = cursor.fetchall()
-
-            # Update the UI with the loaded data
-            self.display_reservations()
+        """Load reservations data from database (in the background).
+
+        The first load for a user fetches every row; later loads ask the
+        change feed what changed and fetch only those rows, so an idle
+        reload is a single query.
+        """
+        if not self.controller.current_user:
+            return
+
+        user_id = self.controller.current_user['user_id']
+        if user_id == self.loaded_user_id and self.change_version is not None:
+            fetch = (self._fetch_changes, user_id, self.change_version)
+        else:
+            fetch = (self._fetch_all, user_id)
+
+        # <Visibility> fires often; each load supersedes the previous one
+        self.controller.db_executor.submit(
+            *fetch,
+            on_success=self._on_reservations_loaded,
+            key="reservations:load"
+        )
 
-        except Exception as e:
-            self.reservations = []
+    def _fetch_all(self, user_id):
+        """Worker thread: every reservation, tagged with the feed version read first"""
+        db = self.controller.db
+        version = db.get_change_version()
+        return {"user_id": user_id, "version": version, "rows": db.get_reservations(user_id)}
+
+    def _fetch_changes(self, user_id, since):
+        """Worker thread: rows added/updated and ids deleted since ``since``"""
+        db = self.controller.db
+        latest, changes = db.get_changes_since(since, "reservations", owner_id=user_id)
+        if changes is None:
+            return self._fetch_all(user_id)
+
+        # Keep the last operation per row
+        last_operation = {}
+        for change in changes:
+            last_operation[change["row_key"]] = change["operation"]
+        changed_ids = [key for key, op in last_operation.items() if op != "delete"]
+        rows = db.get_reservations(user_id, changed_ids) if changed_ids else []
+
+        found = {row.id for row in rows}
+        return {
+            "user_id": user_id,
+            "version": latest,
+            "upserts": rows,
+            # Rows changed and then deleted before we read them count as deleted
+            "deleted": {key for key in last_operation if key not in found},
+        }
+
+    def _on_reservations_loaded(self, result):
+        """Update the model and table with a full load or a delta"""
+        self.loaded_user_id = result["user_id"]
+        self.change_version = result["version"]
+
+        if "rows" in result:
+            self.store.replace(result["rows"])
+            self.search.reset()
             self.display_reservations()
+            return
 
-    def save_data(self, reservation_data=None, delete_id=None):
-        """Save or delete reservation data in database"""
-        try:
-            # Ensure database connection
-            if not hasattr(self.controller, 'db') or not self.controller.db.connection.is_connected():
-                self.controller.db = DatabaseManager()
-                self.controller.db.connect()
-
-            with self.controller.db.connection.cursor() as cursor:
-                if reservation_data and 'id' in reservation_data:
-                    # Parse the date string into a datetime object first
-                    try:
-                        checkin_date = datetime.strptime(reservation_data['checkin'], "%b %d, %Y").date()
-                        amount = float(reservation_data['amount'].replace('$', '').replace(',', ''))
-                    except ValueError as e:
-                        messagebox.showerror("Error", f"Invalid format: {str(e)}")
-                        return False
-
-                    # Update existing reservation
-                    if any(r['id'] == reservation_data['id'] for r in self.reservations):
-                        cursor.execute("""
-                            UPDATE reservations 
-                            SET guest_name = %s, 
-                                checkin_date = %s, 
-                                booking_amount = %s
-                            WHERE reservation_id = %s AND user_id = %s
-                        """, (
-                            reservation_data['name'],
-                            checkin_date,
-                            amount,
-                            reservation_data['id'],
-                            self.controller.current_user['user_id']
-                        ))
-                    else:
-                        # Insert new reservation
-                        cursor.execute("""
-                            INSERT INTO reservations 
-                            (reservation_id, user_id, guest_name, checkin_date, booking_amount)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (
-                            reservation_data['id'],
-                            self.controller.current_user['user_id'],
-                            reservation_data['name'],
-                            checkin_date,
-                            amount
-                        ))
-                elif delete_id:
-                    # Delete reservation
-                    cursor.execute("""
-                        DELETE FROM reservations 
-                        WHERE reservation_id = %s AND user_id = %s
-                    """, (delete_id, self.controller.current_user['user_id']))
-
-                self.controller.db.connection.commit()
-                self.load_data()  # Refresh data after changes
-                return True
-
-        except Exception as e:
+        # A delta only touches the rows that changed
+        for reservation_id in result["deleted"]:
+            self._apply_write(delete_id=reservation_id)
+        for reservation in result["upserts"]:
+            self._apply_write(reservation=reservation)
+
+    def _apply_write(self, reservation=None, delete_id=None):
+        """Apply one saved row (or deletion) to the store and patch its tree row"""
+        if delete_id is not None:
+            if self.store.remove(delete_id) is None:
+                return
+            if self.tree.exists(delete_id):
+                self.tree.delete(delete_id)
+            if self.selected_reservation_id == delete_id:
+                self.selected_reservation_id = None
+        else:
+            self.store.upsert(reservation)
+            # Keep the row only if it still matches the current search
+            query = self.search_entry.get().lower()
+            if not self._reservation_matches(reservation, query):
+                if self.tree.exists(reservation.id):
+                    self.tree.delete(reservation.id)
+            elif self.tree.exists(reservation.id):
+                self.tree.item(reservation.id, values=self._row_values(reservation))
+            else:
+                # New rows go to the top until the next sort or reload
+                self.tree.insert("", 0, iid=reservation.id, values=self._row_values(reservation))
+        self.search.reset()
+
+    def save_data(self, reservation_data=None, delete_id=None, on_saved=None):
+        """Save or delete reservation data in database.
+
+        The write runs in the background; ``on_saved`` is called on success.
+        """
+        user_id = self.controller.current_user['user_id']
+
+        record = None
+        if reservation_data:
+            # Dialog values are display strings; store native values
+            try:
+                checkin_date = parse_date(reservation_data['checkin'])
+                amount = parse_amount(reservation_data['amount'])
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid format: {str(e)}")
+                return
+
+            record = {
+                'reservation_id': reservation_data.get('id'),
+                'guest_name': reservation_data['name'],
+                'checkin_date': checkin_date,
+                'booking_amount': amount
+            }
+
+            # Update existing reservation, otherwise insert a new one
+            # (add_reservation allocates the ID and writes it into record)
+            if record['reservation_id'] in self.store:
+                operation = lambda: self.controller.db.update_reservation(user_id, record['reservation_id'], record)
+            else:
+                operation = lambda: self.controller.db.add_reservation(user_id, record)
+        elif delete_id:
+            operation = lambda: self.controller.db.delete_reservation(user_id, delete_id)
+        else:
+            return
+
+        def on_done(saved):
+            if not saved:
+                messagebox.showerror("Error", "Database operation failed")
+                return
+            # Apply the write locally instead of reloading every row
+            if record:
+                self._apply_write(reservation=Reservation(
+                    record['reservation_id'], record['guest_name'],
+                    record['checkin_date'], record['booking_amount']
+                ))
+            else:
+                self._apply_write(delete_id=delete_id)
+            if on_saved:
+                on_saved()
+
+        def on_error(e):
             messagebox.showerror("Error", f"Database operation failed: {str(e)}")
-            if "MySQL Connection not available" in str(e):
-                try:
-                    self.controller.db.connect()
-                    return self.save_data(reservation_data, delete_id)
-                except:
-                    pass
-            return False
+
+        self.controller.db_executor.submit(operation, on_success=on_done, on_error=on_error)
 
     def create_sidebar(self):
         """Create the sidebar navigation"""
@@ -393,54 +462,44 @@ class HotelReservationsPage(ctk.CTkFrame):
     def display_reservations(self, reservations=None):
         """Display reservations in the treeview"""
         # Clear existing rows
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
 
         # Reset selection
         self.selected_reservation_id = None
 
         # Use filtered reservations if provided
-        display_data = reservations if reservations is not None else self.reservations
+        display_data = reservations if reservations is not None else self.store.values()
 
         if not display_data:
             # Show empty message if needed
             return
 
-        # Insert data into treeview
+        # Insert data into treeview, formatting only the rows shown
         for reservation in display_data:
-            # Add a space prefix to each value for visual padding
-            item = self.tree.insert("", "end", values=(
-                f" {reservation['id']}",
-                f" {reservation['name']}",
-                f" {reservation['checkin']}",
-                f" {reservation['amount']}"
-            ))
+            self.tree.insert("", "end", iid=reservation.id, values=self._row_values(reservation))
+
+    @staticmethod
+    def _row_values(reservation):
+        # Add a space prefix to each value for visual padding
+        return tuple(f" {value}" for value in reservation.display_values())
 
     def on_tree_select(self, event):
         """Handle treeview row selection"""
         selection = self.tree.selection()
         if selection:
-            item = self.tree.item(selection[0])
-            values = item["values"]
-            # Strip the space we added for padding when getting the ID
-            self.selected_reservation_id = values[0].strip()  # ID is the first column
+            # Rows are keyed by reservation ID
+            self.selected_reservation_id = selection[0]
 
     def search_reservations(self, event=None):
-        """Filter reservations based on search query"""
-        query = self.search_entry.get().lower()
+        """Filter reservations based on search query (debounced)"""
+        self.search.on_key(event)
 
-        if not query:
-            self.display_reservations()
-            return
-
-        filtered = [
-            r for r in self.reservations
-            if (query in r["id"].lower() or
-                query in r["name"].lower() or
-                query in r["checkin"].lower())
-        ]
-
-        self.display_reservations(filtered)
+    @staticmethod
+    def _reservation_matches(reservation, query):
+        """Whether a reservation matches a lower-cased search query"""
+        return (query in reservation.id.lower() or
+                query in reservation.name.lower() or
+                query in format_date(reservation.checkin).lower())
 
     def sort_treeview(self, column):
         """Sort the treeview by the given column"""
@@ -451,38 +510,14 @@ class HotelReservationsPage(ctk.CTkFrame):
             self.sort_column = column
             self.sort_descending = False
 
-        # Define sort key functions
-        if column == "checkin":
-            def sort_key(x):
-                try:
-                    return datetime.strptime(x[column], "%b %d, %Y")
-                except:
-                    return datetime.min
-        elif column == "amount":
-            def sort_key(x):
-                try:
-                    return float(x[column].replace("$", "").replace(",", ""))
-                except:
-                    return 0.0
-        else:
-            def sort_key(x):
-                return x[column].lower()
-
-        # Sort the reservations
-        sorted_reservations = sorted(
-            self.reservations,
-            key=sort_key,
-            reverse=self.sort_descending
-        )
-
-        # Display the sorted data
-        self.display_reservations(sorted_reservations)
+        # Orders are cached per column until the data changes
+        self.display_reservations(self.store.sorted(column, self.sort_descending))
 
     # Helper method to validate check-in date
     def validate_date(self, date_str):
         """Validate that a date is today or in the future"""
         try:
-            checkin_date = datetime.strptime(date_str, "%b %d, %Y").date()
+            checkin_date = parse_date(date_str)
             today = date.today()
 
             if checkin_date < today:
@@ -509,8 +544,8 @@ class HotelReservationsPage(ctk.CTkFrame):
         # Add today's date in placeholder for better guidance
         today_formatted = datetime.now().strftime("%b %d, %Y")
 
+        # The reservation ID is assigned by the server-side sequence on save
         fields = [
-            ("ID Number", "#", "id"),
             ("Guest Name", "Full name", "name"),
             ("Check-in Date", f"Format: {today_formatted} (today or future dates only)", "checkin"),
             ("Total Booking Amount", "$0.00", "amount")
@@ -559,7 +594,7 @@ class HotelReservationsPage(ctk.CTkFrame):
 
             # Validate amount
             try:
-                float(new_reservation["amount"].replace("$", "").replace(",", ""))
+                parse_amount(new_reservation["amount"])
             except ValueError as e:
                 messagebox.showerror("Error", f"Invalid amount format: {str(e)}")
                 return
@@ -570,15 +605,12 @@ class HotelReservationsPage(ctk.CTkFrame):
                 messagebox.showerror("Error", error_msg)
                 return
 
-            # Check for duplicate ID
-            if any(r["id"] == new_reservation["id"] for r in self.reservations):
-                messagebox.showerror("Error", "Reservation ID already exists")
-                return
-
-            if self.save_data(reservation_data=new_reservation):
+            def on_saved():
                 dialog.destroy()
                 messagebox.showinfo("Success", "Reservation added successfully")
 
+            self.save_data(reservation_data=new_reservation, on_saved=on_saved)
+
         ctk.CTkButton(
             button_frame,
             text="Save",
@@ -601,10 +633,7 @@ class HotelReservationsPage(ctk.CTkFrame):
             messagebox.showwarning("Warning", "Please select a reservation to edit")
             return
 
-        reservation = next(
-            (r for r in self.reservations if r["id"] == self.selected_reservation_id),
-            None
-        )
+        reservation = self.store.get(self.selected_reservation_id)
 
         if not reservation:
             messagebox.showerror("Error", "Selected reservation not found")
@@ -623,6 +652,7 @@ class HotelReservationsPage(ctk.CTkFrame):
         y = (dialog.winfo_screenheight() // 2) - (height // 2)
         dialog.geometry(f"{width}x{height}+{x}+{y}")
 
+        current_values = dict(zip(reservation._fields, reservation.display_values()))
         fields = [
             ("ID Number", "id", False),
             ("Guest Name", "name", True),
@@ -655,7 +685,7 @@ class HotelReservationsPage(ctk.CTkFrame):
                 border_width=1,
                 corner_radius=8
             )
-            entry.insert(0, reservation[key])
+            entry.insert(0, current_values[key])
             entry.configure(state="normal" if editable else "disabled")
             entry.pack(fill="x")
             entries[key] = entry
@@ -664,7 +694,7 @@ class HotelReservationsPage(ctk.CTkFrame):
         button_frame.pack(fill="x", padx=20, pady=20)
 
         def save():
-            updated_reservation = {'id': reservation['id']}
+            updated_reservation = {'id': reservation.id}
             for key, entry in entries.items():
                 if entry.cget("state") != "disabled":
                     value = entry.get().strip()
@@ -676,7 +706,7 @@ class HotelReservationsPage(ctk.CTkFrame):
             # Validate amount
             if "amount" in updated_reservation:
                 try:
-                    float(updated_reservation["amount"].replace("$", "").replace(",", ""))
+                    parse_amount(updated_reservation["amount"])
                 except ValueError as e:
                     messagebox.showerror("Error", f"Invalid amount format: {str(e)}")
                     return
@@ -688,10 +718,12 @@ class HotelReservationsPage(ctk.CTkFrame):
                     messagebox.showerror("Error", error_msg)
                     return
 
-            if self.save_data(reservation_data=updated_reservation):
+            def on_saved():
                 dialog.destroy()
                 messagebox.showinfo("Success", "Reservation updated successfully")
 
+            self.save_data(reservation_data=updated_reservation, on_saved=on_saved)
+
         ctk.CTkButton(
             button_frame,
             text="Save",
@@ -714,10 +746,7 @@ class HotelReservationsPage(ctk.CTkFrame):
             messagebox.showwarning("Warning", "Please select a reservation to delete")
             return
 
-        reservation = next(
-            (r for r in self.reservations if r["id"] == self.selected_reservation_id),
-            None
-        )
+        reservation = self.store.get(self.selected_reservation_id)
 
         if not reservation:
             messagebox.showerror("Error", "Selected reservation not found")
@@ -725,10 +754,12 @@ class HotelReservationsPage(ctk.CTkFrame):
 
         if not messagebox.askyesno(
                 "Confirm",
-                f"Are you sure you want to delete reservation {reservation['id']} for {reservation['name']}?"
+                f"Are you sure you want to delete reservation {reservation.id} for {reservation.name}?"
         ):
             return
 
-        if self.save_data(delete_id=self.selected_reservation_id):
+        def on_saved():
             self.selected_reservation_id = None
-            messagebox.showinfo("Success", "Reservation deleted successfully")
\ No newline at end of file
+            messagebox.showinfo("Success", "Reservation deleted successfully")
+
+        self.save_data(delete_id=self.selected_reservation_id, on_saved=on_saved)
\ No newline at end of file
@@ -0,0 +1,151 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (user_id, email, action, ip_address, user_agent)
+AuditEvent = Tuple[Optional[int], str, str, str, str]
+
+_STOP = object()
+
+
+class AuditLogWriter:
+    """Buffers audit events and writes them in batches on a background thread.
+
+    ``log`` never blocks: when the bounded queue is full the event is
+    dropped and counted. A batch is written when ``batch_size`` events are
+    waiting or ``flush_interval`` seconds after its first event, whichever
+    comes first. Pending events are flushed on ``close`` and at
+    interpreter exit.
+    """
+
+    def __init__(
+            self,
+            write_batch: Callable[[List[AuditEvent]], None],
+            max_queue: int = 10000,
+            batch_size: int = 200,
+            flush_interval: float = 1.0,
+    ):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counters = {
+            "queued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "flushes": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+            "max_lag_ms": 0.0,
+        }
+
+        self._thread = threading.Thread(target=self._run, name="audit-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ========== PRODUCERS ==========
+    def log(self, user_id: Optional[int], email: str, action: str,
+            ip_address: str = "127.0.0.1", user_agent: str = "Python App") -> bool:
+        """Queue one event; returns False if it was dropped"""
+        if self._closed:
+            self._count("dropped")
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), (user_id, email, action, ip_address, user_agent)))
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("queued")
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every event queued so far has been written (or failed)"""
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Audit log queue full at shutdown; pending events may be lost")
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._counters)
+        stats["pending"] = self._queue.qsize()
+        stats["avg_flush_ms"] = stats["total_flush_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        return stats
+
+    # ========== WRITER THREAD ==========
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is None or item is _STOP or isinstance(item, threading.Event):
+                self._write(batch)
+                batch, deadline = [], None
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch, deadline = [], None
+
+    def _write(self, batch) -> None:
+        if not batch:
+            return
+        started = time.monotonic()
+        try:
+            self.write_batch([event for _, event in batch])
+        except Exception as err:
+            logger.error(f"Failed to write {len(batch)} audit events: {err}")
+            self._count("failed", len(batch))
+            return
+
+        finished = time.monotonic()
+        flush_ms = (finished - started) * 1000
+        lag_ms = (finished - batch[0][0]) * 1000
+        with self._lock:
+            counters = self._counters
+            counters["written"] += len(batch)
+            counters["flushes"] += 1
+            counters["last_flush_ms"] = flush_ms
+            counters["max_flush_ms"] = max(counters["max_flush_ms"], flush_ms)
+            counters["total_flush_ms"] += flush_ms
+            counters["max_lag_ms"] = max(counters["max_lag_ms"], lag_ms)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
@@ -0,0 +1,134 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class AvailabilityIndex:
+    """Per-room sorted booking intervals for "what is free from X to Y" queries.
+
+    Each room keeps its bookings as parallel lists of start/end ordinals
+    sorted by start, with end exclusive (the checkout day is free for the
+    next guest). For a room without overlapping bookings a free check is
+    one bisect plus a comparison with the booking just before ``end``,
+    so a search costs O(rooms x log bookings-per-room) rather than a pass
+    over every reservation. Rooms whose data already holds overlapping
+    bookings fall back to checking the bookings that start before
+    ``end``.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.rooms: Dict[int, Dict] = {}
+        self._starts: Dict[int, List[int]] = {}
+        self._ends: Dict[int, List[int]] = {}
+        self._ids: Dict[int, List[str]] = {}
+        self._overlapping: set = set()
+        self._bookings: Dict[str, Tuple[int, int, int]] = {}
+
+    # ========== BUILDING ==========
+    def set_rooms(self, rooms: Iterable[Dict]) -> None:
+        """Register rooms: dicts with room_id, room_number, room_type (and anything else)"""
+        with self._lock:
+            for room in rooms:
+                room_id = room["room_id"]
+                self.rooms[room_id] = dict(room)
+                self._starts.setdefault(room_id, [])
+                self._ends.setdefault(room_id, [])
+                self._ids.setdefault(room_id, [])
+
+    def load(self, bookings: Iterable[Tuple[str, int, date, date]]) -> None:
+        """Bulk-load (reservation_id, room_id, checkin, checkout) rows.
+
+        Each call merges into what is already indexed, so a large result
+        can be loaded one fetched chunk at a time.
+        """
+        per_room: Dict[int, List[Tuple[int, int, str]]] = {}
+        for reservation_id, room_id, checkin, checkout in bookings:
+            per_room.setdefault(room_id, []).append((checkin.toordinal(), checkout.toordinal(), reservation_id))
+
+        with self._lock:
+            # A reloaded id replaces its earlier entry, wherever that was
+            for intervals in per_room.values():
+                for _, _, reservation_id in intervals:
+                    self.remove(reservation_id)
+
+            for room_id, intervals in per_room.items():
+                intervals.extend(zip(self._starts.get(room_id, ()), self._ends.get(room_id, ()),
+                                     self._ids.get(room_id, ())))
+                intervals.sort()
+                self._starts[room_id] = [start for start, _, _ in intervals]
+                self._ends[room_id] = [end for _, end, _ in intervals]
+                self._ids[room_id] = [reservation_id for _, _, reservation_id in intervals]
+                self._overlapping.discard(room_id)
+                for i in range(1, len(intervals)):
+                    if intervals[i][0] < intervals[i - 1][1]:
+                        self._overlapping.add(room_id)
+                        break
+                for start, end, reservation_id in intervals:
+                    self._bookings[reservation_id] = (room_id, start, end)
+
+    # ========== INCREMENTAL UPDATES ==========
+    def add(self, reservation_id: str, room_id: int, checkin: date, checkout: date) -> None:
+        """Insert or move one booking (replaces any earlier entry for the id)"""
+        with self._lock:
+            self.remove(reservation_id)
+            start, end = checkin.toordinal(), checkout.toordinal()
+            starts = self._starts.setdefault(room_id, [])
+            ends = self._ends.setdefault(room_id, [])
+            ids = self._ids.setdefault(room_id, [])
+
+            i = bisect_right(starts, start)
+            if (i > 0 and ends[i - 1] > start) or (i < len(starts) and starts[i] < end):
+                self._overlapping.add(room_id)
+            starts.insert(i, start)
+            ends.insert(i, end)
+            ids.insert(i, reservation_id)
+            self._bookings[reservation_id] = (room_id, start, end)
+
+    def remove(self, reservation_id: str) -> bool:
+        """Drop one booking; returns False if it was not indexed"""
+        with self._lock:
+            entry = self._bookings.pop(reservation_id, None)
+            if entry is None:
+                return False
+            room_id, start, _ = entry
+            starts, ids = self._starts[room_id], self._ids[room_id]
+            i = bisect_left(starts, start)
+            while ids[i] != reservation_id:
+                i += 1
+            del starts[i], self._ends[room_id][i], ids[i]
+            return True
+
+    # ========== QUERIES ==========
+    def is_free(self, room_id: int, checkin: date, checkout: date) -> bool:
+        return self._is_free(room_id, checkin.toordinal(), checkout.toordinal())
+
+    def _is_free(self, room_id: int, start: int, end: int) -> bool:
+        starts = self._starts.get(room_id, ())
+        # Bookings starting before ``end`` are the only candidates
+        i = bisect_left(starts, end)
+        if i == 0:
+            return True
+        ends = self._ends[room_id]
+        if room_id not in self._overlapping:
+            return ends[i - 1] <= start
+        return all(ends[j] <= start for j in range(i))
+
+    def find_available_rooms(self, checkin: date, checkout: date,
+                             room_type: Optional[str] = None) -> List[Dict]:
+        """Rooms (optionally of one type) with no booking overlapping [checkin, checkout)"""
+        if checkout <= checkin:
+            raise ValueError("checkout must be after checkin")
+        start, end = checkin.toordinal(), checkout.toordinal()
+        with self._lock:
+            return [
+                dict(room)
+                for room_id, room in self.rooms.items()
+                if (room_type is None or room.get("room_type") == room_type)
+                and room.get("status", "Available") == "Available"
+                and self._is_free(room_id, start, end)
+            ]
+
+    def __len__(self) -> int:
+        return len(self._bookings)
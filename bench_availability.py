@@ -0,0 +1,106 @@
+"""Room availability search: interval index vs a scan over every reservation.
+
+    python bench_availability.py [--rooms 500] [--reservations 1000000] [--queries 500]
+
+Runs in memory (no database): generates back-to-back stays per room over
+a few years, then times the same random date ranges against
+AvailabilityIndex.find_available_rooms and a linear scan.
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from availability import AvailabilityIndex
+
+ROOM_TYPES = ("Standard", "Deluxe", "Suite")
+
+
+def generate(rooms, reservations, seed=7):
+    """(rooms, bookings) with non-overlapping stays of 1-7 nights and 0-3 night gaps"""
+    rng = random.Random(seed)
+    room_rows = [
+        {"room_id": n, "room_number": f"{100 + n}", "room_type": ROOM_TYPES[n % len(ROOM_TYPES)],
+         "status": "Available"}
+        for n in range(rooms)
+    ]
+    per_room = reservations // rooms
+    start = date(2020, 1, 1)
+    bookings = []
+    for room in room_rows:
+        day = start + timedelta(days=rng.randint(0, 3))
+        for _ in range(per_room):
+            checkout = day + timedelta(days=rng.randint(1, 7))
+            bookings.append((f"RES{len(bookings):08d}", room["room_id"], day, checkout))
+            day = checkout + timedelta(days=rng.randint(0, 3))
+    return room_rows, bookings
+
+
+def linear_scan(rooms, bookings, checkin, checkout, room_type=None):
+    """What a search costs without the index: one pass over every booking"""
+    busy = {room_id for _, room_id, start, end in bookings if start < checkout and end > checkin}
+    return [
+        room for room in rooms
+        if room["room_id"] not in busy and (room_type is None or room["room_type"] == room_type)
+    ]
+
+
+def time_queries(search, queries):
+    timings = []
+    for checkin, checkout, room_type in queries:
+        started = time.perf_counter()
+        search(checkin, checkout, room_type)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--scan-queries", type=int, default=20,
+                        help="the linear scan is slow; time fewer queries for it")
+    args = parser.parse_args()
+
+    rooms, bookings = generate(args.rooms, args.reservations)
+    last_day = max(checkout for _, _, _, checkout in bookings)
+    span = (last_day - date(2020, 1, 1)).days
+
+    rng = random.Random(11)
+    queries = []
+    for _ in range(args.queries):
+        checkin = date(2020, 1, 1) + timedelta(days=rng.randint(0, span - 14))
+        queries.append((checkin, checkin + timedelta(days=rng.randint(1, 14)),
+                        rng.choice((None,) + ROOM_TYPES)))
+
+    started = time.perf_counter()
+    index = AvailabilityIndex()
+    index.set_rooms(rooms)
+    index.load(bookings)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{len(bookings):,} bookings over {len(rooms)} rooms; index built in {build_ms:.0f} ms")
+
+    for checkin, checkout, room_type in queries[:args.scan_queries]:
+        expected = {r["room_id"] for r in linear_scan(rooms, bookings, checkin, checkout, room_type)}
+        actual = {r["room_id"] for r in index.find_available_rooms(checkin, checkout, room_type)}
+        assert expected == actual, (checkin, checkout, room_type)
+
+    started = time.perf_counter()
+    for n in range(10_000):
+        reservation_id, room_id, checkin, checkout = bookings[n * 97 % len(bookings)]
+        index.add(reservation_id, room_id, checkin, checkout)
+    update_us = (time.perf_counter() - started) * 1e6 / 10_000
+
+    print(f"{'search':<8} {'queries':>8} {'p50 ms':>10} {'p99 ms':>10}")
+    p50, p99 = time_queries(index.find_available_rooms, queries)
+    print(f"{'index':<8} {len(queries):>8} {p50:>10.3f} {p99:>10.3f}")
+    p50, p99 = time_queries(lambda *q: linear_scan(rooms, bookings, *q), queries[:args.scan_queries])
+    print(f"{'scan':<8} {args.scan_queries:>8} {p50:>10.3f} {p99:>10.3f}")
+    print(f"index update (remove + insert): {update_us:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
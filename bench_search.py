@@ -0,0 +1,110 @@
+"""Compare customer search latency: leading-wildcard LIKE vs ngram FULLTEXT.
+
+Seeds a scratch database with generated customers (default 1,000,000),
+then times the same sample of type-ahead queries against both backends.
+
+    python bench_search.py --database hotel_bench [--rows 1000000] [--queries 200]
+
+Connection settings come from the usual DB_* variables; --database must
+name a scratch schema because rows are inserted into it.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+from generate_data import CHUNK_SIZE, chunked, customer_row
+
+
+def seed(db, rows):
+    """Top the customers table up to ``rows`` generated customers"""
+    with db.borrow() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM customers")
+            existing = cursor.fetchone()[0]
+    if existing >= rows:
+        print(f"Using {existing:,} existing customers")
+        return
+
+    print(f"Seeding {rows - existing:,} customers...")
+    started = time.perf_counter()
+    generated = (customer_row(n, "B") for n in range(existing, rows))
+    with db.borrow() as conn:
+        with conn.cursor() as cursor:
+            for batch in chunked(generated, CHUNK_SIZE):
+                cursor.executemany("""
+                    INSERT INTO customers
+                    (customer_id, full_name, email, address, phone, status, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """, batch)
+                conn.commit()
+    print(f"Seeded in {time.perf_counter() - started:.0f} s")
+
+
+def sample_queries(db, count):
+    """Type-ahead style queries: 3-6 character fragments of real rows"""
+    with db.borrow() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT full_name, email, phone FROM customers ORDER BY RAND() LIMIT %s", (count,)
+            )
+            rows = cursor.fetchall()
+
+    queries = []
+    for row in rows:
+        text = random.choice(row)
+        length = random.randint(3, 6)
+        start = random.randint(0, max(0, len(text) - length))
+        queries.append(text[start:start + length])
+    return queries
+
+
+def time_backend(search, queries):
+    """Latency in ms of each query, after one warm-up pass"""
+    for query in queries[:10]:
+        search(query)
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name, timings):
+    percentiles = statistics.quantiles(timings, n=100)
+    print(f"{name:<10} p50 {percentiles[49]:8.1f} ms   p99 {percentiles[98]:8.1f} ms   "
+          f"max {max(timings):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", required=True, help="scratch schema to seed and query")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    # db_helper reads DB_NAME when the pool is first created
+    os.environ["DB_NAME"] = args.database
+    import migrations
+    from db_helper import DatabaseManager, get_connection_pool, close_connection_pool
+
+    try:
+        with get_connection_pool().connection() as conn:
+            migrations.migrate(conn)
+        db = DatabaseManager()
+
+        seed(db, args.rows)
+        queries = sample_queries(db, args.queries)
+
+        print(f"\n{len(queries)} queries against {args.rows:,} customers")
+        report("LIKE", time_backend(db._search_customers_like, queries))
+        report("FULLTEXT", time_backend(db.search_customers, queries))
+    finally:
+        close_connection_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Render time and memory of the staff table: recycled rows vs one widget set per row.
+
+    python bench_staff_render.py [--sizes 100 10000 100000] [--legacy-max 10000]
+
+Needs a display (Tk). The per-row renderer reproduces the old
+StaffMemberScreen.populate_table; it is skipped above --legacy-max rows
+because building ~10 widgets per row for 100k rows takes many minutes.
+"""
+import argparse
+import time
+import tracemalloc
+
+import customtkinter as ctk
+
+from staff_member import STAFF_FIELDS, StaffRow
+from virtual_views import RecycledRowList
+
+
+def generate_staff(count):
+    return [
+        {
+            "staff_id": f"STF{n:06d}",
+            "full_name": f"Staff Member {n}",
+            "email": f"staff{n}@hotel.example",
+            "phone": f"+1-555-{n % 10000:04d}",
+            "address": f"{n} Harbour Road",
+            "status": "Active" if n % 3 else "Inactive",
+        }
+        for n in range(count)
+    ]
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def render_per_row(parent, staff_members):
+    """The old populate_table: a frame, labels, badge and two buttons per row"""
+    for staff in staff_members:
+        row_frame = ctk.CTkFrame(parent, fg_color="white")
+        row_frame.pack(fill="x", pady=5)
+        for col, field in enumerate(STAFF_FIELDS):
+            if field == "status":
+                status_frame = ctk.CTkFrame(row_frame, corner_radius=12, width=80, height=25,
+                                            fg_color="#10b981" if staff[field] == "Active" else "#ef4444")
+                status_frame.grid(row=0, column=col, padx=5, sticky="w")
+                ctk.CTkLabel(status_frame, text=staff[field]).place(relx=0.5, rely=0.5, anchor="center")
+            else:
+                ctk.CTkLabel(row_frame, text=staff[field]).grid(row=0, column=col, padx=5, sticky="w")
+        action_frame = ctk.CTkFrame(row_frame, fg_color="white")
+        action_frame.grid(row=0, column=6, padx=5, sticky="e")
+        ctk.CTkButton(action_frame, text="Edit", width=60, height=25).pack(side="left", padx=2)
+        ctk.CTkButton(action_frame, text="Delete", width=60, height=25).pack(side="left", padx=2)
+
+
+def measure(root, render):
+    """Run ``render(parent)`` in a fresh frame; return (ms, peak Python KiB, widgets)"""
+    parent = ctk.CTkFrame(root, width=1200, height=700)
+    parent.pack(fill="both", expand=True)
+    parent.pack_propagate(False)
+    root.update()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    render(parent)
+    root.update_idletasks()
+    elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    widgets = count_widgets(parent)
+    parent.destroy()
+    root.update()
+    return elapsed, peak / 1024, widgets
+
+
+def ignore(staff):
+    pass
+
+
+def render_recycled(staff_members):
+    def render(parent):
+        body = ctk.CTkFrame(parent, fg_color="white")
+        body.pack(side="left", fill="both", expand=True)
+        scrollbar = ctk.CTkScrollbar(parent, orientation="vertical")
+        scrollbar.pack(side="right", fill="y")
+        parent.update_idletasks()
+        rows = RecycledRowList(body, scrollbar, create_row=StaffRow,
+                               bind_row=lambda row, staff: row.bind(staff, ignore, ignore))
+        rows.set_items(staff_members)
+    return render
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    root = ctk.CTk()
+    root.geometry("1250x750")
+
+    print(f"{'rows':>8} {'renderer':<10} {'time ms':>10} {'peak KiB':>10} {'widgets':>8}")
+    for size in args.sizes:
+        staff_members = generate_staff(size)
+        results = [("recycled", measure(root, render_recycled(staff_members)))]
+        if size <= args.legacy_max:
+            results.append(("per-row", measure(root, lambda p: render_per_row(p, staff_members))))
+        for name, (elapsed, peak, widgets) in results:
+            print(f"{size:>8} {name:<10} {elapsed:>10.1f} {peak:>10.0f} {widgets:>8}")
+        if size > args.legacy_max:
+            print(f"{size:>8} {'per-row':<10} {'skipped':>10}")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
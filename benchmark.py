@@ -0,0 +1,295 @@
+"""Performance benchmark suite for DatabaseManager.
+
+Starts a throwaway MySQL 8 container (or uses an existing server), seeds
+it at each scale factor with generate_data, times the public
+DatabaseManager methods and writes the results as JSON. With a baseline
+file present the run fails (exit 1) when a method's p50 regresses past
+--threshold.
+
+    python benchmark.py                              # docker mysql:8.0, scales 0.01 0.1
+    python benchmark.py --server existing --database hotel_bench
+    python benchmark.py --update-baseline            # record bench_baseline.json
+
+MySQL rather than MariaDB: the search indexes use the ngram FULLTEXT
+parser, which MariaDB does not ship. The benchmark database is dropped and
+recreated for every scale, so never point --database at real data.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import migrations
+import db_helper
+from db_helper import DatabaseManager, _create_connection, close_connection_pool
+from generate_data import generate
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_OUTPUT = "bench_results.json"
+
+
+# ========== BENCHMARK CASES ==========
+# (name, setup, call): setup(db, i) runs untimed before each timed call(db, i)
+def _customer(i):
+    return {
+        "customer_id": f"BX{i:08d}",
+        "full_name": f"Bench Customer {i}",
+        "email": f"bench.customer{i}@example.com",
+        "address": f"{i} Bench Street",
+        "phone": f"+1-555-{i % 10000:04d}",
+        "status": "Active",
+    }
+
+
+def _reservation(i):
+    return {
+        "reservation_id": f"BXR{i:08d}",
+        "guest_name": f"Bench Guest {i}",
+        "checkin_date": date.today(),
+        "booking_amount": 120.0,
+    }
+
+
+def _staff(i):
+    return {
+        "staff_id": f"BXS{i:08d}",
+        "full_name": f"Bench Staff {i}",
+        "email": f"bench.staff{i}@example.com",
+        "phone": "+1-555-0100",
+        "address": "1 Bench Street",
+        "status": "Active",
+        "password": "x" * 64,
+    }
+
+
+def build_cases(ctx):
+    """Cases run in order, so CRUD cases can build on the previous case's rows"""
+    user_id = ctx["user_id"]
+    return [
+        # Reads
+        ("get_customers_page", None, lambda db, i: db.get_customers_page(None, 100)),
+        ("get_customers_page_deep", None,
+         lambda db, i: db.get_customers_page(("M", ""), 100, "active")),
+        ("get_customers", None, lambda db, i: db.get_customers("all")),
+        ("search_customers", None, lambda db, i: db.search_customers(ctx["customer_query"])),
+        ("search_customers_like", None, lambda db, i: db._search_customers_like(ctx["customer_query"])),
+        ("get_staff_members", None, lambda db, i: db.get_staff_members("all")),
+        ("search_staff_members", None, lambda db, i: db.search_staff_members(ctx["staff_query"])),
+        ("get_dashboard_snapshot", lambda db, i: db.invalidate_dashboard_cache(),
+         lambda db, i: db.get_dashboard_snapshot()),
+        ("get_dashboard_snapshot_cached", None, lambda db, i: db.get_dashboard_snapshot()),
+        ("get_recent_customers", None, lambda db, i: db.get_recent_customers(5)),
+        ("refresh_monthly_metrics", None, lambda db, i: db.refresh_monthly_metrics(force=True)),
+        ("get_report_bundle", None, lambda db, i: db.get_report_bundle(6)),
+        ("get_customer_growth", None, lambda db, i: db.get_customer_growth(6)),
+        ("get_revenue_trends", None, lambda db, i: db.get_revenue_trends(6)),
+        ("get_booking_trends", None, lambda db, i: db.get_booking_trends(6)),
+        ("get_reservations", None, lambda db, i: db.get_reservations(user_id)),
+        # Writes
+        ("add_customer", None, lambda db, i: db.add_customer(_customer(i))),
+        ("update_customer", None,
+         lambda db, i: db.update_customer(f"BX{i:08d}", dict(_customer(i), status="Inactive"))),
+        ("delete_customer", None, lambda db, i: db.delete_customer(f"BX{i:08d}")),
+        ("add_reservation", None, lambda db, i: db.add_reservation(user_id, _reservation(i))),
+        ("update_reservation", None,
+         lambda db, i: db.update_reservation(user_id, f"BXR{i:08d}", dict(_reservation(i), booking_amount=150.0))),
+        ("delete_reservation", None, lambda db, i: db.delete_reservation(user_id, f"BXR{i:08d}")),
+        ("add_staff_member", None, lambda db, i: db.add_staff_member(_staff(i))),
+        ("update_staff_member", None,
+         lambda db, i: db.update_staff_member(f"BXS{i:08d}", {"full_name": f"Bench Staff {i}b"})),
+        ("delete_staff_member", None, lambda db, i: db.delete_staff_member(f"BXS{i:08d}")),
+        # Auth
+        ("register_user", None,
+         lambda db, i: db.register_user(f"Bench User {i}", f"bench.user{i}@example.com", "Passw0rd!", "Other")),
+        ("authenticate_user", None,
+         lambda db, i: db.authenticate_user(f"bench.user{i}@example.com", "Passw0rd!")),
+        ("create_session", None,
+         lambda db, i: db.create_session(ctx["bench_user_id"], f"bench-session-{i}", "127.0.0.1", "bench",
+                                         ctx["session_expiry"])),
+        ("verify_session", None, lambda db, i: db.verify_session(f"bench-session-{i}")),
+    ]
+
+
+def time_case(db, setup, call, warmup, repeat):
+    timings = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup(db, i)
+        started = time.perf_counter()
+        call(db, i)
+        elapsed = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            timings.append(elapsed)
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(statistics.quantiles(timings, n=20)[18], 3) if len(timings) > 1 else round(timings[0], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "runs": len(timings),
+    }
+
+
+# ========== SERVER / DATA SETUP ==========
+def start_docker_mysql(image, port):
+    """Run a throwaway MySQL container and point the DB_* variables at it"""
+    name = f"hotel-bench-{os.getpid()}"
+    subprocess.run(
+        ["docker", "run", "-d", "--rm", "--name", name,
+         "-e", "MYSQL_ROOT_PASSWORD=bench", "-p", f"{port}:3306",
+         image, "--local-infile=1"],
+        check=True, capture_output=True
+    )
+    os.environ.update(DB_HOST="127.0.0.1", DB_PORT=str(port), DB_USER="root", DB_PASSWORD="bench")
+
+    deadline = time.monotonic() + 180
+    while True:
+        try:
+            _create_connection(database=None).close()
+            return name
+        except RuntimeError:
+            if time.monotonic() > deadline:
+                stop_docker_mysql(name)
+                raise RuntimeError("MySQL container did not become ready in time")
+            time.sleep(3)
+
+
+def stop_docker_mysql(name):
+    subprocess.run(["docker", "stop", name], capture_output=True)
+
+
+def prepare_database(database, scale):
+    """Recreate ``database``, migrate it and seed it at ``scale``"""
+    close_connection_pool()
+    conn = _create_connection(database=None)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+            cursor.execute(f"CREATE DATABASE `{database}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+    finally:
+        conn.close()
+
+    os.environ["DB_NAME"] = database
+    with db_helper.get_connection_pool().connection() as conn:
+        migrations.migrate(conn)
+
+    conn = _create_connection()
+    try:
+        generate(conn, scale, prefix="G")
+    finally:
+        conn.close()
+
+    db = DatabaseManager()
+    db.rebuild_monthly_metrics()
+    return db
+
+
+def bench_context(db):
+    """Fixtures shared by the cases: owner user, search terms, a session user"""
+    with db.borrow() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT user_id FROM users ORDER BY user_id LIMIT 1")
+            user_id = cursor.fetchone()[0]
+    db.register_user("Bench Session", "bench.session@example.com", "Passw0rd!", "Other")
+    session_user = db.authenticate_user("bench.session@example.com", "Passw0rd!")
+    return {
+        "user_id": user_id,
+        "bench_user_id": session_user["user_id"],
+        "customer_query": "Okafor",
+        "staff_query": "Mensah",
+        "session_expiry": (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+# ========== BASELINE ==========
+def compare(results, baseline, threshold, min_delta_ms):
+    """Return (scale, method, baseline p50, current p50) for every regression"""
+    regressions = []
+    for scale, methods in results.items():
+        for method, current in methods.items():
+            previous = baseline.get(scale, {}).get(method)
+            if previous is None:
+                continue
+            if (current["p50_ms"] > previous["p50_ms"] * threshold
+                    and current["p50_ms"] - previous["p50_ms"] > min_delta_ms):
+                regressions.append((scale, method, previous["p50_ms"], current["p50_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", choices=["docker", "existing"], default="docker")
+    parser.add_argument("--image", default="mysql:8.0")
+    parser.add_argument("--port", type=int, default=33306)
+    parser.add_argument("--database", default="hotel_bench", help="scratch schema (dropped and recreated)")
+    parser.add_argument("--scales", type=float, nargs="+", default=[0.01, 0.1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed p50 ratio over baseline")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ignore regressions smaller than this")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if args.server == "existing" and args.database == os.getenv("DB_NAME"):
+        parser.error("--database is dropped and recreated; it must not be the application database")
+
+    container = start_docker_mysql(args.image, args.port) if args.server == "docker" else None
+    results = {}
+    try:
+        for scale in args.scales:
+            print(f"\n=== scale {scale} ===")
+            db = prepare_database(args.database, scale)
+            ctx = bench_context(db)
+            results[str(scale)] = {}
+            for name, setup, call in build_cases(ctx):
+                stats = time_case(db, setup, call, args.warmup, args.repeat)
+                results[str(scale)][name] = stats
+                print(f"{name:<32} p50 {stats['p50_ms']:9.2f} ms   p95 {stats['p95_ms']:9.2f} ms")
+    finally:
+        close_connection_pool()
+        if container:
+            stop_docker_mysql(container)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "server": args.image if container else "existing",
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "schema_version": migrations.LATEST_VERSION,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    for scale, method, before, after in regressions:
+        print(f"❌ scale {scale} {method}: p50 {before:.2f} ms -> {after:.2f} ms")
+    if regressions:
+        return 1
+    print("✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import os
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
+
+import customtkinter as ctk
+from PIL import Image, ImageFilter, ImageOps
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.getenv("BG_CACHE_DIR", os.path.join(tempfile.gettempdir(), "hotel_bg_cache"))
+
+# Wait this long after the last <Configure> before rendering a new size
+RESIZE_DEBOUNCE_MS = 150
+
+
+class BackgroundAssetService:
+    """Decodes, scales and blurs background images on worker threads.
+
+    Results are cached on disk keyed by (source hash, size, blur radius),
+    so after the first run a background costs one JPEG decode. The last
+    few images also stay in memory for screens that share a size. Finished
+    images are handed back through the DB executor's Tk queue.
+    """
+
+    def __init__(self, executor, cache_dir: str = CACHE_DIR, max_workers: int = 2, memory_items: int = 8):
+        self.executor = executor
+        self.cache_dir = cache_dir
+        self.memory_items = memory_items
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bg-assets")
+        self._memory: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+        self._source_hashes: Dict[Tuple, str] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ========== PUBLIC API ==========
+    def attach(self, owner, label, path: str, radius: float = 5) -> bool:
+        """Keep ``label``'s image covering ``owner``, re-rendered when it is resized.
+
+        Returns False (and does nothing) if the image file is missing.
+        """
+        path = path if os.path.isabs(path) else os.path.join(ASSET_DIR, path)
+        if not os.path.exists(path):
+            logger.warning(f"Background image not found: {path}")
+            return False
+
+        state = {"size": None, "job": None}
+
+        def on_configure(event=None):
+            if state["job"] is not None:
+                owner.after_cancel(state["job"])
+            state["job"] = owner.after(RESIZE_DEBOUNCE_MS, render)
+
+        def render():
+            state["job"] = None
+            size = (owner.winfo_width(), owner.winfo_height())
+            if size[0] <= 1 or size[1] <= 1 or size == state["size"]:
+                return
+            state["size"] = size
+            self.request(path, size, radius, lambda image: show(image, size))
+
+        def show(image, size):
+            # A newer size was requested while this one rendered
+            if size != state["size"] or not label.winfo_exists():
+                return
+            scaling = ctk.ScalingTracker.get_widget_scaling(label)
+            label.bg_image = ctk.CTkImage(
+                light_image=image,
+                dark_image=image,
+                size=(round(size[0] / scaling), round(size[1] / scaling))
+            )
+            label.configure(image=label.bg_image)
+
+        owner.bind("<Configure>", on_configure, add="+")
+        on_configure()
+        return True
+
+    def request(self, path: str, size: Tuple[int, int], radius: float,
+                callback: Callable[[Image.Image], None]) -> None:
+        """Render ``path`` at ``size`` off the Tk thread and call ``callback(image)`` on it"""
+        def work():
+            try:
+                image = self.render(path, size, radius)
+            except Exception as e:
+                logger.error(f"Error rendering background {path}: {e}")
+                return
+            self.executor.run_on_ui(callback, image)
+
+        self._pool.submit(work)
+
+    def render(self, path: str, size: Tuple[int, int], radius: float) -> Image.Image:
+        """Scaled, cropped and blurred image (memory cache, then disk, then source)"""
+        key = (self._source_hash(path), size, radius)
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                return image
+
+        cache_path = os.path.join(self.cache_dir, f"{key[0][:16]}_{size[0]}x{size[1]}_r{radius:g}.jpg")
+        if os.path.exists(cache_path):
+            image = Image.open(cache_path)
+            image.load()
+        else:
+            image = self._process(path, size, radius)
+            temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            image.save(temp_path, "JPEG", quality=90)
+            os.replace(temp_path, cache_path)
+
+        with self._lock:
+            self._memory[key] = image
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+        return image
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ========== PROCESSING ==========
+    @staticmethod
+    def _process(path: str, size: Tuple[int, int], radius: float) -> Image.Image:
+        image = Image.open(path)
+        # Let the JPEG decoder downscale by 1/2..1/8 when the target is smaller
+        image.draft("RGB", size)
+        image = ImageOps.fit(image.convert("RGB"), size, Image.LANCZOS)
+        if radius:
+            image = image.filter(ImageFilter.GaussianBlur(radius=radius))
+        return image
+
+    def _source_hash(self, path: str) -> str:
+        """SHA-1 of the source file, re-read only when its mtime or size changes"""
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._source_hashes.get(stamp)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            with self._lock:
+                self._source_hashes[stamp] = digest
+        return digest
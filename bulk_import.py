@@ -0,0 +1,497 @@
+"""Streaming bulk import of customers, reservations and transactions.
+
+    python bulk_import.py customers customers.csv [--chunk 5000] [--workers 4]
+    python bulk_import.py reservations bookings.jsonl --user-email owner@example.com
+
+Files are CSV with a header row or JSON Lines (chosen by extension, or
+--format). Records are read lazily, validated in a process pool and
+upserted one chunk per transaction with multi-row statements, so memory
+stays flat whatever the file size: at most ``workers * 2`` chunks are in
+flight. Rows that fail validation or the database go to a side file
+(default ``<file>.rejects.jsonl``) with their line number and reason.
+Missing reservation and customer IDs are allocated from id_sequences.
+Customers and transactions without an ID are first matched against
+existing rows (by email, or by customer, reservation, amount and date), so
+importing a file twice updates rows instead of duplicating them. Rows that
+would overwrite another customer's email or another user's reservation
+are rejected.
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from reservation_model import parse_amount, parse_date
+
+CHUNK_SIZE = 5000
+PROGRESS_INTERVAL = 0.5  # seconds between progress callbacks
+
+# (line number, raw JSONL line or CSV field list) as read from the file
+Record = Tuple[int, Any]
+
+
+# ========== VALIDATION ==========
+def _text(record, field, max_length, required=True, default=None) -> Optional[str]:
+    value = record.get(field)
+    value = "" if value is None else str(value).strip()
+    if not value:
+        if required:
+            raise ValueError(f"{field} is required")
+        return default
+    if len(value) > max_length:
+        raise ValueError(f"{field} is longer than {max_length} characters")
+    return value
+
+
+def _choice(record, field, choices, default) -> str:
+    value = _text(record, field, 20, required=False, default=default)
+    if value not in choices:
+        raise ValueError(f"{field} must be one of {', '.join(choices)}")
+    return value
+
+
+def _date(record, field, required=True) -> Optional[date]:
+    value = _text(record, field, 30, required=required)
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return parse_date(value)
+    except ValueError:
+        raise ValueError(f"{field} is not a date (YYYY-MM-DD)")
+
+
+def validate_customer(record: Dict, context: Dict) -> Tuple:
+    email = _text(record, "email", 100)
+    if "@" not in email:
+        raise ValueError("email is not an email address")
+    return (
+        _text(record, "customer_id", 20, required=False),
+        _text(record, "full_name", 100),
+        email,
+        _text(record, "address", 1000),
+        _text(record, "phone", 20),
+        _choice(record, "status", ("Active", "Inactive"), "Active"),
+    )
+
+
+def validate_reservation(record: Dict, context: Dict) -> Tuple:
+    checkin = _date(record, "checkin_date")
+    checkout = _date(record, "checkout_date", required=False) or checkin + timedelta(days=1)
+    if checkout <= checkin:
+        raise ValueError("checkout_date must be after checkin_date")
+    return (
+        _text(record, "reservation_id", 20, required=False),
+        context["user_id"],
+        _text(record, "guest_name", 100),
+        checkin,
+        checkout,
+        parse_amount(_text(record, "booking_amount", 20)),
+        _choice(record, "payment_status", ("Paid", "Pending", "Cancelled"), "Pending"),
+        _choice(record, "fulfillment_status", ("Confirmed", "Pending", "Cancelled"), "Pending"),
+    )
+
+
+def validate_transaction(record: Dict, context: Dict) -> Tuple:
+    transaction_id = _text(record, "transaction_id", 20, required=False)
+    if transaction_id is not None and not transaction_id.isdigit():
+        raise ValueError("transaction_id must be a whole number")
+    when = _text(record, "transaction_date", 30, required=False)
+    if transaction_id is None and when is None:
+        # Without either there is nothing to recognise the row by on re-import
+        raise ValueError("transaction_date is required without a transaction_id")
+    try:
+        # Explicit NULL would not pick up the column's CURRENT_TIMESTAMP default
+        transaction_date = datetime.fromisoformat(when) if when else context["now"]
+    except ValueError:
+        raise ValueError("transaction_date is not an ISO date/time")
+    customer_id = _text(record, "customer_id", 20, required=False)
+    reservation_id = _text(record, "reservation_id", 20, required=False)
+    if customer_id is None and reservation_id is None:
+        raise ValueError("customer_id or reservation_id is required")
+    return (
+        int(transaction_id) if transaction_id else None,
+        customer_id,
+        reservation_id,
+        parse_amount(_text(record, "amount", 20)),
+        transaction_date,
+    )
+
+
+class ImportSpec(NamedTuple):
+    table: str
+    columns: Tuple[str, ...]
+    validate: Callable[[Dict, Dict], Tuple]
+    key_columns: Tuple[str, ...]
+    # ID sequence used when the first column is empty
+    sequence: Optional[str] = None
+    # Columns identifying an existing row; a row without an ID takes its ID
+    match_columns: Tuple[str, ...] = ()
+    # match_columns are a unique key: a row with a different ID is rejected
+    # rather than silently updating the existing row
+    match_unique: bool = False
+    # Rows whose ID already exists under another owner are rejected
+    owner_column: Optional[str] = None
+
+
+IMPORT_SPECS: Dict[str, ImportSpec] = {
+    "customers": ImportSpec(
+        "customers",
+        ("customer_id", "full_name", "email", "address", "phone", "status"),
+        validate_customer, ("customer_id",), "customers",
+        match_columns=("email",), match_unique=True),
+    "reservations": ImportSpec(
+        "reservations",
+        ("reservation_id", "user_id", "guest_name", "checkin_date", "checkout_date",
+         "booking_amount", "payment_status", "fulfillment_status"),
+        validate_reservation, ("reservation_id", "user_id"), "reservations",
+        owner_column="user_id"),
+    "transactions": ImportSpec(
+        "transactions",
+        ("transaction_id", "customer_id", "reservation_id", "amount", "transaction_date"),
+        validate_transaction, ("transaction_id",),
+        match_columns=("customer_id", "reservation_id", "amount", "transaction_date")),
+}
+
+
+# Columns with a binary collation; every other string column compares
+# case-insensitively (utf8mb4_unicode_ci)
+CASE_SENSITIVE_COLUMNS = frozenset({"email"})
+
+
+def _fold(columns: Tuple[str, ...], key: Tuple) -> Tuple:
+    """``key`` (values of ``columns``) normalized to compare like the database does"""
+    return tuple(
+        value.casefold() if isinstance(value, str) and column not in CASE_SENSITIVE_COLUMNS else value
+        for column, value in zip(columns, key)
+    )
+
+
+def decode_record(fmt: str, header: Optional[List[str]], raw) -> Dict[str, Any]:
+    """A raw JSONL line or CSV field list as a dict; raises ValueError"""
+    if fmt == "jsonl":
+        record = json.loads(raw)
+        if not isinstance(record, dict):
+            raise ValueError("not a JSON object")
+        return record
+    return dict(zip(header, raw))
+
+
+def validate_chunk(kind: str, context: Dict, fmt: str, header: Optional[List[str]], chunk: List[Record]):
+    """Worker: decode and validate one chunk.
+
+    Returns (valid rows as (line, tuple), rejects as (line, record, reason)).
+    Decoding happens here rather than in the reader so the importing
+    process only ships raw lines to the pool.
+    """
+    validate = IMPORT_SPECS[kind].validate
+    rows, rejects = [], []
+    for line, raw in chunk:
+        try:
+            record = decode_record(fmt, header, raw)
+        except ValueError as err:
+            rejects.append((line, {"_raw": raw.rstrip("\n")}, f"invalid {fmt.upper()}: {err}"))
+            continue
+        try:
+            rows.append((line, validate(record, context)))
+        except (ValueError, TypeError, AttributeError) as err:
+            rejects.append((line, record, str(err)))
+    return rows, rejects
+
+
+# ========== READING ==========
+def detect_format(path: str) -> str:
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def read_raw(path: str, fmt: str, progress: List[int]) -> Iterator[Record]:
+    """Yield (line number, raw record) lazily; ``progress[0]`` tracks bytes read.
+
+    JSONL records are the undecoded line; CSV records are field lists, the
+    first one being the header.
+    """
+    with open(path, "rb") as f:
+        def lines():
+            encoding = "utf-8-sig"  # Drop a BOM on the first line only
+            for raw in f:
+                progress[0] += len(raw)
+                yield raw.decode(encoding)
+                encoding = "utf-8"
+
+        if fmt == "jsonl":
+            for line, text in enumerate(lines(), start=1):
+                if text.strip():
+                    yield line, text
+        else:
+            reader = csv.reader(lines())
+            for fields in reader:
+                # line_num is the last physical line of the record
+                yield reader.line_num, fields
+
+
+def chunked(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ========== PIPELINE ==========
+def default_workers() -> int:
+    """One validation process per spare CPU (none on a single CPU), at most 4"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    return max(0, min(4, cpus - 1))
+
+
+class ImportProgress(NamedTuple):
+    read: int
+    written: int
+    rejected: int
+    bytes_read: int
+    bytes_total: int
+    elapsed: float
+    done: bool = False
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.written / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def fraction(self) -> float:
+        return self.bytes_read / self.bytes_total if self.bytes_total else 1.0
+
+
+class BulkImporter:
+    """Runs one import: read -> validate (process pool) -> upsert -> rejects file.
+
+    ``db`` needs ``import_rows``, ``find_existing``, ``next_id`` and
+    ``invalidate_caches`` (DatabaseManager). ``on_progress(ImportProgress)`` is called from the
+    importing thread at most every PROGRESS_INTERVAL seconds and once at the
+    end. ``workers=0`` validates inline, which beats shipping chunks to a
+    pool when there is no spare CPU.
+    """
+
+    def __init__(self, db, kind: str, context: Optional[Dict] = None, chunk_size: int = CHUNK_SIZE,
+                 workers: Optional[int] = None,
+                 on_progress: Optional[Callable[[ImportProgress], None]] = None):
+        if kind not in IMPORT_SPECS:
+            raise ValueError(f"Unknown import kind: {kind}")
+        self.db = db
+        self.kind = kind
+        self.spec = IMPORT_SPECS[kind]
+        self.context = dict(context or {}, now=datetime.now())
+        if kind == "reservations" and "user_id" not in self.context:
+            raise ValueError("Reservation imports need context['user_id']")
+        self.chunk_size = chunk_size
+        self.workers = default_workers() if workers is None else workers
+        self.on_progress = on_progress
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop after the chunk being written (committed chunks stay)"""
+        self.cancelled = True
+
+    def run(self, path: str, fmt: Optional[str] = None, rejects_path: Optional[str] = None) -> ImportProgress:
+        fmt = fmt or detect_format(path)
+        rejects_path = rejects_path or f"{path}.rejects.jsonl"
+        self._bytes = [0]
+        self._bytes_total = os.path.getsize(path)
+        self._counts = {"read": 0, "written": 0, "rejected": 0}
+        self._started = time.perf_counter()
+        self._reported = 0.0
+
+        records = read_raw(path, fmt, self._bytes)
+        header = [name.strip() for name in next(records, (0, []))[1]] if fmt == "csv" else None
+        self._job = (self.kind, self.context, fmt, header)
+        chunks = chunked(records, self.chunk_size)
+        try:
+            with open(rejects_path, "w", encoding="utf-8") as rejects:
+                if self.workers > 0:
+                    # spawn: forking a process that is running Tk is unsafe
+                    context = multiprocessing.get_context("spawn")
+                    with ProcessPoolExecutor(self.workers, mp_context=context) as pool:
+                        self._pipeline(chunks, pool, rejects)
+                else:
+                    for chunk in chunks:
+                        self._counts["read"] += len(chunk)
+                        self._write(*validate_chunk(*self._job, chunk), rejects)
+                        if self.cancelled:
+                            break
+        finally:
+            records.close()  # Closes the input file if we stopped early
+
+        if self._counts["written"]:
+            self.db.invalidate_caches()
+        if not self._counts["rejected"]:
+            os.remove(rejects_path)
+        return self._report(done=True)
+
+    def _pipeline(self, chunks, pool, rejects) -> None:
+        """Keep up to workers * 2 chunks validating; write results in file order"""
+        in_flight = deque()
+        for chunk in chunks:
+            self._counts["read"] += len(chunk)
+            in_flight.append(pool.submit(validate_chunk, *self._job, chunk))
+            if len(in_flight) >= self.workers * 2:
+                self._write(*in_flight.popleft().result(), rejects)
+            if self.cancelled:
+                break
+        while in_flight:
+            future = in_flight.popleft()
+            if self.cancelled:
+                future.cancel()
+            else:
+                self._write(*future.result(), rejects)
+
+    def _write(self, rows, rejected, rejects) -> None:
+        for line, record, reason in rejected:
+            self._reject(rejects, line, record, reason)
+
+        if rows:
+            rows = self._resolve_ids(rows, rejects)
+        if rows:
+            failures = self.db.import_rows(self.spec.table, self.spec.columns, [row for _, row in rows],
+                                           self.spec.key_columns, owner_column=self.spec.owner_column)
+            for index, reason in failures:
+                self._reject_row(rejects, *rows[index], reason)
+            self._counts["written"] += len(rows) - len(failures)
+
+        if time.perf_counter() - self._reported >= PROGRESS_INTERVAL:
+            self._report()
+
+    def _resolve_ids(self, rows, rejects):
+        """Fill in missing IDs (an existing row's, else a new one) and reject
+        rows that would overwrite a row that is not theirs"""
+        spec = self.spec
+        id_column = spec.columns[0]
+
+        owners = {}
+        if spec.owner_column:
+            owner_at = spec.columns.index(spec.owner_column)
+            owners = self._lookup((id_column,), [(row[0],) for _, row in rows if row[0]], (spec.owner_column,))
+        matches = {}
+        if spec.match_columns:
+            match_at = [spec.columns.index(c) for c in spec.match_columns]
+            keys = [tuple(row[i] for i in match_at) for _, row in rows if spec.match_unique or not row[0]]
+            matches = self._lookup(spec.match_columns, keys, (id_column,))
+        if owners is None or matches is None:
+            for line, row in rows:
+                self._reject_row(rejects, line, row, "could not check for existing rows")
+            return []
+
+        resolved = []
+        for line, row in rows:
+            if row[0] and spec.owner_column:
+                owned = owners.get(_fold((id_column,), (row[0],)))
+                if owned is not None and owned[spec.owner_column] != row[owner_at]:
+                    self._reject_row(rejects, line, row, f"{id_column} {row[0]} belongs to another user")
+                    continue
+            key = existing = None
+            if spec.match_columns:
+                key = _fold(spec.match_columns, tuple(row[i] for i in match_at))
+                existing = matches.get(key, {}).get(id_column)
+            if not row[0]:
+                new_id = existing or (self.db.next_id(spec.sequence) if spec.sequence else None)
+                row = (new_id,) + row[1:]
+            elif spec.match_unique and existing is not None and _fold((id_column,), (existing,)) != _fold((id_column,), (row[0],)):
+                self._reject_row(rejects, line, row,
+                                 f"{', '.join(spec.match_columns)} already used by {id_column} {existing}")
+                continue
+            if key is not None and row[0] is not None:
+                # Later rows in this chunk match it too
+                matches.setdefault(key, {id_column: row[0]})
+            resolved.append((line, row))
+        return resolved
+
+    def _lookup(self, match_columns, keys, columns):
+        """{folded key: existing row} for ``keys``, or None if the lookup failed"""
+        if not keys:
+            return {}
+        found = self.db.find_existing(self.spec.table, match_columns, keys, columns)
+        if found is None:
+            return None
+        return {_fold(match_columns, tuple(row[c] for c in match_columns)): row for row in found}
+
+    def _reject_row(self, rejects, line, row, reason) -> None:
+        self._reject(rejects, line, dict(zip(self.spec.columns, map(str, row))), reason)
+
+    def _reject(self, rejects, line, record, reason) -> None:
+        rejects.write(json.dumps({"line": line, "error": reason, "record": record}, default=str))
+        rejects.write("\n")
+        self._counts["rejected"] += 1
+
+    def _report(self, done: bool = False) -> ImportProgress:
+        self._reported = time.perf_counter()
+        progress = ImportProgress(
+            self._counts["read"], self._counts["written"], self._counts["rejected"],
+            self._bytes[0], self._bytes_total, self._reported - self._started, done
+        )
+        if self.on_progress:
+            self.on_progress(progress)
+        return progress
+
+
+def format_progress(progress: ImportProgress) -> str:
+    return (f"{progress.fraction:6.1%}  {progress.read:>12,} read  {progress.written:>12,} written  "
+            f"{progress.rejected:>9,} rejected  {progress.rows_per_sec:>9,.0f} rows/s")
+
+
+# ========== CLI ==========
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=sorted(IMPORT_SPECS))
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="rows per transaction")
+    parser.add_argument("--workers", type=int, default=None, help="validation processes (0 = inline; default: spare CPUs, max 4)")
+    parser.add_argument("--rejects", default=None, help="rejected rows file (JSON Lines)")
+    parser.add_argument("--user-email", default=None, help="owner of imported reservations")
+    args = parser.parse_args()
+
+    # Imported here so the validators can run in workers without the driver
+    from db_helper import DatabaseManager, close_connection_pool
+
+    try:
+        db = DatabaseManager()
+        context = {}
+        if args.kind == "reservations":
+            if not args.user_email:
+                parser.error("reservations need --user-email (the owning user)")
+            user = db.get_user_by_email(args.user_email)
+            if not user:
+                parser.error(f"no user with email {args.user_email}")
+            context["user_id"] = user["user_id"]
+
+        importer = BulkImporter(
+            db, args.kind, context, chunk_size=args.chunk, workers=args.workers,
+            on_progress=lambda p: print(f"\r{format_progress(p)}", end="", flush=True)
+        )
+        result = importer.run(args.path, args.format, args.rejects)
+        print()
+        print(f"✅ Imported {result.written:,} {args.kind} in {result.elapsed:.1f} s "
+              f"({result.rows_per_sec:,.0f} rows/s)")
+        if result.rejected:
+            print(f"⚠️  {result.rejected:,} rows rejected, see {args.rejects or args.path + '.rejects.jsonl'}")
+            return 1
+    finally:
+        close_connection_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
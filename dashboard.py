@@ -1,7 +1,4 @@
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from db_helper import DatabaseManager
 import tksheet
 
 
@@ -9,7 +6,6 @@ class HotelBookingDashboard(ctk.CTkFrame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
-        self.db = DatabaseManager()
 
         # Configure grid layout
         self.grid_rowconfigure(0, weight=1)
@@ -19,6 +15,11 @@ class HotelBookingDashboard(ctk.CTkFrame):
         self.create_sidebar()
         self.create_main_content()
 
+    @property
+    def db(self):
+        """The app's DatabaseManager; only read on worker threads, since first use connects"""
+        return self.controller.db
+
     def create_sidebar(self):
         sidebar = ctk.CTkFrame(self, width=250, fg_color="#f0f9ff", corner_radius=0)
         sidebar.grid(row=0, column=0, sticky="nsew")
@@ -154,18 +155,16 @@ class HotelBookingDashboard(ctk.CTkFrame):
         metrics_frame = ctk.CTkFrame(content, fg_color="transparent")
         metrics_frame.pack(fill="x", padx=20, pady=20)
 
-        # Get dynamic data from database
-        total_bookings_cost = self.db.get_total_bookings_cost()
-        active_customers = self.db.get_active_customers_count()
-        total_reservations = self.db.get_total_reservations()
-
+        # Cards start empty and are filled once the snapshot arrives from
+        # the background executor (one cached round trip)
         metrics = [
-            (f"${total_bookings_cost:,.2f}", "Total bookings cost"),
-            (f"{active_customers:,}", "Active customers"),
-            (f"{total_reservations:,}", "Total reservations"),
+            ("total_bookings_cost", "Total bookings cost"),
+            ("active_customers", "Active customers"),
+            ("total_reservations", "Total reservations"),
         ]
+        self.metric_labels = {}
 
-        for value, label in metrics:
+        for key, label in metrics:
             card = ctk.CTkFrame(
                 metrics_frame,
                 fg_color="white",
@@ -174,12 +173,14 @@ class HotelBookingDashboard(ctk.CTkFrame):
             )
             card.pack(side="left", expand=True, fill="both", padx=10)
 
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 card,
-                text=value,
+                text="—",
                 font=("Arial", 24, "bold"),
                 text_color="#2c3e50"
-            ).pack(pady=(25, 5), padx=20, anchor="w")
+            )
+            value_label.pack(pady=(25, 5), padx=20, anchor="w")
+            self.metric_labels[key] = value_label
 
             ctk.CTkLabel(
                 card,
@@ -188,6 +189,8 @@ class HotelBookingDashboard(ctk.CTkFrame):
                 text_color="#7f8c8d"
             ).pack(pady=(0, 20), padx=20, anchor="w")
 
+        self.refresh_metrics()
+
         # ===== MONTHLY REVENUE GRAPH =====
         revenue_frame = ctk.CTkFrame(content, fg_color="white", corner_radius=12)
         revenue_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -199,25 +202,9 @@ class HotelBookingDashboard(ctk.CTkFrame):
             text_color="#2c3e50"
         ).pack(pady=(20, 15), padx=20, anchor="w")
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(10, 3), dpi=100)
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul']
-        revenue = [5000, 5500, 6200, 5800, 6500, 7000, 7500]
-
-        ax.plot(months, revenue, color='#3b82f6', linewidth=2, marker='o')
-        ax.fill_between(months, revenue, color='#3b82f6', alpha=0.1)
-        ax.grid(axis='y', linestyle='--', alpha=0.7)
-        ax.set_facecolor('white')
-        fig.patch.set_facecolor('white')
-
-        # Remove borders
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-
-        # Embed in Tkinter
-        canvas = FigureCanvasTkAgg(fig, master=revenue_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="x", padx=20, pady=(0, 20))
+        # matplotlib takes a while to import; draw the chart once the rest of
+        # the dashboard is on screen
+        self.after_idle(self.draw_revenue_chart, revenue_frame)
 
         # ===== QUICK ACCESS (SINGLE ROW) =====
         quick_access_frame = ctk.CTkFrame(content, fg_color="white", corner_radius=12)
@@ -341,6 +328,19 @@ class HotelBookingDashboard(ctk.CTkFrame):
         # Apply formatting
         self.format_table()
 
+    def refresh_metrics(self):
+        """Load the KPI snapshot in the background and fill the metric cards"""
+        self.controller.db_executor.submit(
+            lambda: self.db.get_dashboard_snapshot(),
+            on_success=self.update_metrics, key="dashboard:snapshot"
+        )
+
+    def update_metrics(self, snapshot):
+        """Show a KPI snapshot in the metric cards"""
+        self.metric_labels["total_bookings_cost"].configure(text=f"${snapshot['total_bookings_cost']:,.2f}")
+        self.metric_labels["active_customers"].configure(text=f"{snapshot['active_customers']:,}")
+        self.metric_labels["total_reservations"].configure(text=f"{snapshot['total_reservations']:,}")
+
     def format_table(self):
         """Apply enhanced formatting and colors to the table"""
         for r, row in enumerate(self.sheet.get_sheet_data()):
@@ -407,6 +407,31 @@ class HotelBookingDashboard(ctk.CTkFrame):
                 canvas="table"
             )
 
+    def draw_revenue_chart(self, revenue_frame):
+        """Draw the monthly revenue chart into ``revenue_frame``"""
+        # Imported on first use: matplotlib dominates the app's import time
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        fig, ax = plt.subplots(figsize=(10, 3), dpi=100)
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul']
+        revenue = [5000, 5500, 6200, 5800, 6500, 7000, 7500]
+
+        ax.plot(months, revenue, color='#3b82f6', linewidth=2, marker='o')
+        ax.fill_between(months, revenue, color='#3b82f6', alpha=0.1)
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        ax.set_facecolor('white')
+        fig.patch.set_facecolor('white')
+
+        # Remove borders
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        # Embed in Tkinter
+        canvas = FigureCanvasTkAgg(fig, master=revenue_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="x", padx=20, pady=(0, 20))
+
     def update_user_display(self, user_data):
         """Update the display with user information"""
         pass
\ No newline at end of file
@@ -0,0 +1,149 @@
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DBExecutor:
+    """Runs database calls on worker threads and hands results back to Tk.
+
+    Workers never touch widgets: completed futures queue their callbacks and
+    the Tk thread drains that queue with ``after()``. Submitting with a
+    ``key`` supersedes the previous request with the same key, so a stale
+    search or reload can never overwrite a newer result.
+    """
+
+    def __init__(
+            self,
+            root,
+            max_workers: int = 4,
+            poll_interval_ms: int = 30,
+            on_busy_change: Optional[Callable[[bool], None]] = None,
+    ):
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self.on_busy_change = on_busy_change
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+        self._ui_queue = queue.Queue()
+        self._latest: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._shutdown = False
+
+        self._poll_job = self.root.after(self.poll_interval_ms, self._drain)
+
+    # ========== SUBMISSION ==========
+    def submit(
+            self,
+            fn: Callable[..., Any],
+            *args,
+            on_success: Optional[Callable[[Any], None]] = None,
+            on_error: Optional[Callable[[Exception], None]] = None,
+            key: Optional[Hashable] = None,
+            **kwargs,
+    ) -> Future:
+        """Run ``fn(*args, **kwargs)`` on a worker thread.
+
+        ``on_success(result)`` / ``on_error(exc)`` run on the Tk thread. When
+        ``key`` is given, any earlier request with the same key is cancelled
+        (or its result dropped if it already started).
+        """
+        if self._shutdown:
+            raise RuntimeError("DB executor is shut down")
+
+        with self._lock:
+            previous = self._latest.get(key) if key is not None else None
+            self._pending += 1
+            became_busy = self._pending == 1
+            future = self._pool.submit(fn, *args, **kwargs)
+            if key is not None:
+                self._latest[key] = future
+
+        # Cancelling a queued future runs its done-callback (_on_done, which
+        # takes the lock) on this thread, so it must happen outside the lock
+        if previous is not None:
+            previous.cancel()
+
+        if became_busy:
+            self.run_on_ui(self._notify_busy, True)
+
+        future.add_done_callback(
+            lambda f: self._on_done(f, key, on_success, on_error)
+        )
+        return future
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel the outstanding request for ``key`` and drop its result"""
+        with self._lock:
+            future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def run_on_ui(self, callback: Callable[..., None], *args) -> None:
+        """Schedule ``callback(*args)`` on the Tk thread (safe from any thread)"""
+        self._ui_queue.put((callback, args))
+
+    @property
+    def busy(self) -> bool:
+        return self._pending > 0
+
+    def shutdown(self) -> None:
+        """Stop polling and cancel queued work; running calls finish in the background"""
+        self._shutdown = True
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+            self._poll_job = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ========== COMPLETION ==========
+    def _on_done(self, future: Future, key, on_success, on_error) -> None:
+        """Worker-side completion: decide what to deliver, then queue it for Tk"""
+        with self._lock:
+            self._pending -= 1
+            superseded = key is not None and self._latest.get(key) is not future
+            if key is not None and not superseded:
+                del self._latest[key]
+            idle = self._pending == 0
+
+        if idle:
+            self.run_on_ui(self._notify_busy, False)
+
+        if future.cancelled() or superseded:
+            return
+
+        err = future.exception()
+        if err is not None:
+            if on_error is not None:
+                self.run_on_ui(on_error, err)
+            else:
+                logger.error(f"Background database call failed: {err}")
+            return
+
+        if on_success is not None:
+            self.run_on_ui(on_success, future.result())
+
+    def _notify_busy(self, busy: bool) -> None:
+        if self.on_busy_change is not None:
+            self.on_busy_change(busy)
+
+    def _drain(self) -> None:
+        """Tk-side: run every queued callback, then poll again"""
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as err:
+                logger.error(f"UI callback failed: {err}")
+
+        if not self._shutdown:
+            self._poll_job = self.root.after(self.poll_interval_ms, self._drain)
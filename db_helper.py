@@ -1,12 +1,23 @@
 import mysql.connector
-from mysql.connector import Error, errorcode
+from mysql.connector import Error
 from dotenv import load_dotenv
 import os
 import hashlib
 import re
 from typing import Optional, Dict, Tuple, List
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from db_pool import ConnectionPool
+from cache import TTLCache
+from db_metrics import InstrumentedConnection, InstrumentedCursor, instrument_methods
+from audit_log import AuditLogWriter
+from availability import AvailabilityIndex
+from reservation_model import Reservation
+from id_allocator import IdAllocator
+import migrations
 
 # Configure logging
 logging.basicConfig(
@@ -19,178 +30,346 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
-class DatabaseManager:
-    def __init__(self):
-        """Initialize database connection with enhanced error handling"""
-        self.connection = None
-        self._connect()
-        self._initialize_database()
-        logger.info("DatabaseManager initialized")
-
-    def _connect(self) -> bool:
-        """Establish secure connection with retry logic"""
-        max_retries = 3
-        retry_delay = 2  # seconds
-
-        for attempt in range(max_retries):
-            try:
-                self.connection = mysql.connector.connect(
-                    host=os.getenv("DB_HOST"),
-                    port=int(os.getenv("DB_PORT")),
-                    user=os.getenv("DB_USER"),
-                    password=os.getenv("DB_PASSWORD"),
-                    database=os.getenv("DB_NAME"),
-                    ssl_disabled=False,
-                    connect_timeout=5,
-                    connection_timeout=30,
-                    autocommit=True,
-                    pool_name="hotel_pool",
-                    pool_size=5,
-                )
+# Process-wide connection pool shared by every DatabaseManager
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# Set once the schema version has been checked for this process
+_schema_verified = False
+
+# Dashboard KPIs, invalidated by every customer/reservation write
+_dashboard_cache = TTLCache(ttl=float(os.getenv("DASHBOARD_CACHE_TTL", "60")))
+
+# Newest customers for the Reports page, patched in place by
+# add/update/delete_customer; the TTL only bounds staleness from writers
+# outside this process (bulk loads, other clients)
+RECENT_CUSTOMERS_CACHED = 20
+_recent_customers_cache = TTLCache(ttl=float(os.getenv("RECENT_CUSTOMERS_CACHE_TTL", "300")))
+_recent_customers_lock = threading.Lock()
+
+# Verified sessions; each entry lives until the session expires, capped
+# so deactivations and logouts in other processes are seen within the cap
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "300"))
+_session_cache = TTLCache(ttl=SESSION_CACHE_TTL, maxsize=1024)
+
+# auth_logs rows are written in batches off the login path
+_audit_writer: Optional[AuditLogWriter] = None
+_audit_lock = threading.Lock()
+
+# Room availability index, built on first search and kept current by
+# reservation writes and the change feed
+_availability: Optional[AvailabilityIndex] = None
+_availability_version = 0
+_availability_lock = threading.Lock()
+
+# New reservation/customer/staff IDs come from blocks reserved in id_sequences
+_id_allocator: Optional[IdAllocator] = None
+_id_allocator_lock = threading.Lock()
+
+# Change-feed readers reload everything rather than apply more deltas than this
+CHANGE_FEED_LIMIT = 500
+# Versions this close to the newest may still commit out of AUTO_INCREMENT order
+CHANGE_LOOKBACK = int(os.getenv("CHANGE_LOOKBACK", "1000"))
+
+# Monthly rollup refresh throttling (seconds between incremental folds)
+ROLLUP_MIN_INTERVAL = float(os.getenv("ROLLUP_MIN_INTERVAL", "10"))
+_rollup_refreshed_at = float("-inf")
+# monthly_metrics column fed by each table's inserts:
+# (table, column, aggregate, month of the row, join from change_log)
+_ROLLUP_SOURCES = (
+    ("customers", "new_customers", "COUNT(*)",
+     "DATE_FORMAT(s.created_at, '%Y-%m-01')", "s.customer_id = cl.row_key"),
+    ("reservations", "bookings", "COUNT(*)",
+     "DATE_FORMAT(s.created_at, '%Y-%m-01')", "s.reservation_id = cl.row_key"),
+    # transaction_date may be backdated, so revenue lands in its own month
+    ("transactions", "revenue", "SUM(s.amount)",
+     "DATE_FORMAT(s.transaction_date, '%Y-%m-01')", "s.transaction_id = CAST(cl.row_key AS UNSIGNED)"),
+)
 
-                if self.connection.is_connected():
-                    logger.info(f"✅ Connected to MySQL database (Attempt {attempt + 1})")
-                    return True
+# Customer/staff search: "fulltext" uses the ngram FULLTEXT indexes from
+# migration 3, "like" keeps the original leading-wildcard scans
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "fulltext").lower()
+NGRAM_TOKEN_SIZE = int(os.getenv("NGRAM_TOKEN_SIZE", "2"))
+
+
+def _fulltext_phrase(query: str) -> Optional[str]:
+    """Quote a search box query as an ngram phrase, or None if LIKE must be used"""
+    # Double quotes are the only operator that stays special inside a phrase
+    query = query.replace('"', ' ').strip()
+    if SEARCH_BACKEND != "fulltext" or len(query) < NGRAM_TOKEN_SIZE:
+        return None
+    return f'"{query}"'
+
+
+def search_text_matches(value: str, query: str, case_sensitive: bool = False) -> bool:
+    """Local equivalent of how customer/staff search matches one column.
+
+    LIKE matches ``query`` as a substring. An ngram FULLTEXT phrase matches
+    its words in sequence whatever whitespace separates them, which is a
+    substring match once whitespace is collapsed and the quotes the phrase
+    cannot hold are dropped. Either way an extended query matches a subset
+    of the rows its prefix matched, so results can be refined locally.
+    """
+    if not case_sensitive:
+        value, query = value.casefold(), query.casefold()
+    if _fulltext_phrase(query) is None:
+        return query in value
+    return " ".join(query.replace('"', ' ').split()) in " ".join(value.split())
+
+
+def _cached_recent_customers(limit: int) -> Optional[List[Dict]]:
+    """The newest ``limit`` customers if the cache can answer, else None"""
+    state = _recent_customers_cache.get("recent")
+    if state is None:
+        return None
+    with _recent_customers_lock:
+        if limit > len(state["rows"]) and not state["complete"]:
+            return None
+        return [dict(row) for row in state["rows"][:limit]]
+
+
+def _store_recent_customers(rows: List[Dict], fetched_limit: int) -> None:
+    """Cache rows fetched with ``LIMIT fetched_limit`` (newest first)"""
+    _recent_customers_cache.set("recent", {
+        "rows": [dict(row) for row in rows],
+        # Fewer rows than asked for means the table has no more
+        "complete": len(rows) < fetched_limit,
+    })
+
+
+def _patch_recent_customers(customer_id: str, data: Optional[Dict] = None, added: bool = False) -> None:
+    """Apply one customer write to the cached list (``data`` None means deleted)"""
+    state = _recent_customers_cache.get("recent")
+    if state is None:
+        return
+    with _recent_customers_lock:
+        rows = state["rows"]
+        if added:
+            rows.insert(0, {
+                "customer_id": customer_id,
+                "name": data["full_name"],
+                "email": data["email"],
+                "phone": data["phone"],
+                "status": data["status"],
+                "signup_date": datetime.now().strftime('%Y-%m-%d'),
+            })
+            if len(rows) > RECENT_CUSTOMERS_CACHED:
+                rows.pop()
+                state["complete"] = False
+            return
+
+        for i, row in enumerate(rows):
+            if row["customer_id"] == customer_id:
+                if data is None:
+                    del rows[i]
+                else:
+                    row.update(
+                        name=data["full_name"], email=data["email"],
+                        phone=data["phone"], status=data["status"]
+                    )
+                return
+
+
+def _index_booking(reservation_id: str, data: Dict) -> None:
+    """Reflect one reservation write in the availability index, if built.
+
+    Writes that do not carry both room_id and checkout_date are left to
+    the next change-feed sync, which reads the full row.
+    """
+    if _availability is None:
+        return
+    if data.get("room_id") is None:
+        _availability.remove(reservation_id)
+    elif data.get("checkout_date") is not None and data.get("checkin_date") is not None:
+        _availability.add(reservation_id, data["room_id"], data["checkin_date"], data["checkout_date"])
+
+
+def _create_connection(**options):
+    """Open a new secure MySQL connection with retry logic.
+
+    ``options`` override the defaults passed to ``mysql.connector.connect``
+    (e.g. ``allow_local_infile=True`` for bulk loads).
+    """
+    max_retries = 3
+    retry_delay = 2  # seconds
+
+    settings = dict(
+        host=os.getenv("DB_HOST"),
+        port=int(os.getenv("DB_PORT")),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=os.getenv("DB_NAME"),
+        ssl_disabled=False,
+        connect_timeout=5,
+        connection_timeout=30,
+        autocommit=True,
+    )
+    settings.update(options)
+
+    for attempt in range(max_retries):
+        try:
+            connection = mysql.connector.connect(**settings)
 
-            except Error as err:
-                logger.error(f"❌ Connection attempt {attempt + 1} failed: {err}")
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(f"Failed to connect after {max_retries} attempts") from err
-
-    def _initialize_database(self) -> None:
-        """Initialize database schema with verification"""
-        if not self.connection or not self.connection.is_connected():
-            self._connect()
-
-        tables = {
-            "users": """
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id INT AUTO_INCREMENT PRIMARY KEY,
-                    full_name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
-                    password_hash VARCHAR(255) NOT NULL,
-                    gender ENUM('Male','Female','Other') NOT NULL,
-                    is_active BOOLEAN DEFAULT TRUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    UNIQUE INDEX idx_email (email)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "user_sessions": """
-                CREATE TABLE IF NOT EXISTS user_sessions (
-                    session_id VARCHAR(255) PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    ip_address VARCHAR(45),
-                    user_agent TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "auth_logs": """
-                CREATE TABLE IF NOT EXISTS auth_logs (
-                    log_id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NULL,
-                    email VARCHAR(100) NOT NULL,
-                    action ENUM('register','login','logout','fail') NOT NULL,
-                    ip_address VARCHAR(45),
-                    user_agent TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "reservations": """
-                CREATE TABLE IF NOT EXISTS reservations (
-                    reservation_id VARCHAR(20) PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    guest_name VARCHAR(100) NOT NULL,
-                    checkin_date DATE NOT NULL,
-                    checkout_date DATE NOT NULL,
-                    booking_amount DECIMAL(10,2) NOT NULL,
-                    payment_status ENUM('Paid', 'Pending', 'Cancelled') DEFAULT 'Pending',
-                    fulfillment_status ENUM('Confirmed', 'Pending', 'Cancelled') DEFAULT 'Pending',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
-                    INDEX idx_reservations_created (created_at)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "customers": """
-                CREATE TABLE IF NOT EXISTS customers (
-                    customer_id VARCHAR(20) PRIMARY KEY,
-                    full_name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
-                    address TEXT NOT NULL,
-                    phone VARCHAR(20) NOT NULL,
-                    status ENUM('Active','Inactive') NOT NULL DEFAULT 'Active',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    UNIQUE INDEX idx_email (email),
-                    INDEX idx_status (status)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "transactions": """
-                CREATE TABLE IF NOT EXISTS transactions (
-                    transaction_id INT AUTO_INCREMENT PRIMARY KEY,
-                    customer_id VARCHAR(20),
-                    reservation_id VARCHAR(20),
-                    amount DECIMAL(10,2) NOT NULL,
-                    transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (customer_id) REFERENCES customers(customer_id) 
-                        ON DELETE SET NULL
-                        ON UPDATE CASCADE,
-                    FOREIGN KEY (reservation_id) REFERENCES reservations(reservation_id)
-                        ON DELETE SET NULL
-                        ON UPDATE CASCADE,
-                    INDEX idx_transactions_date (transaction_date)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "room_occupancy": """
-                CREATE TABLE IF NOT EXISTS room_occupancy (
-                    record_id INT AUTO_INCREMENT PRIMARY KEY,
-                    date DATE NOT NULL,
-                    occupied_rooms INT NOT NULL,
-                    total_rooms INT NOT NULL,
-                    UNIQUE KEY unique_date (date)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            "staff": """
-                CREATE TABLE IF NOT EXISTS staff (
-                    staff_id VARCHAR(20) PRIMARY KEY,
-                    full_name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
-                    phone VARCHAR(20) NOT NULL,
-                    address TEXT NOT NULL,
-                    status ENUM('Active','Inactive') NOT NULL DEFAULT 'Active',
-                    password VARCHAR(255) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    UNIQUE INDEX idx_staff_email (email)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """
-        }
+            if connection.is_connected():
+                logger.info(f"✅ Connected to MySQL database (Attempt {attempt + 1})")
+                return connection
+
+        except Error as err:
+            logger.error(f"❌ Connection attempt {attempt + 1} failed: {err}")
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay)
+                continue
+            raise RuntimeError(f"Failed to connect after {max_retries} attempts") from err
+
+    raise RuntimeError(f"Failed to connect after {max_retries} attempts")
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Return the shared connection pool, creating it on first use.
+
+    Sized by DB_POOL_SIZE (default 5); idle connections are evicted after
+    DB_POOL_IDLE_TIMEOUT seconds (default 300).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                _create_connection,
+                size=int(os.getenv("DB_POOL_SIZE", "5")),
+                idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+                checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30")),
+            )
+            logger.info(f"Connection pool created (size={_pool.size})")
+        return _pool
+
+
+def _write_audit_events(events: List[Tuple]) -> None:
+    """Insert a batch of audit events (one multi-row INSERT)"""
+    with get_connection_pool().connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO auth_logs 
+                (user_id, email, action, ip_address, user_agent)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                events,
+            )
+
+
+def _reserve_id_block(sequence: str, size: int) -> int:
+    """Reserve ``size`` values of ``sequence`` in one UPDATE; return the first"""
+    with get_connection_pool().connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "UPDATE id_sequences SET next_value = LAST_INSERT_ID(next_value + %s) WHERE name = %s",
+                (size, sequence),
+            )
+            if cursor.rowcount != 1:
+                raise Error(msg=f"ID sequence '{sequence}' is missing; run 'python init_db.py migrate'")
+            end = cursor.lastrowid
+            if not end:
+                cursor.execute("SELECT LAST_INSERT_ID()")
+                end = cursor.fetchone()[0]
+    return int(end) - size
+
+
+def get_id_allocator() -> IdAllocator:
+    """Return the process-wide ID allocator"""
+    global _id_allocator
+    with _id_allocator_lock:
+        if _id_allocator is None:
+            _id_allocator = IdAllocator(_reserve_id_block, block_size=int(os.getenv("ID_BLOCK_SIZE", "100")))
+        return _id_allocator
+
+
+def get_audit_writer() -> AuditLogWriter:
+    """Return the process-wide audit log writer, starting it on first use"""
+    global _audit_writer
+    with _audit_lock:
+        if _audit_writer is None:
+            _audit_writer = AuditLogWriter(
+                _write_audit_events,
+                max_queue=int(os.getenv("AUDIT_QUEUE_SIZE", "10000")),
+                batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "200")),
+                flush_interval=float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0")),
+            )
+        return _audit_writer
+
+
+def close_connection_pool() -> None:
+    """Flush pending audit events, then close the shared pool at process shutdown"""
+    global _pool, _audit_writer
+    with _audit_lock:
+        writer, _audit_writer = _audit_writer, None
+    if writer is not None:
+        writer.close()
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
 
-        try:
-            with self.connection.cursor() as cursor:
-                # Create all tables with correct definitions
-                for table_name, ddl in tables.items():
-                    try:
-                        cursor.execute(ddl)
-                        logger.info(f"Table '{table_name}' created successfully")
-                    except Error as err:
-                        if err.errno == errorcode.ER_TABLE_EXISTS_ERROR:
-                            logger.debug(f"Table '{table_name}' already exists")
-                        else:
-                            logger.error(f"Error creating table '{table_name}': {err}")
-                            raise
 
-            self.connection.commit()
+class DatabaseManager:
+    def __init__(self):
+        """Attach to the shared connection pool and verify the schema"""
+        started = time.perf_counter()
+        self.pool = get_connection_pool()
+        self._check_schema_version()
+        logger.info(f"DatabaseManager initialized in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    @contextmanager
+    def borrow(self):
+        """Borrow a pooled connection for the duration of a ``with`` block"""
+        with self.pool.connection() as conn:
+            yield InstrumentedConnection(conn)
+
+    @contextmanager
+    def _cursor(self, dictionary: bool = False):
+        """Borrow a pooled connection and open an instrumented cursor on it"""
+        with self.pool.connection() as conn:
+            with InstrumentedCursor(conn.cursor(dictionary=dictionary)) as cursor:
+                yield cursor
+
+    def next_id(self, sequence: str) -> str:
+        """New unique ID for "reservations", "customers" or "staff" (no pre-check needed)"""
+        return get_id_allocator().next_id(sequence)
+
+    def _assign_id(self, record: Dict, field: str, sequence: str) -> bool:
+        """Fill ``record[field]`` with a new ID unless the caller supplied one"""
+        if record.get(field):
+            return True
+        try:
+            record[field] = self.next_id(sequence)
+            return True
         except Error as err:
-            logger.error(f"Database initialization failed: {err}")
-            raise
+            logger.error(f"Error allocating {sequence} ID: {err}")
+            return False
+
+    def get_pool_stats(self) -> Dict[str, float]:
+        """Expose connection pool counters (checkouts, waits, failed validations)"""
+        return self.pool.stats()
+
+    def _check_schema_version(self) -> None:
+        """Make sure the database has been migrated (one query per process)"""
+        global _schema_verified
+        if _schema_verified:
+            return
+
+        started = time.perf_counter()
+        with self.borrow() as conn:
+            version = migrations.get_schema_version(conn)
+
+        if version < migrations.LATEST_VERSION:
+            raise migrations.SchemaOutOfDateError(
+                f"Database schema is at version {version}, expected "
+                f"{migrations.LATEST_VERSION}. Run 'python init_db.py migrate' first."
+            )
+
+        _schema_verified = True
+        logger.info(
+            f"Schema version {version} verified in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
 
     # ========== STAFF MANAGEMENT METHODS ==========
     def get_staff_members(self, status="all"):
@@ -204,7 +383,7 @@ class DatabaseManager:
             query += " WHERE status = 'Inactive'"
 
         try:
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute(query, params)
                 return cursor.fetchall()
         except Error as err:
@@ -213,8 +392,30 @@ class DatabaseManager:
 
     def search_staff_members(self, query):
         """Search staff members by name, email or phone"""
+        phrase = _fulltext_phrase(query)
+        if phrase is None:
+            return self._search_staff_like(query)
+
+        # Separate MATCHes on the two indexes (email has its own collation);
+        # OR-ing them in one WHERE would bypass both indexes
         try:
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT * FROM staff
+                    WHERE MATCH(full_name, phone) AGAINST (%s IN BOOLEAN MODE)
+                    UNION
+                    SELECT * FROM staff
+                    WHERE MATCH(email) AGAINST (%s IN BOOLEAN MODE)
+                """, (phrase, phrase))
+                return cursor.fetchall()
+        except Error as err:
+            logger.error(f"Error searching staff: {err}")
+            return []
+
+    def _search_staff_like(self, query):
+        """Leading-wildcard LIKE search (short queries / SEARCH_BACKEND=like)"""
+        try:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute("""
                     SELECT * FROM staff 
                     WHERE full_name LIKE %s 
@@ -227,9 +428,11 @@ class DatabaseManager:
             return []
 
     def add_staff_member(self, staff_data):
-        """Add a new staff member"""
+        """Add a new staff member; a missing ``staff_id`` is allocated and written back"""
+        if not self._assign_id(staff_data, "staff_id", "staff"):
+            return False
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO staff 
                     (staff_id, full_name, email, phone, address, status, password)
@@ -251,7 +454,7 @@ class DatabaseManager:
     def update_staff_member(self, staff_id, updated_data):
         """Update staff member details"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 query = "UPDATE staff SET "
                 params = []
 
@@ -289,7 +492,7 @@ class DatabaseManager:
     def delete_staff_member(self, staff_id):
         """Delete a staff member"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("DELETE FROM staff WHERE staff_id = %s", (staff_id,))
                 return cursor.rowcount > 0
         except Error as err:
@@ -297,10 +500,62 @@ class DatabaseManager:
             return False
 
     # ========== DASHBOARD REPORTING METHODS ==========
+    def get_dashboard_snapshot(self) -> Dict[str, float]:
+        """Get every dashboard KPI from one multi-aggregate query (TTL cached)"""
+        cached = _dashboard_cache.get("snapshot")
+        if cached is not None:
+            return dict(cached)
+
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(
+                    """
+                    SELECT
+                        r.total_bookings_cost,
+                        r.total_reservations,
+                        c.active_customers,
+                        c.total_customers
+                    FROM (
+                        SELECT
+                            COALESCE(SUM(booking_amount), 0) AS total_bookings_cost,
+                            COUNT(*) AS total_reservations
+                        FROM reservations
+                    ) r
+                    CROSS JOIN (
+                        SELECT
+                            COALESCE(SUM(status = 'Active'), 0) AS active_customers,
+                            COUNT(*) AS total_customers
+                        FROM customers
+                    ) c
+                    """
+                )
+                row = cursor.fetchone()
+
+            snapshot = {
+                "total_bookings_cost": float(row["total_bookings_cost"]),
+                "total_reservations": int(row["total_reservations"]),
+                "active_customers": int(row["active_customers"]),
+                "total_customers": int(row["total_customers"]),
+            }
+            _dashboard_cache.set("snapshot", snapshot)
+            return dict(snapshot)
+        except Error as err:
+            logger.error(f"Error getting dashboard snapshot: {err}")
+            return {
+                "total_bookings_cost": 0.0,
+                "total_reservations": 0,
+                "active_customers": 0,
+                "total_customers": 0,
+            }
+
+    def invalidate_dashboard_cache(self) -> None:
+        """Drop cached KPIs after a write to customers or reservations"""
+        _dashboard_cache.invalidate()
+
     def get_total_bookings_cost(self) -> float:
         """Get the total cost of all bookings"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("SELECT SUM(booking_amount) FROM reservations")
                 result = cursor.fetchone()[0]
                 return float(result) if result else 0.0
@@ -311,7 +566,7 @@ class DatabaseManager:
     def get_total_reservations(self) -> int:
         """Get the total number of reservations"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("SELECT COUNT(*) FROM reservations")
                 return cursor.fetchone()[0] or 0
         except Error as err:
@@ -321,7 +576,7 @@ class DatabaseManager:
     def get_active_customers_count(self) -> int:
         """Get count of active customers"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("SELECT COUNT(*) FROM customers WHERE status = 'Active'")
                 return cursor.fetchone()[0] or 0
         except Error as err:
@@ -331,7 +586,7 @@ class DatabaseManager:
     def get_total_customers(self) -> int:
         """Get total count of all customers (active and inactive)"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute("SELECT COUNT(*) FROM customers")
                 return cursor.fetchone()[0] or 0
         except Error as err:
@@ -339,9 +594,14 @@ class DatabaseManager:
             return 0
 
     def get_recent_customers(self, limit: int = 5) -> List[Dict]:
-        """Get recent customers with detailed information"""
+        """Get recent customers with detailed information (served from cache when hot)"""
+        cached = _cached_recent_customers(limit)
+        if cached is not None:
+            return cached
+
+        fetch_limit = max(limit, RECENT_CUSTOMERS_CACHED)
         try:
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute(
                     """
                     SELECT 
@@ -355,47 +615,262 @@ class DatabaseManager:
                     ORDER BY created_at DESC
                     LIMIT %s
                     """,
-                    (limit,),
+                    (fetch_limit,),
                 )
-                return cursor.fetchall()
+                rows = cursor.fetchall()
+            _store_recent_customers(rows, fetch_limit)
+            return rows[:limit]
         except Error as err:
             logger.error(f"Error fetching recent customers: {err}")
             return []
 
-    def get_customer_growth(self, months: int = 6) -> Dict[str, int]:
-        """Get customer growth data for the last N months"""
+    # ========== MONTHLY ROLLUP METHODS ==========
+    def refresh_monthly_metrics(self, force: bool = False) -> bool:
+        """Fold rows inserted since the last refresh into monthly_metrics.
+
+        New rows are found through the change feed: inserts logged after the
+        watermark version, plus any within CHANGE_LOOKBACK versions below it
+        that committed late (out of AUTO_INCREMENT order) and are not yet in
+        rollup_folded. The first refresh, or one whose watermark the feed was
+        pruned past, recounts everything. Rows are only ever added, so run
+        rebuild_monthly_metrics() after bulk deletes.
+        """
+        global _rollup_refreshed_at
+        if not force and time.monotonic() - _rollup_refreshed_at < ROLLUP_MIN_INTERVAL:
+            return True
+
+        tables = [source[0] for source in _ROLLUP_SOURCES]
+        in_tables = ", ".join(["%s"] * len(tables))
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30 * months)
+            with self.borrow() as conn:
+                conn.start_transaction()
+                with conn.cursor() as cursor:
+                    # Lock the watermark first so concurrent refreshers
+                    # serialize; the reads below then share one snapshot
+                    # taken after any earlier refresh committed
+                    cursor.execute(
+                        "SELECT last_id FROM rollup_watermarks WHERE source = 'change_log' FOR UPDATE"
+                    )
+                    mark = cursor.fetchone()
+                    if mark is None:
+                        conn.rollback()
+                        logger.error("Rollup watermark missing; run 'python init_db.py migrate'")
+                        return False
+                    last = mark[0]
+
+                    cursor.execute("SELECT COALESCE(MIN(version), 0), COALESCE(MAX(version), 0) FROM change_log")
+                    oldest, latest = cursor.fetchone()
+                    recount = last is None or oldest > last + 1
+                    if recount:
+                        cursor.execute("DELETE FROM monthly_metrics")
+                        cursor.execute("DELETE FROM rollup_folded")
+
+                    totals: Dict[str, List] = {}
+                    for i, (table, _, aggregate, month, join) in enumerate(_ROLLUP_SOURCES):
+                        if recount:
+                            cursor.execute(f"SELECT {month}, {aggregate} FROM {table} s GROUP BY 1")
+                        else:
+                            cursor.execute(
+                                f"""
+                                SELECT {month}, {aggregate}
+                                FROM change_log cl
+                                LEFT JOIN rollup_folded f ON f.version = cl.version
+                                JOIN {table} s ON {join}
+                                WHERE cl.version > %s AND cl.table_name = %s
+                                  AND cl.operation = 'insert' AND f.version IS NULL
+                                GROUP BY 1
+                                """,
+                                (last - CHANGE_LOOKBACK, table),
+                            )
+                        for month_start, value in cursor.fetchall():
+                            if month_start is not None:
+                                totals.setdefault(month_start, [0, 0, 0])[i] = value
+
+                    # Inserts the lookback could see again, recorded as folded
+                    floor = latest - CHANGE_LOOKBACK if recount else last - CHANGE_LOOKBACK
+                    cursor.execute(
+                        f"""
+                        SELECT cl.version
+                        FROM change_log cl
+                        LEFT JOIN rollup_folded f ON f.version = cl.version
+                        WHERE cl.version > %s AND cl.table_name IN ({in_tables})
+                          AND cl.operation = 'insert' AND f.version IS NULL
+                        """,
+                        [floor] + tables,
+                    )
+                    folded = [(version,) for (version,) in cursor.fetchall()]
+
+                    columns = [source[1] for source in _ROLLUP_SOURCES]
+                    if totals:
+                        cursor.executemany(
+                            f"""
+                            INSERT INTO monthly_metrics (month_start, {', '.join(columns)})
+                            VALUES (%s, {', '.join(['%s'] * len(columns))})
+                            ON DUPLICATE KEY UPDATE
+                            {', '.join(f'{c} = {c} + VALUES({c})' for c in columns)}
+                            """,
+                            [(month_start, *values) for month_start, values in totals.items()],
+                        )
+                    if folded:
+                        cursor.executemany("INSERT IGNORE INTO rollup_folded (version) VALUES (%s)", folded)
+
+                    watermark = latest if recount else max(last, latest)
+                    cursor.execute("DELETE FROM rollup_folded WHERE version <= %s", (watermark - CHANGE_LOOKBACK,))
+                    cursor.execute(
+                        "UPDATE rollup_watermarks SET last_id = %s WHERE source = 'change_log'",
+                        (watermark,),
+                    )
+                conn.commit()
+
+            _rollup_refreshed_at = time.monotonic()
+            return True
+        except Error as err:
+            logger.error(f"Error refreshing monthly metrics: {err}")
+            return False
 
-            query = """
-                SELECT 
-                    DATE_FORMAT(created_at, '%Y-%m') AS month_group,
-                    DATE_FORMAT(created_at, '%b') AS month,
-                    COUNT(*) AS new_customers
-                FROM customers
-                WHERE created_at BETWEEN %s AND %s
-                GROUP BY month_group, month
-                ORDER BY month_group ASC
-            """
+    def rebuild_monthly_metrics(self) -> bool:
+        """Recompute monthly_metrics from scratch (after deletes or imports)"""
+        try:
+            with self.borrow() as conn:
+                conn.start_transaction()
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT source FROM rollup_watermarks FOR UPDATE")
+                    cursor.fetchall()
+                    cursor.execute("DELETE FROM monthly_metrics")
+                    cursor.execute("UPDATE rollup_watermarks SET last_id = NULL")
+                conn.commit()
+        except Error as err:
+            logger.error(f"Error resetting monthly metrics: {err}")
+            return False
 
-            with self.connection.cursor(dictionary=True) as cursor:
-                cursor.execute(query, (start_date, end_date))
-                results = cursor.fetchall()
+        return self.refresh_monthly_metrics(force=True)
+
+    def _get_monthly_series(self, column: str, months: int, cast) -> Dict[str, float]:
+        """Read one monthly_metrics column for the last N months, keyed by month name"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=30 * months)
+        query = f"""
+            SELECT month_start, {column} AS value
+            FROM monthly_metrics
+            WHERE month_start >= %s AND month_start <= %s
+            ORDER BY month_start ASC
+        """
+
+        with self._cursor(dictionary=True) as cursor:
+            cursor.execute(query, (start_date.replace(day=1).date(), end_date.date()))
+            results = cursor.fetchall()
+
+        # Fill in missing months with 0 values
+        all_months = {}
+        current_date = start_date
+        while current_date <= end_date:
+            all_months[current_date.strftime('%b')] = cast(0)
+            current_date += timedelta(days=30)
+
+        for row in results:
+            all_months[row['month_start'].strftime('%b')] = cast(row['value'])
+
+        return all_months
+
+    def get_report_bundle(self, months: int = 6, recent_limit: int = 5) -> Dict[str, List]:
+        """Get every report series plus recent customers in one round trip.
+
+        Series are column-oriented arrays aligned with ``months``, which holds
+        real year-month keys (oldest first), e.g.
+        {"months": ["2025-01", ...], "new_customers": [...], "bookings": [...],
+         "revenue": [...], "recent_customers": [{...}, ...]}
+        """
+        # Last N calendar months, including the current one
+        today = datetime.now().date()
+        month_keys = []
+        year, month = today.year, today.month
+        for _ in range(months):
+            month_keys.append(f"{year:04d}-{month:02d}")
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        month_keys.reverse()
+        first_month = datetime.strptime(month_keys[0], "%Y-%m").date()
+
+        bundle = {
+            "months": month_keys,
+            "new_customers": [0] * months,
+            "bookings": [0] * months,
+            "revenue": [0.0] * months,
+            "recent_customers": [],
+        }
 
-            # Fill in missing months with 0 values
-            all_months = {}
-            current_date = start_date
-            while current_date <= end_date:
-                month_key = current_date.strftime('%b')
-                all_months[month_key] = 0
-                current_date += timedelta(days=30)
+        # Recent customers come from the write-maintained cache when it is hot,
+        # leaving only the rollup rows to fetch
+        cached_recent = _cached_recent_customers(recent_limit)
+        fetch_limit = max(recent_limit, RECENT_CUSTOMERS_CACHED)
+
+        query = """
+            (SELECT
+                'month' AS kind,
+                DATE_FORMAT(month_start, '%Y-%m') AS month_key,
+                new_customers, bookings, revenue,
+                NULL AS customer_id, NULL AS name, NULL AS email,
+                NULL AS phone, NULL AS status, NULL AS created_at
+            FROM monthly_metrics
+            WHERE month_start >= %s)
+        """
+        params = (first_month,)
+        if cached_recent is None:
+            query += """
+            UNION ALL
+            (SELECT
+                'customer', NULL, NULL, NULL, NULL,
+                customer_id, full_name, email, phone, status, created_at
+            FROM customers
+            ORDER BY created_at DESC
+            LIMIT %s)
+            """
+            params += (fetch_limit,)
 
-            # Update with actual data
-            for row in results:
-                all_months[row['month']] = int(row['new_customers'])
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+        except Error as err:
+            logger.error(f"Error fetching report bundle: {err}")
+            return bundle
+
+        position = {key: i for i, key in enumerate(month_keys)}
+        recent = []
+        for row in rows:
+            if row["kind"] == "month":
+                i = position.get(row["month_key"])
+                if i is not None:
+                    bundle["new_customers"][i] = int(row["new_customers"])
+                    bundle["bookings"][i] = int(row["bookings"])
+                    bundle["revenue"][i] = float(row["revenue"])
+            else:
+                recent.append(row)
+
+        if cached_recent is not None:
+            bundle["recent_customers"] = cached_recent
+            return bundle
+
+        # UNION ALL does not keep the subquery order, so re-sort here
+        recent.sort(key=lambda r: r["created_at"], reverse=True)
+        recent_customers = [
+            {
+                "customer_id": r["customer_id"],
+                "name": r["name"],
+                "email": r["email"],
+                "phone": r["phone"],
+                "status": r["status"],
+                "signup_date": r["created_at"].strftime('%Y-%m-%d'),
+            }
+            for r in recent
+        ]
+        _store_recent_customers(recent_customers, fetch_limit)
+        bundle["recent_customers"] = recent_customers[:recent_limit]
+        return bundle
 
-            return all_months
+    def get_customer_growth(self, months: int = 6) -> Dict[str, int]:
+        """Get customer growth data for the last N months"""
+        try:
+            return self._get_monthly_series("new_customers", months, int)
         except Error as err:
             logger.error(f"Error fetching customer growth data: {err}")
             return {}
@@ -403,36 +878,7 @@ class DatabaseManager:
     def get_revenue_trends(self, months: int = 6) -> Dict[str, float]:
         """Get revenue trends for the last N months"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30 * months)
-
-            query = """
-                SELECT 
-                    DATE_FORMAT(transaction_date, '%Y-%m') AS month_group,
-                    DATE_FORMAT(transaction_date, '%b') AS month,
-                    SUM(amount) AS revenue
-                FROM transactions
-                WHERE transaction_date BETWEEN %s AND %s
-                GROUP BY month_group, month
-                ORDER BY month_group ASC
-            """
-
-            with self.connection.cursor(dictionary=True) as cursor:
-                cursor.execute(query, (start_date, end_date))
-                results = cursor.fetchall()
-
-            # Fill in missing months
-            all_months = {}
-            current_date = start_date
-            while current_date <= end_date:
-                month_key = current_date.strftime('%b')
-                all_months[month_key] = 0.0
-                current_date += timedelta(days=30)
-
-            for row in results:
-                all_months[row['month']] = float(row['revenue'])
-
-            return all_months
+            return self._get_monthly_series("revenue", months, float)
         except Error as err:
             logger.error(f"Error getting revenue trends: {err}")
             return {}
@@ -440,39 +886,105 @@ class DatabaseManager:
     def get_booking_trends(self, months: int = 6) -> Dict[str, int]:
         """Get booking trends for the last N months"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30 * months)
+            return self._get_monthly_series("bookings", months, int)
+        except Error as err:
+            logger.error(f"Error getting booking trends: {err}")
+            return {}
 
-            query = """
-                SELECT 
-                    DATE_FORMAT(created_at, '%Y-%m') AS month_group,
-                    DATE_FORMAT(created_at, '%b') AS month,
-                    COUNT(*) AS bookings
-                FROM reservations
-                WHERE created_at BETWEEN %s AND %s
-                GROUP BY month_group, month
-                ORDER BY month_group ASC
-            """
+    # ========== CHANGE FEED METHODS ==========
+    def get_change_version(self) -> Optional[int]:
+        """Latest change_log version (None if it could not be read)"""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("SELECT COALESCE(MAX(version), 0) FROM change_log")
+                return int(cursor.fetchone()[0])
+        except Error as err:
+            logger.error(f"Error reading change version: {err}")
+            return None
 
-            with self.connection.cursor(dictionary=True) as cursor:
-                cursor.execute(query, (start_date, end_date))
-                results = cursor.fetchall()
+    def get_change_marker(self) -> Optional[Tuple[int, int]]:
+        """(latest version, changes among the last CHANGE_LOOKBACK versions).
 
-            # Fill in missing months
-            all_months = {}
-            current_date = start_date
-            while current_date <= end_date:
-                month_key = current_date.strftime('%b')
-                all_months[month_key] = 0
-                current_date += timedelta(days=30)
+        Unlike the bare version, the marker also moves when a change with a
+        lower version commits after a higher one. None if it could not be read.
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    SELECT head.latest,
+                           (SELECT COUNT(*) FROM change_log WHERE version > head.latest - %s)
+                    FROM (SELECT COALESCE(MAX(version), 0) AS latest FROM change_log) AS head
+                """, (CHANGE_LOOKBACK,))
+                latest, recent = cursor.fetchone()
+                return int(latest), int(recent)
+        except Error as err:
+            logger.error(f"Error reading change marker: {err}")
+            return None
 
-            for row in results:
-                all_months[row['month']] = int(row['bookings'])
+    def get_changes_since(self, version: int, table_name: str,
+                          owner_id: Optional[int] = None) -> Tuple[Optional[int], Optional[List[Dict]]]:
+        """Changes to ``table_name`` after ``version``, oldest first.
+
+        ``owner_id`` limits the feed to one owner's rows (reservations by
+        user); None returns every row's changes.
+
+        Returns (latest version, changes). ``changes`` is None when the
+        caller must reload everything instead: the feed was pruned past
+        ``version``, there are more than CHANGE_FEED_LIMIT changes, or the
+        feed could not be read.
+        """
+        owner_filter = "AND owner_id = %s" if owner_id is not None else ""
+        query = f"""
+            (SELECT 'head' AS kind, COALESCE(MAX(version), 0) AS version,
+                    COALESCE(MIN(version), 0) AS row_key, NULL AS operation
+            FROM change_log)
+            UNION ALL
+            (SELECT 'change', version, row_key, operation
+            FROM change_log
+            WHERE table_name = %s {owner_filter} AND version > %s
+            ORDER BY version
+            LIMIT %s)
+        """
+        params = (table_name,) + ((owner_id,) if owner_id is not None else ()) + (version, CHANGE_FEED_LIMIT + 1)
 
-            return all_months
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
         except Error as err:
-            logger.error(f"Error getting booking trends: {err}")
-            return {}
+            logger.error(f"Error reading change feed: {err}")
+            return None, None
+
+        # UNION ALL does not keep the subquery order, so split by kind
+        head = next(r for r in rows if r["kind"] == "head")
+        latest, oldest = int(head["version"]), int(head["row_key"])
+        changes = sorted(
+            ({"version": int(r["version"]), "row_key": r["row_key"], "operation": r["operation"]}
+             for r in rows if r["kind"] == "change"),
+            key=lambda c: c["version"]
+        )
+
+        if (oldest and version < oldest - 1) or len(changes) > CHANGE_FEED_LIMIT:
+            return latest, None
+        return latest, changes
+
+    def prune_change_log(self, keep_days: int = 7, batch_size: int = 10000) -> int:
+        """Delete change_log rows older than ``keep_days`` in small batches"""
+        deleted = 0
+        try:
+            while True:
+                with self._cursor() as cursor:
+                    cursor.execute(
+                        "DELETE FROM change_log WHERE changed_at < NOW() - INTERVAL %s DAY LIMIT %s",
+                        (keep_days, batch_size)
+                    )
+                    count = cursor.rowcount
+                deleted += count
+                if count < batch_size:
+                    return deleted
+        except Error as err:
+            logger.error(f"Error pruning change log: {err}")
+            return deleted
 
     # ========== CUSTOMER MANAGEMENT METHODS ==========
     def get_customers(self, status_filter: str = "all") -> List[Dict]:
@@ -487,7 +999,7 @@ class DatabaseManager:
 
             query += " ORDER BY full_name ASC"
 
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute(query, params)
                 return cursor.fetchall()
 
@@ -495,10 +1007,60 @@ class DatabaseManager:
             logger.error(f"Error fetching customers: {err}")
             return []
 
+    def get_customers_page(
+            self,
+            after_key: Optional[Tuple[str, str]] = None,
+            limit: int = 100,
+            status_filter: str = "all",
+            before_key: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict]:
+        """Get one page of customers ordered by (full_name, customer_id).
+
+        Pass the key of the last row seen as ``after_key`` for the next page,
+        or the key of the first row as ``before_key`` for the previous one.
+        Rows always come back in ascending order.
+        """
+        conditions = []
+        params = []
+
+        if status_filter.lower() != "all":
+            conditions.append("status = %s")
+            params.append(status_filter.capitalize())
+
+        if before_key is not None:
+            conditions.append("(full_name, customer_id) < (%s, %s)")
+            params.extend(before_key)
+            order = "DESC"
+        else:
+            if after_key is not None:
+                conditions.append("(full_name, customer_id) > (%s, %s)")
+                params.extend(after_key)
+            order = "ASC"
+
+        query = "SELECT customer_id, full_name, email, address, phone, status FROM customers"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY full_name {order}, customer_id {order} LIMIT %s"
+        params.append(limit)
+
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(query, tuple(params))
+                rows = cursor.fetchall()
+        except Error as err:
+            logger.error(f"Error fetching customers page: {err}")
+            return []
+
+        if before_key is not None:
+            rows.reverse()
+        return rows
+
     def add_customer(self, customer_data: Dict) -> bool:
-        """Add a new customer to the database"""
+        """Add a new customer; a missing ``customer_id`` is allocated and written back"""
+        if not self._assign_id(customer_data, "customer_id", "customers"):
+            return False
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(
                     """
                     INSERT INTO customers 
@@ -514,7 +1076,9 @@ class DatabaseManager:
                         customer_data["status"],
                     ),
                 )
-                return True
+            self.invalidate_dashboard_cache()
+            _patch_recent_customers(customer_data["customer_id"], customer_data, added=True)
+            return True
         except Error as err:
             logger.error(f"Error adding customer: {err}")
             return False
@@ -522,7 +1086,7 @@ class DatabaseManager:
     def update_customer(self, customer_id: str, updated_data: Dict) -> bool:
         """Update an existing customer"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(
                     """
                     UPDATE customers SET
@@ -542,7 +1106,11 @@ class DatabaseManager:
                         customer_id,
                     ),
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+            self.invalidate_dashboard_cache()
+            if updated:
+                _patch_recent_customers(customer_id, updated_data)
+            return updated
         except Error as err:
             logger.error(f"Error updating customer: {err}")
             return False
@@ -550,7 +1118,7 @@ class DatabaseManager:
     def delete_customer(self, customer_id: str) -> bool:
         """Delete a customer from the database"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(
                     """
                     DELETE FROM customers 
@@ -558,13 +1126,44 @@ class DatabaseManager:
                     """,
                     (customer_id,),
                 )
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
+            self.invalidate_dashboard_cache()
+            if deleted:
+                _patch_recent_customers(customer_id)
+            return deleted
         except Error as err:
             logger.error(f"Error deleting customer: {err}")
             return False
 
     def search_customers(self, search_query: str) -> List[Dict]:
         """Search customers by name, email, address or phone"""
+        phrase = _fulltext_phrase(search_query)
+        if phrase is None:
+            return self._search_customers_like(search_query)
+
+        # Separate MATCHes on the two indexes (email has its own collation);
+        # OR-ing them in one WHERE would bypass both indexes
+        query = """
+            SELECT customer_id, full_name, email, address, phone, status
+            FROM customers
+            WHERE MATCH(full_name, address, phone) AGAINST (%s IN BOOLEAN MODE)
+            UNION
+            SELECT customer_id, full_name, email, address, phone, status
+            FROM customers
+            WHERE MATCH(email) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY full_name ASC
+        """
+
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(query, (phrase, phrase))
+                return cursor.fetchall()
+        except Error as err:
+            logger.error(f"Error searching customers: {err}")
+            return []
+
+    def _search_customers_like(self, search_query: str) -> List[Dict]:
+        """Leading-wildcard LIKE search (short queries / SEARCH_BACKEND=like)"""
         try:
             query = """
                 SELECT customer_id, full_name, email, address, phone, status 
@@ -577,7 +1176,7 @@ class DatabaseManager:
             """
             search_param = f"%{search_query}%"
 
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute(
                     query,
                     (search_param, search_param, search_param, search_param)
@@ -587,6 +1186,321 @@ class DatabaseManager:
             logger.error(f"Error searching customers: {err}")
             return []
 
+    # ========== RESERVATION METHODS ==========
+    def get_reservations(self, user_id: int, reservation_ids: Optional[List[str]] = None) -> List[Reservation]:
+        """Get a user's reservations, newest check-in first, as typed records.
+
+        ``reservation_ids`` limits the result to those rows (used to apply
+        change-feed deltas).
+        """
+        query = """
+            SELECT 
+                reservation_id, guest_name, checkin_date, booking_amount
+            FROM reservations
+            WHERE user_id = %s
+        """
+        params = (user_id,)
+        if reservation_ids is not None:
+            if not reservation_ids:
+                return []
+            query += f" AND reservation_id IN ({', '.join(['%s'] * len(reservation_ids))})"
+            params += tuple(reservation_ids)
+        query += " ORDER BY checkin_date DESC"
+
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(query, params)
+                return [Reservation._make(row) for row in cursor.fetchall()]
+        except Error as err:
+            logger.error(f"Error fetching reservations: {err}")
+            return []
+
+    def add_reservation(self, user_id: int, reservation_data: Dict) -> bool:
+        """Add a new reservation for a user (optionally with room_id and checkout_date).
+
+        Without a ``reservation_id`` one is allocated and written back into
+        ``reservation_data``.
+        """
+        if not self._assign_id(reservation_data, "reservation_id", "reservations"):
+            return False
+        columns = ["reservation_id", "user_id", "guest_name", "checkin_date", "booking_amount"]
+        values = [
+            reservation_data["reservation_id"],
+            user_id,
+            reservation_data["guest_name"],
+            reservation_data["checkin_date"],
+            reservation_data["booking_amount"],
+        ]
+        for optional in ("room_id", "checkout_date"):
+            if reservation_data.get(optional) is not None:
+                columns.append(optional)
+                values.append(reservation_data[optional])
+
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO reservations 
+                    ({', '.join(columns)})
+                    VALUES ({', '.join(['%s'] * len(columns))})
+                    """,
+                    values,
+                )
+            self.invalidate_dashboard_cache()
+            _index_booking(reservation_data["reservation_id"], reservation_data)
+            return True
+        except Error as err:
+            logger.error(f"Error adding reservation: {err}")
+            return False
+
+    def update_reservation(self, user_id: int, reservation_id: str, updated_data: Dict) -> bool:
+        """Update guest, check-in date and amount (and room_id/checkout_date if given)"""
+        assignments = ["guest_name = %s", "checkin_date = %s", "booking_amount = %s"]
+        values = [
+            updated_data["guest_name"],
+            updated_data["checkin_date"],
+            updated_data["booking_amount"],
+        ]
+        for optional in ("room_id", "checkout_date"):
+            if optional in updated_data:
+                assignments.append(f"{optional} = %s")
+                values.append(updated_data[optional])
+
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE reservations 
+                    SET {', '.join(assignments)}
+                    WHERE reservation_id = %s AND user_id = %s
+                    """,
+                    values + [reservation_id, user_id],
+                )
+                updated = cursor.rowcount > 0
+        except Error as err:
+            logger.error(f"Error updating reservation: {err}")
+            return False
+
+        self.invalidate_dashboard_cache()
+        if updated and _availability is not None:
+            # The form may not carry room_id/checkout_date, so index the full row
+            try:
+                self._apply_booking_changes(_availability, [{"row_key": reservation_id}])
+            except Error as err:
+                logger.error(f"Error re-indexing reservation {reservation_id}: {err}")
+        return updated
+
+    def delete_reservation(self, user_id: int, reservation_id: str) -> bool:
+        """Delete one of a user's reservations"""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(
+                    """
+                    DELETE FROM reservations 
+                    WHERE reservation_id = %s AND user_id = %s
+                    """,
+                    (reservation_id, user_id),
+                )
+                deleted = cursor.rowcount > 0
+            self.invalidate_dashboard_cache()
+            if deleted and _availability is not None:
+                _availability.remove(reservation_id)
+            return deleted
+        except Error as err:
+            logger.error(f"Error deleting reservation: {err}")
+            return False
+
+    # ========== BULK IMPORT METHODS ==========
+    def import_rows(self, table: str, columns: Tuple[str, ...], rows: List[Tuple],
+                    key_columns: Tuple[str, ...] = (), owner_column: Optional[str] = None,
+                    batch_size: int = 1000) -> List[Tuple[int, str]]:
+        """Upsert ``rows`` with multi-row statements inside one transaction.
+
+        Rows matching an existing primary or unique key update every column
+        except ``key_columns``; with ``owner_column`` (one of the key
+        columns) an existing row owned by someone else is left unchanged.
+        If the transaction fails (a dangling foreign key, say) it is rolled
+        back and the rows are retried one at a time, so only the offending
+        rows are lost. Returns (row index, error) for every row that was not
+        written.
+        """
+        placeholders = ", ".join(["%s"] * len(columns))
+        if owner_column:
+            updates = ", ".join(
+                f"{c} = IF({owner_column} = VALUES({owner_column}), VALUES({c}), {c})"
+                for c in columns if c not in key_columns
+            )
+        else:
+            updates = ", ".join(f"{c} = VALUES({c})" for c in columns if c not in key_columns)
+        # Nothing to update: a no-op assignment keeps duplicates from failing
+        # without INSERT IGNORE also hiding foreign key errors
+        updates = updates or f"{key_columns[0]} = {key_columns[0]}"
+        statement = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON DUPLICATE KEY UPDATE {updates}"
+        )
+
+        try:
+            with self.borrow() as conn:
+                try:
+                    conn.start_transaction()
+                    with conn.cursor() as cursor:
+                        for start in range(0, len(rows), batch_size):
+                            cursor.executemany(statement, rows[start:start + batch_size])
+                    conn.commit()
+                    return []
+                except Error as err:
+                    conn.rollback()
+                    logger.warning(f"Import chunk into {table} failed ({err}); retrying row by row")
+
+                failures = []
+                with conn.cursor() as cursor:
+                    for index, row in enumerate(rows):
+                        try:
+                            cursor.execute(statement, row)
+                        except Error as err:
+                            failures.append((index, str(err)))
+                return failures
+        except Error as err:
+            logger.error(f"Error importing into {table}: {err}")
+            return [(index, str(err)) for index in range(len(rows))]
+
+    def find_existing(self, table: str, match_columns: Tuple[str, ...], keys: List[Tuple],
+                      columns: Tuple[str, ...], batch_size: int = 500) -> Optional[List[Dict]]:
+        """Rows of ``table`` whose ``match_columns`` equal one of ``keys``.
+
+        Values are compared NULL-safely. Each row holds ``columns`` plus the
+        match columns. Returns None if the lookup failed.
+        """
+        condition = "(" + " AND ".join(f"{c} <=> %s" for c in match_columns) + ")"
+        select = ", ".join(dict.fromkeys(columns + match_columns))
+        keys = list(dict.fromkeys(keys))
+        found = []
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                for start in range(0, len(keys), batch_size):
+                    batch = keys[start:start + batch_size]
+                    cursor.execute(
+                        f"SELECT {select} FROM {table} WHERE {' OR '.join([condition] * len(batch))}",
+                        [value for key in batch for value in key],
+                    )
+                    found.extend(cursor.fetchall())
+            return found
+        except Error as err:
+            logger.error(f"Error looking up existing {table} rows: {err}")
+            return None
+
+    def invalidate_caches(self) -> None:
+        """Drop cached dashboard KPIs and recent customers after a bulk write"""
+        _dashboard_cache.invalidate()
+        _recent_customers_cache.invalidate()
+
+    # ========== ROOM AVAILABILITY METHODS ==========
+    def get_rooms(self) -> List[Dict]:
+        """Get every room with its type"""
+        try:
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT r.room_id, r.room_number, r.floor, r.status,
+                           t.name AS room_type, t.base_rate, t.capacity
+                    FROM rooms r
+                    JOIN room_types t ON r.type_id = t.type_id
+                    ORDER BY r.room_number
+                """)
+                return cursor.fetchall()
+        except Error as err:
+            logger.error(f"Error fetching rooms: {err}")
+            return []
+
+    def add_room(self, room_number: str, room_type: str, floor: Optional[int] = None) -> bool:
+        """Add a room of an existing room type"""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO rooms (room_number, type_id, floor)
+                    SELECT %s, type_id, %s FROM room_types WHERE name = %s
+                    """,
+                    (room_number, floor, room_type),
+                )
+                added = cursor.rowcount > 0
+            if added and _availability is not None:
+                _availability.set_rooms(r for r in self.get_rooms() if r["room_number"] == room_number)
+            return added
+        except Error as err:
+            logger.error(f"Error adding room: {err}")
+            return False
+
+    def find_available_rooms(self, checkin_date, checkout_date, room_type: Optional[str] = None) -> List[Dict]:
+        """Rooms with no active booking overlapping [checkin_date, checkout_date)"""
+        index = self._availability_index()
+        if index is None:
+            return []
+        return index.find_available_rooms(checkin_date, checkout_date, room_type)
+
+    def _availability_index(self) -> Optional[AvailabilityIndex]:
+        """Build the index on first use, then catch up with the change feed"""
+        global _availability, _availability_version
+        with _availability_lock:
+            if _availability is not None:
+                latest, changes = self.get_changes_since(_availability_version, "reservations")
+                if latest is None:
+                    return _availability  # Feed unreadable; serve what we have
+                if changes is not None:
+                    self._apply_booking_changes(_availability, changes)
+                    _availability_version = latest
+                    return _availability
+
+            started = time.perf_counter()
+            version = self.get_change_version()
+            index = AvailabilityIndex()
+            try:
+                index.set_rooms(self.get_rooms())
+                with self._cursor() as cursor:
+                    cursor.execute("""
+                        SELECT reservation_id, room_id, checkin_date, checkout_date
+                        FROM reservations
+                        WHERE room_id IS NOT NULL AND fulfillment_status <> 'Cancelled'
+                    """)
+                    while True:
+                        rows = cursor.fetchmany(50000)
+                        if not rows:
+                            break
+                        index.load(rows)
+            except Error as err:
+                logger.error(f"Error building availability index: {err}")
+                return _availability
+
+            _availability, _availability_version = index, version or 0
+            logger.info(
+                f"Availability index built with {len(index):,} bookings in "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+            return _availability
+
+    def _apply_booking_changes(self, index: AvailabilityIndex, changes: List[Dict]) -> None:
+        """Re-read the reservations named in ``changes`` and update ``index``"""
+        changed_ids = list({c["row_key"] for c in changes})
+        if not changed_ids:
+            return
+        with self._cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT reservation_id, room_id, checkin_date, checkout_date, fulfillment_status
+                FROM reservations
+                WHERE reservation_id IN ({', '.join(['%s'] * len(changed_ids))})
+                """,
+                changed_ids,
+            )
+            rows = {row[0]: row for row in cursor.fetchall()}
+
+        for reservation_id in changed_ids:
+            row = rows.get(reservation_id)
+            if row is None or row[1] is None or row[4] == "Cancelled":
+                index.remove(reservation_id)
+            else:
+                index.add(reservation_id, row[1], row[2], row[3])
+
     # ========== USER AUTHENTICATION METHODS ==========
     def register_user(
             self, full_name: str, email: str, password: str, gender: str
@@ -606,7 +1520,7 @@ class DatabaseManager:
             password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
             logger.debug(f"Registering user {email} with hash: {password_hash[:8]}...")
 
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 # Check if email exists
                 cursor.execute("SELECT 1 FROM users WHERE email = %s", (email,))
                 if cursor.fetchone():
@@ -618,11 +1532,10 @@ class DatabaseManager:
                     VALUES (%s, %s, %s, %s)""",
                     (full_name, email, password_hash, gender),
                 )
-
-                # Log the registration
                 user_id = cursor.lastrowid
-                self._log_auth_action(user_id, email, "register")
 
+            # Log the registration
+            self._log_auth_action(user_id, email, "register")
             return True, "Registration successful"
 
         except Error as err:
@@ -636,7 +1549,7 @@ class DatabaseManager:
             password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
             logger.debug(f"Auth attempt for {email} with hash: {password_hash[:8]}...")
 
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 # Get user with case-sensitive email comparison
                 cursor.execute(
                     """
@@ -651,33 +1564,44 @@ class DatabaseManager:
 
                 user = cursor.fetchone()
 
-                if user:
-                    self._log_auth_action(user["user_id"], email, "login")
-                    logger.info(f"Successful login for {email}")
-                    return user
-                else:
-                    self._log_auth_action(None, email, "fail")
-                    logger.warning(f"Failed login attempt for {email}")
-                    return None
+            if user:
+                self._log_auth_action(user["user_id"], email, "login")
+                logger.info(f"Successful login for {email}")
+                return user
+            else:
+                self._log_auth_action(None, email, "fail")
+                logger.warning(f"Failed login attempt for {email}")
+                return None
 
         except Error as err:
             logger.error(f"Authentication error for {email}: {err}")
             return None
 
-    def _log_auth_action(self, user_id: Optional[int], email: str, action: str) -> None:
-        """Log authentication attempts for security monitoring"""
+    def get_user_by_email(self, email: str) -> Optional[Dict]:
+        """Look up an active user by email (no password check; for admin tools)"""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor(dictionary=True) as cursor:
                 cursor.execute(
                     """
-                    INSERT INTO auth_logs 
-                    (user_id, email, action, ip_address, user_agent)
-                    VALUES (%s, %s, %s, %s, %s)
+                    SELECT user_id, full_name, email, gender
+                    FROM users
+                    WHERE email = %s AND is_active = TRUE
                     """,
-                    (user_id, email, action, "127.0.0.1", "Python App"),
+                    (email.strip().lower(),),
                 )
+                return cursor.fetchone()
         except Error as err:
-            logger.error(f"Failed to log auth action: {err}")
+            logger.error(f"Error fetching user {email}: {err}")
+            return None
+
+    def _log_auth_action(self, user_id: Optional[int], email: str, action: str) -> None:
+        """Queue an authentication event for the batched auth_logs writer"""
+        if not get_audit_writer().log(user_id, email, action, "127.0.0.1", "Python App"):
+            logger.warning(f"Audit log queue full; dropped {action} event for {email}")
+
+    def get_audit_stats(self) -> Dict[str, float]:
+        """Audit writer counters (queued, written, dropped, failed, flush latency)"""
+        return get_audit_writer().stats()
 
     def create_session(
             self, user_id: int, session_id: str, ip: str, user_agent: str, expires_at: str
@@ -689,7 +1613,7 @@ class DatabaseManager:
                 logger.error("Cannot create expired session")
                 return False
 
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(
                     """
                     INSERT INTO user_sessions 
@@ -705,12 +1629,19 @@ class DatabaseManager:
             return False
 
     def verify_session(self, session_id: str) -> Optional[Dict]:
-        """Verify if session is valid and return user data"""
+        """Verify if session is valid and return user data (cached until expiry)"""
+        cached = _session_cache.get(session_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            with self.connection.cursor(dictionary=True) as cursor:
+            with self._cursor(dictionary=True) as cursor:
+                # Seconds left are computed by the server so client clock
+                # skew cannot stretch a session
                 cursor.execute(
                     """
-                    SELECT u.user_id, u.full_name, u.email, u.gender
+                    SELECT u.user_id, u.full_name, u.email, u.gender,
+                           TIMESTAMPDIFF(SECOND, NOW(), s.expires_at) AS expires_in
                     FROM user_sessions s
                     JOIN users u ON s.user_id = u.user_id
                     WHERE s.session_id = %s 
@@ -720,20 +1651,60 @@ class DatabaseManager:
                     (session_id,),
                 )
 
-                return cursor.fetchone()
+                user = cursor.fetchone()
         except Error as err:
             logger.error(f"Session verification error: {err}")
             return None
 
+        if user is None:
+            return None
+        expires_in = user.pop("expires_in")
+        if expires_in > 0:
+            _session_cache.set(session_id, user, ttl=min(SESSION_CACHE_TTL, expires_in))
+        return dict(user)
+
+    def end_session(self, session_id: str) -> bool:
+        """Delete a session (logout) and drop it from the cache"""
+        _session_cache.invalidate(session_id)
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("DELETE FROM user_sessions WHERE session_id = %s", (session_id,))
+                return cursor.rowcount > 0
+        except Error as err:
+            logger.error(f"Session deletion error: {err}")
+            return False
+
+    def purge_expired_sessions(self, batch_size: int = 1000, max_batches: int = 100) -> int:
+        """Delete expired sessions in bounded batches; returns the rows deleted.
+
+        Each batch is its own short statement so the purge never holds
+        locks on user_sessions for long. Stops after ``max_batches``; the
+        next run picks up the rest.
+        """
+        deleted = 0
+        try:
+            for _ in range(max_batches):
+                with self._cursor() as cursor:
+                    cursor.execute(
+                        "DELETE FROM user_sessions WHERE expires_at <= NOW() LIMIT %s",
+                        (batch_size,)
+                    )
+                    count = cursor.rowcount
+                deleted += count
+                if count < batch_size:
+                    break
+        except Error as err:
+            logger.error(f"Session purge error: {err}")
+        if deleted:
+            logger.info(f"Purged {deleted} expired sessions")
+        return deleted
+
     def close(self) -> None:
-        """Close connection with proper resource cleanup"""
-        if self.connection and self.connection.is_connected():
-            try:
-                self.connection.close()
-                logger.info("Database connection closed")
-            except Error as err:
-                logger.error(f"Error closing connection: {err}")
-        self.connection = None
+        """Release this manager; pooled connections stay open for other screens.
+
+        Call close_connection_pool() once at process shutdown instead.
+        """
+        logger.debug("DatabaseManager released")
 
     def __enter__(self):
         """Context manager entry"""
@@ -744,6 +1715,10 @@ class DatabaseManager:
         self.close()
 
 
+# Label every query with the public DatabaseManager method that issued it
+instrument_methods(DatabaseManager, exclude=("borrow", "get_pool_stats", "get_audit_stats", "close"))
+
+
 def hash_password(password: str) -> str:
     """Standardized password hashing using SHA-256 with UTF-8 encoding"""
     return hashlib.sha256(password.encode("utf-8")).hexdigest()
@@ -758,31 +1733,63 @@ def populate_test_data(db):
     db.register_user("Admin User", "admin@example.com", "admin123", "Male")
 
     # Add sample customers
-    for i in range(1, 101):
-        customer_id = f"CUST{1000 + i}"
-        db.add_customer(
-            {
-                "customer_id": customer_id,
-                "full_name": f"Customer {i}",
-                "email": f"customer{i}@example.com",
-                "address": f"{random.randint(1, 1000)} Main St",
-                "phone": f"({random.randint(100, 999)}) {random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                "status": "Active" if random.random() > 0.2 else "Inactive",
-            }
+    customers = [
+        (
+            f"CUST{1000 + i}",
+            f"Customer {i}",
+            f"customer{i}@example.com",
+            f"{random.randint(1, 1000)} Main St",
+            f"({random.randint(100, 999)}) {random.randint(100, 999)}-{random.randint(1000, 9999)}",
+            "Active" if random.random() > 0.2 else "Inactive",
         )
+        for i in range(1, 101)
+    ]
 
     # Add sample reservations
+    reservations = []
     for i in range(200):
-        reservation_id = f"RES{10000 + i}"
-        user_id = 1  # Admin user
-        guest_name = f"Guest {i}"
         checkin_date = datetime.now() + timedelta(days=random.randint(1, 30))
-        checkout_date = checkin_date + timedelta(days=random.randint(1, 14))
-        booking_amount = random.randint(50, 500)
-        payment_status = random.choice(["Paid", "Pending", "Cancelled"])
-        fulfillment_status = random.choice(["Confirmed", "Pending", "Cancelled"])
+        reservations.append((
+            f"RES{10000 + i}",
+            1,  # Admin user
+            f"Guest {i}",
+            checkin_date,
+            checkin_date + timedelta(days=random.randint(1, 14)),
+            random.randint(50, 500),
+            random.choice(["Paid", "Pending", "Cancelled"]),
+            random.choice(["Confirmed", "Pending", "Cancelled"]),
+        ))
+
+    # Add sample transactions
+    transactions = [
+        (
+            f"CUST{random.randint(1001, 1100)}",
+            f"RES{random.randint(10000, 10199)}",
+            random.randint(50, 500),
+            datetime.now() - timedelta(days=random.randint(0, 180)),
+        )
+        for _ in range(200)
+    ]
 
-        db.connection.cursor().execute(
+    # Add sample occupancy data
+    start_date = datetime.now() - timedelta(days=180)
+    occupancy = [
+        ((start_date + timedelta(days=i)).date(), random.randint(70, 95), 100)
+        for i in range(180)
+    ]
+
+    # One multi-row INSERT per table on a single borrowed connection
+    with db.borrow() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            """
+            INSERT INTO customers
+            (customer_id, full_name, email, address, phone, status)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            customers,
+        )
+        cursor.executemany(
             """
             INSERT INTO reservations (
                 reservation_id, user_id, guest_name, 
@@ -790,42 +1797,16 @@ def populate_test_data(db):
                 payment_status, fulfillment_status
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """,
-            (
-                reservation_id,
-                user_id,
-                guest_name,
-                checkin_date,
-                checkout_date,
-                booking_amount,
-                payment_status,
-                fulfillment_status,
-            ),
+            reservations,
         )
-
-    # Add sample transactions
-    for i in range(200):
-        amount = random.randint(50, 500)
-        days_ago = random.randint(0, 180)
-        transaction_date = datetime.now() - timedelta(days=days_ago)
-        customer_id = f"CUST{random.randint(1001, 1100)}"
-        reservation_id = f"RES{random.randint(10000, 10199)}"
-
-        db.connection.cursor().execute(
+        cursor.executemany(
             """
             INSERT INTO transactions (customer_id, reservation_id, amount, transaction_date)
             VALUES (%s, %s, %s, %s)
             """,
-            (customer_id, reservation_id, amount, transaction_date),
+            transactions,
         )
-
-    # Add sample occupancy data
-    start_date = datetime.now() - timedelta(days=180)
-    for i in range(180):
-        date = start_date + timedelta(days=i)
-        occupied = random.randint(70, 95)
-        total = 100
-
-        db.connection.cursor().execute(
+        cursor.executemany(
             """
             INSERT INTO room_occupancy (date, occupied_rooms, total_rooms)
             VALUES (%s, %s, %s)
@@ -833,9 +1814,14 @@ def populate_test_data(db):
                 occupied_rooms = VALUES(occupied_rooms),
                 total_rooms = VALUES(total_rooms)
             """,
-            (date.date(), occupied, total),
+            occupancy,
         )
 
+        conn.commit()
+        cursor.close()
+    db.invalidate_dashboard_cache()
+    _recent_customers_cache.invalidate()
+
     # Add sample staff members
     for i in range(1, 11):
         staff_id = f"STAFF{100 + i}"
@@ -849,7 +1835,6 @@ def populate_test_data(db):
             "password": hash_password(f"staff{i}pass")
         })
 
-    db.connection.commit()
     print("Test data populated successfully")
 
 
@@ -0,0 +1,319 @@
+import os
+import re
+import time
+import logging
+import hashlib
+import threading
+import functools
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is +Inf)
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+SLOW_LOG_SIZE = 200
+
+_context = threading.local()
+_WHITESPACE = re.compile(r"\s+")
+
+
+def current_operation() -> str:
+    """Name of the DatabaseManager method running on this thread"""
+    return getattr(_context, "operation", None) or "unattributed"
+
+
+def instrument_methods(cls, exclude=()):
+    """Attribute every query made inside a public method of ``cls`` to that method.
+
+    Nested calls keep the outermost name, so helpers such as
+    ``_get_monthly_series`` are reported under the public method that
+    called them.
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name in exclude or not callable(attr):
+            continue
+        setattr(cls, name, _with_operation(name, attr))
+    return cls
+
+
+def _with_operation(name, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if getattr(_context, "operation", None):
+            return method(*args, **kwargs)
+        _context.operation = name
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _context.operation = None
+    return wrapper
+
+
+def statement_fingerprint(statement: str) -> str:
+    """Stable id for a statement's text (whitespace-insensitive)"""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+def params_fingerprint(params) -> str:
+    """Shape of the parameters without their values (no PII in the slow log)"""
+    if params is None:
+        return "()"
+    if isinstance(params, dict):
+        params = params.values()
+    shapes = []
+    for value in params:
+        if isinstance(value, (str, bytes)):
+            shapes.append(f"{type(value).__name__}({len(value)})")
+        else:
+            shapes.append(type(value).__name__)
+    return f"({', '.join(shapes)})"
+
+
+def _row_bytes(row) -> int:
+    """Approximate wire size of a fetched row"""
+    values = row.values() if isinstance(row, dict) else row
+    size = 0
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (str, bytes, bytearray)):
+            size += len(value)
+        else:
+            size += 8
+    return size
+
+
+class QueryMetrics:
+    """Process-wide per-method query statistics"""
+
+    def __init__(self, slow_query_ms: float = SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._methods: Dict[str, Dict[str, Any]] = {}
+        self._slow_log = deque(maxlen=SLOW_LOG_SIZE)
+        self.started_at = datetime.now()
+
+    def _method(self, name: str) -> Dict[str, Any]:
+        stats = self._methods.get(name)
+        if stats is None:
+            stats = {
+                "count": 0,
+                "sum_ms": 0.0,
+                "max_ms": 0.0,
+                "buckets": [0] * (len(BUCKETS_MS) + 1),
+                "rows": 0,
+                "bytes": 0,
+                "errors": 0,
+            }
+            self._methods[name] = stats
+        return stats
+
+    def record(self, method: str, statement: str, params, elapsed_ms: float, rows: int, size: int) -> None:
+        with self._lock:
+            stats = self._method(method)
+            stats["count"] += 1
+            stats["sum_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["rows"] += rows
+            stats["bytes"] += size
+            for i, bound in enumerate(BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    stats["buckets"][i] += 1
+                    break
+            else:
+                stats["buckets"][-1] += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            entry = {
+                "time": datetime.now().strftime("%H:%M:%S"),
+                "method": method,
+                "ms": round(elapsed_ms, 1),
+                "fingerprint": statement_fingerprint(statement),
+                "params": params_fingerprint(params),
+                "statement": _WHITESPACE.sub(" ", statement).strip()[:200],
+            }
+            with self._lock:
+                self._slow_log.append(entry)
+            logger.warning(
+                f"Slow query in {method}: {entry['ms']} ms "
+                f"[{entry['fingerprint']} {entry['params']}]"
+            )
+
+    def record_error(self, method: str, err: Exception) -> None:
+        with self._lock:
+            self._method(method)["errors"] += 1
+
+    # ========== READING ==========
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method stats with p50/p95/p99 estimated from the histogram"""
+        with self._lock:
+            methods = {name: dict(stats, buckets=list(stats["buckets"])) for name, stats in self._methods.items()}
+        for stats in methods.values():
+            for label, q in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+                stats[label] = self._quantile(stats, q)
+            stats["mean_ms"] = stats["sum_ms"] / stats["count"] if stats["count"] else 0.0
+        return methods
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Most recent slow queries, newest first"""
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+            self._slow_log.clear()
+            self.started_at = datetime.now()
+
+    @staticmethod
+    def _quantile(stats: Dict[str, Any], q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation"""
+        if not stats["count"]:
+            return 0.0
+        target = q * stats["count"]
+        seen = 0
+        for i, count in enumerate(stats["buckets"]):
+            seen += count
+            if seen >= target:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else stats["max_ms"]
+        return stats["max_ms"]
+
+    # ========== EXPORT ==========
+    def to_prometheus(self, pool_stats: Optional[Dict[str, float]] = None) -> str:
+        """Render the metrics in the Prometheus text exposition format"""
+        lines = [
+            "# HELP hotel_db_query_duration_seconds Query latency per DatabaseManager method",
+            "# TYPE hotel_db_query_duration_seconds histogram",
+        ]
+        methods = self.snapshot()
+        for name, stats in sorted(methods.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS_MS, stats["buckets"]):
+                cumulative += count
+                lines.append(
+                    f'hotel_db_query_duration_seconds_bucket{{method="{name}",le="{bound / 1000:g}"}} {cumulative}'
+                )
+            lines.append(f'hotel_db_query_duration_seconds_bucket{{method="{name}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'hotel_db_query_duration_seconds_sum{{method="{name}"}} {stats["sum_ms"] / 1000:.6f}')
+            lines.append(f'hotel_db_query_duration_seconds_count{{method="{name}"}} {stats["count"]}')
+
+        for metric, key, help_text in (
+                ("hotel_db_rows_fetched_total", "rows", "Rows fetched per method"),
+                ("hotel_db_bytes_fetched_total", "bytes", "Approximate bytes fetched per method"),
+                ("hotel_db_query_errors_total", "errors", "Failed statements per method"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in sorted(methods.items()):
+                lines.append(f'{metric}{{method="{name}"}} {stats[key]}')
+
+        if pool_stats:
+            lines.append("# HELP hotel_db_pool Connection pool counters and occupancy")
+            lines.append("# TYPE hotel_db_pool gauge")
+            for key, value in sorted(pool_stats.items()):
+                lines.append(f'hotel_db_pool{{stat="{key}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: str, pool_stats: Optional[Dict[str, float]] = None) -> str:
+        """Atomically write the Prometheus text to ``path`` (for node_exporter's textfile collector)"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(self.to_prometheus(pool_stats))
+        os.replace(temp_path, path)
+        return path
+
+
+# Shared by every DatabaseManager in the process
+metrics = QueryMetrics()
+
+
+class InstrumentedCursor:
+    """Cursor proxy that times statements (including their fetches) and counts rows/bytes"""
+
+    def __init__(self, cursor, registry: QueryMetrics = metrics):
+        self._cursor = cursor
+        self._registry = registry
+        self._pending = None  # [method, statement, params, elapsed_ms, rows, bytes]
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def _timed(self, statement, params, call):
+        self._flush()
+        method = current_operation()
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as err:
+            self._registry.record_error(method, err)
+            raise
+        self._pending = [method, statement, params, (time.perf_counter() - started) * 1000, 0, 0]
+        if not getattr(self._cursor, "with_rows", True):
+            self._flush()
+        return result
+
+    def execute(self, statement, params=None, *args, **kwargs):
+        return self._timed(statement, params,
+                           lambda: self._cursor.execute(statement, params, *args, **kwargs))
+
+    def executemany(self, statement, seq_params, *args, **kwargs):
+        return self._timed(statement, None,
+                           lambda: self._cursor.executemany(statement, seq_params, *args, **kwargs))
+
+    def _fetch(self, call, many):
+        started = time.perf_counter()
+        result = call()
+        if self._pending is not None:
+            rows = result if many else ([result] if result is not None else [])
+            self._pending[3] += (time.perf_counter() - started) * 1000
+            self._pending[4] += len(rows)
+            self._pending[5] += sum(_row_bytes(row) for row in rows)
+        return result
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone, many=False)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall, many=True)
+
+    def fetchmany(self, size=1):
+        return self._fetch(lambda: self._cursor.fetchmany(size), many=True)
+
+    def _flush(self):
+        if self._pending is not None:
+            self._registry.record(*self._pending)
+            self._pending = None
+
+    def close(self):
+        self._flush()
+        return self._cursor.close()
+
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors are instrumented"""
+
+    def __init__(self, conn, registry: QueryMetrics = metrics):
+        self._conn = conn
+        self._registry = registry
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs), self._registry)
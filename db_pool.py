@@ -0,0 +1,205 @@
+import threading
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(RuntimeError):
+    """Raised when no connection could be checked out before the timeout"""
+
+
+class ConnectionPool:
+    """Thread-safe pool of database connections shared by the whole process.
+
+    Connections are created lazily by ``factory`` up to ``size``. Every
+    checkout validates the connection (``is_connected()`` pings the server)
+    and connections that sat idle longer than ``idle_timeout`` seconds are
+    closed instead of being handed out again.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], object],
+            size: int = 5,
+            idle_timeout: float = 300.0,
+            checkout_timeout: float = 30.0,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self._factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()  # (connection, released_at) pairs, most recent on the right
+        self._open = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._counters = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time_ms": 0.0,
+            "failed_validations": 0,
+            "created": 0,
+            "evicted_idle": 0,
+        }
+
+    # ========== CHECKOUT / RELEASE ==========
+    def acquire(self):
+        """Check out a healthy connection, waiting if the pool is exhausted"""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        wait_started = None
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                stale = self._evict_idle_locked()
+
+                conn = None
+                create = False
+                if self._idle:
+                    conn, _ = self._idle.pop()
+                elif self._open < self.size:
+                    self._open += 1
+                    create = True
+                else:
+                    if not waited:
+                        waited = True
+                        wait_started = time.monotonic()
+                        self._counters["waits"] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhaustedError(
+                            f"No database connection available after {self.checkout_timeout:.0f}s"
+                        )
+                    # Nothing was evicted on this branch: eviction frees a
+                    # slot, which would have taken the create path above
+                    self._cond.wait(remaining)
+                    continue
+
+            # Connect / validate / close outside the lock so slow network
+            # calls never block other threads returning connections
+            for stale_conn in stale:
+                self._close_quietly(stale_conn)
+
+            if create:
+                try:
+                    conn = self._factory()
+                except Exception:
+                    with self._cond:
+                        self._open -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._counters["created"] += 1
+            elif not self._validate(conn):
+                with self._cond:
+                    self._counters["failed_validations"] += 1
+                    self._open -= 1
+                    self._cond.notify()
+                self._close_quietly(conn)
+                continue
+
+            with self._cond:
+                self._counters["checkouts"] += 1
+                if waited:
+                    self._counters["wait_time_ms"] += (time.monotonic() - wait_started) * 1000
+            return conn
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Return a connection to the pool (or close it when ``discard`` is set)"""
+        with self._cond:
+            if self._closed or discard:
+                self._open -= 1
+                self._cond.notify()
+                close = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+                close = False
+        if close:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a ``with`` block"""
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            broken = not self._rollback_quietly(conn)
+            raise
+        finally:
+            self.release(conn, discard=broken)
+
+    # ========== MAINTENANCE ==========
+    def stats(self) -> Dict[str, float]:
+        """Snapshot of pool counters and current occupancy"""
+        with self._cond:
+            snapshot = dict(self._counters)
+            snapshot["size"] = self.size
+            snapshot["open"] = self._open
+            snapshot["idle"] = len(self._idle)
+            snapshot["in_use"] = self._open - len(self._idle)
+        return snapshot
+
+    def close(self) -> None:
+        """Close every idle connection and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+        logger.info("Connection pool closed")
+
+    def _evict_idle_locked(self) -> List[object]:
+        """Detach connections idle longer than ``idle_timeout`` (caller holds the lock)"""
+        stale = []
+        if not self.idle_timeout:
+            return stale
+        cutoff = time.monotonic() - self.idle_timeout
+        # The deque is ordered by release time, so stale entries sit on the left
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._open -= 1
+            self._counters["evicted_idle"] += 1
+            stale.append(conn)
+        if stale:
+            self._cond.notify_all()
+        return stale
+
+    @staticmethod
+    def _validate(conn) -> bool:
+        try:
+            return bool(conn.is_connected())
+        except Exception as err:
+            logger.warning(f"Pooled connection failed validation: {err}")
+            return False
+
+    @staticmethod
+    def _rollback_quietly(conn) -> bool:
+        try:
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Optional[object]) -> None:
+        try:
+            conn.close()
+        except Exception as err:
+            logger.debug(f"Ignoring error while closing pooled connection: {err}")
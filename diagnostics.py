@@ -0,0 +1,152 @@
+import os
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from db_metrics import metrics
+
+METRICS_FILE = os.getenv("DB_METRICS_FILE", "db_metrics.prom")
+REFRESH_MS = 2000
+
+METHOD_COLUMNS = [
+    ("method", "Method", 220),
+    ("count", "Queries", 80),
+    ("p50_ms", "p50 ms", 80),
+    ("p95_ms", "p95 ms", 80),
+    ("p99_ms", "p99 ms", 80),
+    ("max_ms", "Max ms", 80),
+    ("rows", "Rows", 90),
+    ("bytes", "Bytes", 100),
+    ("errors", "Errors", 70),
+]
+
+SLOW_COLUMNS = [
+    ("time", "Time", 80),
+    ("method", "Method", 180),
+    ("ms", "ms", 70),
+    ("fingerprint", "Fingerprint", 110),
+    ("params", "Parameters", 180),
+    ("statement", "Statement", 500),
+]
+
+
+class DiagnosticsScreen(ctk.CTkFrame):
+    """Hidden query diagnostics (Ctrl+Shift+D): per-method latency, slow log, pool"""
+
+    def __init__(self, parent, controller):
+        super().__init__(parent, fg_color="white")
+        self.controller = controller
+        self._refresh_job = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=3)
+        self.grid_rowconfigure(4, weight=2)
+
+        self.create_header()
+        self.method_tree = self.create_table(2, METHOD_COLUMNS)
+        ctk.CTkLabel(
+            self,
+            text="Slow queries (parameter shapes only)",
+            font=("Arial", 14, "bold"),
+            text_color="#2c3e50"
+        ).grid(row=3, column=0, sticky="w", padx=20, pady=(10, 0))
+        self.slow_tree = self.create_table(4, SLOW_COLUMNS)
+
+    def create_header(self):
+        header = ctk.CTkFrame(self, fg_color="white")
+        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 5))
+
+        ctk.CTkLabel(
+            header,
+            text="Database Diagnostics",
+            font=("Arial", 20, "bold"),
+            text_color="#2c3e50"
+        ).pack(side="left")
+
+        buttons = [
+            ("Back", "#64748b", "#475569", self.go_back),
+            ("Export Prometheus", "#0ea5e9", "#0284c7", self.export_metrics),
+            ("Reset", "#ef4444", "#dc2626", self.reset_metrics),
+            ("Refresh", "#10b981", "#059669", self.refresh),
+        ]
+        for text, color, hover, command in buttons:
+            ctk.CTkButton(
+                header,
+                text=text,
+                width=140,
+                fg_color=color,
+                hover_color=hover,
+                command=command
+            ).pack(side="right", padx=5)
+
+        self.summary_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Arial", 12),
+            text_color="#64748b",
+            anchor="w"
+        )
+        self.summary_label.grid(row=1, column=0, sticky="ew", padx=20)
+
+    def create_table(self, row, columns):
+        frame = ctk.CTkFrame(self, fg_color="white")
+        frame.grid(row=row, column=0, sticky="nsew", padx=20, pady=5)
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+
+        tree = ttk.Treeview(frame, columns=[c[0] for c in columns], show="headings")
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor="w")
+        y_scroll = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=y_scroll.set)
+        tree.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        return tree
+
+    # ========== DATA ==========
+    def refresh(self):
+        """Redraw from the in-process registry (no database round trip)"""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+        methods = metrics.snapshot()
+        self.method_tree.delete(*self.method_tree.get_children())
+        for name, stats in sorted(methods.items(), key=lambda item: item[1]["sum_ms"], reverse=True):
+            self.method_tree.insert("", "end", values=(
+                name, stats["count"], f"{stats['p50_ms']:g}", f"{stats['p95_ms']:g}",
+                f"{stats['p99_ms']:g}", f"{stats['max_ms']:.1f}", stats["rows"],
+                stats["bytes"], stats["errors"]
+            ))
+
+        self.slow_tree.delete(*self.slow_tree.get_children())
+        for entry in metrics.slow_queries():
+            self.slow_tree.insert("", "end", values=tuple(entry[c[0]] for c in SLOW_COLUMNS))
+
+        pool = self.controller.db.get_pool_stats()
+        total = sum(stats["count"] for stats in methods.values())
+        self.summary_label.configure(
+            text=f"{total} queries since {metrics.started_at:%H:%M:%S}   |   "
+                 f"slow threshold {metrics.slow_query_ms:g} ms   |   "
+                 + "   ".join(f"{key}: {value}" for key, value in sorted(pool.items()))
+        )
+
+        # Keep polling until the user leaves the screen
+        self._refresh_job = self.after(REFRESH_MS, self.refresh)
+
+    def reset_metrics(self):
+        metrics.reset()
+        self.refresh()
+
+    def export_metrics(self):
+        try:
+            path = metrics.export_prometheus(METRICS_FILE, self.controller.db.get_pool_stats())
+            messagebox.showinfo("Export", f"Metrics written to {os.path.abspath(path)}")
+        except OSError as err:
+            messagebox.showerror("Export", f"Could not write metrics: {err}")
+
+    def go_back(self):
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        target = "HotelBookingDashboard" if self.controller.current_user else "HotelBookingSystem"
+        self.controller.show_frame(target)
@@ -79,46 +79,55 @@ def populate_dashboard_data(db):
         db.connection.commit()
     
     # Generate 50 customers
+    customers = []
     for i in range(1, 51):
-        customer_id = f"CUST{1000 + i}"
         first_name = fake.first_name()
         last_name = fake.last_name()
-        
-        db.add_customer({
-            'customer_id': customer_id,
-            'full_name': f"{first_name} {last_name}",
-            'email': f"{first_name.lower()}.{last_name.lower()}@example.com",
-            'address': fake.address().replace("\n", ", "),
-            'phone': f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}",
-            'status': random.choice(['Active', 'Active', 'Active', 'Inactive'])
-        })
+        customers.append((
+            f"CUST{1000 + i}",
+            f"{first_name} {last_name}",
+            f"{first_name.lower()}.{last_name.lower()}@example.com",
+            fake.address().replace("\n", ", "),
+            f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}",
+            random.choice(['Active', 'Active', 'Active', 'Inactive'])
+        ))
     
     # Generate transactions for last 6 months
     end_date = datetime.now()
     start_date = end_date - timedelta(days=180)
     
-    for i in range(200):
-        amount = round(random.uniform(50, 500), 2)
-        days_ago = random.randint(0, 180)
-        transaction_date = end_date - timedelta(days=days_ago)
-        customer_id = f"CUST{random.randint(1001, 1050)}"
-        
-        db.connection.cursor().execute("""
-            INSERT INTO transactions (customer_id, amount, transaction_date)
-            VALUES (%s, %s, %s)
-        """, (customer_id, amount, transaction_date))
+    transactions = [
+        (
+            f"CUST{random.randint(1001, 1050)}",
+            round(random.uniform(50, 500), 2),
+            end_date - timedelta(days=random.randint(0, 180))
+        )
+        for _ in range(200)
+    ]
     
     # Generate daily room occupancy
+    occupancy = []
     current_date = start_date
     while current_date <= end_date:
         occupied = random.randint(65, 98) if current_date.weekday() >= 5 else random.randint(50, 85)
-        
-        db.connection.cursor().execute("""
+        occupancy.append((current_date.date(), occupied, 100))
+        current_date += timedelta(days=1)
+    
+    # One multi-row INSERT per table instead of a statement per row
+    with db.connection.cursor() as cursor:
+        cursor.executemany("""
+            INSERT INTO customers 
+            (customer_id, full_name, email, address, phone, status)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, customers)
+        cursor.executemany("""
+            INSERT INTO transactions (customer_id, amount, transaction_date)
+            VALUES (%s, %s, %s)
+        """, transactions)
+        cursor.executemany("""
             INSERT INTO room_occupancy (date, occupied_rooms, total_rooms)
             VALUES (%s, %s, %s)
-        """, (current_date.date(), occupied, 100))
-        
-        current_date += timedelta(days=1)
+        """, occupancy)
     
     db.connection.commit()
     print("✅ Test data populated successfully")
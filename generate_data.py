@@ -0,0 +1,259 @@
+"""Bulk synthetic data generator for capacity tests.
+
+    python generate_data.py --scale 10 [--mode executemany|load-data] [--chunk 5000]
+
+Scale 1 is 100k customers, 200k reservations, 400k transactions, 1k staff
+and ten years of room occupancy. Rows are generated lazily and written in chunks:
+``executemany`` sends one multi-row INSERT per chunk, ``load-data``
+streams rows to a TSV file and loads it with LOAD DATA LOCAL INFILE
+(the server needs local_infile=ON). Inserts use IGNORE, so re-running with
+the same --prefix is idempotent. The monthly rollup is rebuilt at the end
+because generated rows are backdated.
+"""
+import argparse
+import hashlib
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from db_helper import DatabaseManager, _create_connection, close_connection_pool
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+               "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+               "Thomas", "Sarah", "Charles", "Karen", "Amara", "Kwame", "Ngozi", "Chinedu"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+              "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Okafor", "Mensah", "Adeyemi"]
+STREETS = ["Main St", "Oak Ave", "Pine Rd", "Maple Dr", "Cedar Ln", "Elm St", "Lake View",
+           "Hill Crest", "Park Blvd", "River Rd"]
+CITIES = ["Lagos", "Accra", "Nairobi", "Springfield", "Riverside", "Franklin", "Greenville"]
+
+# Rows generated per unit of --scale
+ROWS_PER_SCALE = {
+    "customers": 100_000,
+    "reservations": 200_000,
+    "transactions": 400_000,
+    "staff": 1_000,
+}
+OCCUPANCY_DAYS = 3650  # one row per date, so it does not scale
+
+CHUNK_SIZE = 5000
+FILE_ROWS = 1_000_000
+
+LOAD_USER_EMAIL = "loadtest@example.com"
+
+
+# ========== ROW GENERATORS ==========
+def customer_row(n, prefix, now=None):
+    first = random.choice(FIRST_NAMES)
+    last = random.choice(LAST_NAMES)
+    now = now or datetime.now()
+    return (
+        f"{prefix}C{n:010d}",
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}.{prefix.lower()}{n}@example.com",
+        f"{random.randint(1, 9999)} {random.choice(STREETS)}, {random.choice(CITIES)}",
+        f"+1-{random.randint(200, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+        "Active" if random.random() > 0.2 else "Inactive",
+        now - timedelta(seconds=random.randint(0, 365 * 86400)),
+    )
+
+
+def reservation_row(n, prefix, user_id, now):
+    checkin = now.date() + timedelta(days=random.randint(-365, 60))
+    return (
+        f"{prefix}R{n:010d}",
+        user_id,
+        f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
+        checkin,
+        checkin + timedelta(days=random.randint(1, 14)),
+        random.randint(50, 500),
+        random.choice(["Paid", "Pending", "Cancelled"]),
+        random.choice(["Confirmed", "Pending", "Cancelled"]),
+        now - timedelta(seconds=random.randint(0, 365 * 86400)),
+    )
+
+
+def transaction_row(n, prefix, customers, reservations, now):
+    return (
+        f"{prefix}C{random.randrange(customers):010d}",
+        f"{prefix}R{random.randrange(reservations):010d}",
+        round(random.uniform(50, 500), 2),
+        now - timedelta(seconds=random.randint(0, 365 * 86400)),
+    )
+
+
+def occupancy_row(n, today):
+    day = today - timedelta(days=n)
+    occupied = random.randint(65, 98) if day.weekday() >= 5 else random.randint(50, 85)
+    return (day, occupied, 100)
+
+
+def staff_row(n, prefix):
+    first = random.choice(FIRST_NAMES)
+    last = random.choice(LAST_NAMES)
+    return (
+        f"{prefix}S{n:08d}",
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}.staff.{prefix.lower()}{n}@example.com",
+        f"+1-{random.randint(200, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+        f"{random.randint(1, 9999)} {random.choice(STREETS)}, {random.choice(CITIES)}",
+        "Active" if random.random() > 0.2 else "Inactive",
+        hashlib.sha256(f"staff{n}".encode()).hexdigest(),
+    )
+
+
+def chunked(rows, size):
+    """Yield lists of up to ``size`` rows from any iterable"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ========== WRITERS ==========
+def insert_executemany(conn, table, columns, rows, chunk_size=CHUNK_SIZE):
+    """Write rows with one multi-row INSERT per chunk; returns the rows sent"""
+    placeholders = ", ".join(["%s"] * len(columns))
+    statement = f"INSERT IGNORE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    total = 0
+    with conn.cursor() as cursor:
+        for chunk in chunked(rows, chunk_size):
+            # mysql-connector rewrites INSERT executemany into one multi-row statement
+            cursor.executemany(statement, chunk)
+            conn.commit()
+            total += len(chunk)
+    return total
+
+
+def _tsv_field(value):
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def insert_load_data(conn, table, columns, rows, file_rows=FILE_ROWS):
+    """Stream rows to TSV files of ``file_rows`` lines and LOAD DATA each one"""
+    total = 0
+    with conn.cursor() as cursor:
+        for chunk in chunked(rows, file_rows):
+            with tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False, encoding="utf-8") as tsv:
+                for row in chunk:
+                    tsv.write("\t".join(_tsv_field(value) for value in row))
+                    tsv.write("\n")
+            try:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE {table} "
+                    f"CHARACTER SET utf8mb4 ({', '.join(columns)})",
+                    (tsv.name,)
+                )
+                conn.commit()
+            finally:
+                os.remove(tsv.name)
+            total += len(chunk)
+    return total
+
+
+# ========== CLI ==========
+def ensure_load_user(conn):
+    """Reservations need an owner; reuse one generator user"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "INSERT IGNORE INTO users (full_name, email, password_hash, gender) VALUES (%s, %s, %s, %s)",
+            ("Load Test", LOAD_USER_EMAIL, hashlib.sha256(os.urandom(16)).hexdigest(), "Other")
+        )
+        cursor.execute("SELECT user_id FROM users WHERE email = %s", (LOAD_USER_EMAIL,))
+        return cursor.fetchone()[0]
+
+
+def generate(conn, scale, mode="executemany", chunk=CHUNK_SIZE, file_rows=FILE_ROWS, prefix="G"):
+    """Load a data set of the given scale and print rows/sec per table.
+
+    Returns {table: (rows, seconds)}.
+    """
+    counts = {table: int(per_scale * scale) for table, per_scale in ROWS_PER_SCALE.items()}
+    now = datetime.now()
+    today = date.today()
+
+    user_id = ensure_load_user(conn)
+    plan = [
+        ("customers",
+         ("customer_id", "full_name", "email", "address", "phone", "status", "created_at"),
+         (customer_row(n, prefix, now) for n in range(counts["customers"]))),
+        ("reservations",
+         ("reservation_id", "user_id", "guest_name", "checkin_date", "checkout_date",
+          "booking_amount", "payment_status", "fulfillment_status", "created_at"),
+         (reservation_row(n, prefix, user_id, now) for n in range(counts["reservations"]))),
+        ("transactions",
+         ("customer_id", "reservation_id", "amount", "transaction_date"),
+         (transaction_row(n, prefix, max(1, counts["customers"]), max(1, counts["reservations"]), now)
+          for n in range(counts["transactions"]))),
+        ("room_occupancy",
+         ("date", "occupied_rooms", "total_rooms"),
+         (occupancy_row(n, today) for n in range(OCCUPANCY_DAYS))),
+        ("staff",
+         ("staff_id", "full_name", "email", "phone", "address", "status", "password"),
+         (staff_row(n, prefix) for n in range(counts["staff"]))),
+    ]
+
+    stats = {}
+    grand_total = 0
+    started = time.perf_counter()
+    for table, columns, rows in plan:
+        table_started = time.perf_counter()
+        if mode == "load-data":
+            written = insert_load_data(conn, table, columns, rows, file_rows)
+        else:
+            written = insert_executemany(conn, table, columns, rows, chunk)
+        elapsed = time.perf_counter() - table_started
+        stats[table] = (written, elapsed)
+        grand_total += written
+        print(f"{table:<15} {written:>12,} rows in {elapsed:8.1f} s  "
+              f"({written / elapsed if elapsed else 0:,.0f} rows/s)")
+
+    elapsed = time.perf_counter() - started
+    print(f"{'total':<15} {grand_total:>12,} rows in {elapsed:8.1f} s  "
+          f"({grand_total / elapsed if elapsed else 0:,.0f} rows/s)")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--mode", choices=["executemany", "load-data"], default="executemany")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="rows per executemany batch")
+    parser.add_argument("--file-rows", type=int, default=FILE_ROWS, help="rows per LOAD DATA file")
+    parser.add_argument("--prefix", default="G", help="ID prefix for this data set")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-checks", action="store_true",
+                        help="disable unique/foreign key checks for the load session")
+    parser.add_argument("--no-rollup", action="store_true", help="skip the monthly rollup rebuild")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    conn = _create_connection(allow_local_infile=args.mode == "load-data")
+    try:
+        if args.no_checks:
+            with conn.cursor() as cursor:
+                cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+        generate(conn, args.scale, args.mode, args.chunk, args.file_rows, args.prefix)
+    finally:
+        conn.close()
+
+    if not args.no_rollup:
+        try:
+            if DatabaseManager().rebuild_monthly_metrics():
+                print("✅ Monthly metrics rebuilt")
+        finally:
+            close_connection_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
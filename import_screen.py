@@ -0,0 +1,173 @@
+import os
+import threading
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from bulk_import import IMPORT_SPECS, BulkImporter, format_progress
+
+FILE_TYPES = [
+    ("CSV or JSON Lines", "*.csv *.jsonl *.ndjson *.json"),
+    ("All files", "*.*"),
+]
+
+
+class DataImportScreen(ctk.CTkFrame):
+    """Bulk import of customers, reservations or transactions from CSV/JSONL files"""
+
+    def __init__(self, parent, controller):
+        super().__init__(parent, fg_color="white")
+        self.controller = controller
+        self.path = None
+        self.importer = None
+
+        self.grid_columnconfigure(0, weight=1)
+
+        self.create_header()
+        self.create_form()
+
+    def create_header(self):
+        header = ctk.CTkFrame(self, fg_color="white")
+        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
+
+        ctk.CTkLabel(
+            header,
+            text="Data Import",
+            font=("Arial", 20, "bold"),
+            text_color="#2c3e50"
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            header,
+            text="Back",
+            width=140,
+            fg_color="#64748b",
+            hover_color="#475569",
+            command=self.go_back
+        ).pack(side="right", padx=5)
+
+    def create_form(self):
+        form = ctk.CTkFrame(self, fg_color="#f8fafc", corner_radius=12)
+        form.grid(row=1, column=0, sticky="ew", padx=20, pady=10)
+        form.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(form, text="Import", text_color="#475569").grid(row=0, column=0, sticky="w", padx=20, pady=10)
+        self.kind_combo = ctk.CTkComboBox(form, values=sorted(IMPORT_SPECS), state="readonly", width=200)
+        self.kind_combo.set("customers")
+        self.kind_combo.grid(row=0, column=1, sticky="w", pady=10)
+
+        ctk.CTkButton(
+            form,
+            text="Choose File",
+            width=140,
+            fg_color="#0ea5e9",
+            hover_color="#0284c7",
+            command=self.choose_file
+        ).grid(row=1, column=0, sticky="w", padx=20, pady=10)
+        self.file_label = ctk.CTkLabel(form, text="No file selected", text_color="#64748b", anchor="w")
+        self.file_label.grid(row=1, column=1, sticky="ew", pady=10)
+
+        buttons = ctk.CTkFrame(form, fg_color="transparent")
+        buttons.grid(row=2, column=0, columnspan=2, sticky="w", padx=20, pady=10)
+        self.start_button = ctk.CTkButton(
+            buttons,
+            text="Start Import",
+            width=140,
+            fg_color="#10b981",
+            hover_color="#059669",
+            command=self.start_import
+        )
+        self.start_button.pack(side="left", padx=(0, 10))
+        self.cancel_button = ctk.CTkButton(
+            buttons,
+            text="Cancel",
+            width=140,
+            fg_color="#ef4444",
+            hover_color="#dc2626",
+            state="disabled",
+            command=self.cancel_import
+        )
+        self.cancel_button.pack(side="left")
+
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=2, column=0, sticky="ew", padx=20, pady=(20, 5))
+
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Courier", 12),
+            text_color="#475569",
+            anchor="w"
+        )
+        self.status_label.grid(row=3, column=0, sticky="ew", padx=20)
+
+    # ========== ACTIONS ==========
+    def choose_file(self):
+        path = filedialog.askopenfilename(title="Choose a file to import", filetypes=FILE_TYPES)
+        if path:
+            self.path = path
+            self.file_label.configure(text=f"{path}  ({os.path.getsize(path) / 1_048_576:,.1f} MB)")
+
+    def start_import(self):
+        if self.importer is not None:
+            return
+        if not self.path:
+            messagebox.showwarning("Import", "Please choose a file first")
+            return
+
+        kind = self.kind_combo.get()
+        context = {}
+        if kind == "reservations":
+            # Imported reservations belong to the signed-in user
+            context["user_id"] = self.controller.current_user["user_id"]
+
+        self.importer = BulkImporter(self.controller.db, kind, context, on_progress=self._post_progress)
+        self.start_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.progress_bar.set(0)
+        self.status_label.configure(text="Starting…")
+
+        # A long import would hold a DB executor worker for minutes, so it
+        # gets its own thread and reports back through the Tk queue
+        threading.Thread(target=self._run, args=(self.importer, self.path), name="bulk-import", daemon=True).start()
+
+    def cancel_import(self):
+        if self.importer is not None:
+            self.importer.cancel()
+            self.status_label.configure(text="Cancelling after the current chunk…")
+
+    def _run(self, importer, path):
+        try:
+            result = importer.run(path)
+        except Exception as e:
+            self.controller.db_executor.run_on_ui(self._on_finished, importer, path, None, e)
+            return
+        self.controller.db_executor.run_on_ui(self._on_finished, importer, path, result, None)
+
+    def _post_progress(self, progress):
+        """Importer thread -> Tk thread"""
+        self.controller.db_executor.run_on_ui(self._on_progress, progress)
+
+    def _on_progress(self, progress):
+        self.progress_bar.set(progress.fraction)
+        self.status_label.configure(text=format_progress(progress))
+
+    def _on_finished(self, importer, path, result, error):
+        self.importer = None
+        self.start_button.configure(state="normal")
+        self.cancel_button.configure(state="disabled")
+
+        if error is not None:
+            messagebox.showerror("Import", f"Import failed: {error}")
+            return
+
+        self._on_progress(result)
+        message = f"Imported {result.written:,} rows in {result.elapsed:.1f} s ({result.rows_per_sec:,.0f} rows/s)."
+        if importer.cancelled:
+            message = "Import cancelled. " + message
+        if result.rejected:
+            message += f"\n{result.rejected:,} rows were rejected; see {path}.rejects.jsonl"
+        messagebox.showinfo("Import", message)
+
+    def go_back(self):
+        target = "HotelBookingDashboard" if self.controller.current_user else "HotelBookingSystem"
+        self.controller.show_frame(target)
@@ -1,5 +1,74 @@
-from db_helper import DatabaseManager
+import sys
+import time
+
+import migrations
+from db_helper import DatabaseManager, get_connection_pool, close_connection_pool
+
+USAGE = "Usage: python init_db.py [migrate|status|rollup|prune-changes|purge-sessions]"
+
+
+def run_migrations():
+    """Bring the database schema up to the latest version"""
+    started = time.perf_counter()
+    with get_connection_pool().connection() as conn:
+        applied = migrations.migrate(conn)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if applied:
+        print(f"✅ Applied migrations {', '.join(map(str, applied))} in {elapsed:.0f} ms")
+    else:
+        print(f"✅ Schema already at version {migrations.LATEST_VERSION}")
+
+
+def show_status():
+    """Print the applied and latest schema versions"""
+    with get_connection_pool().connection() as conn:
+        version = migrations.get_schema_version(conn)
+    print(f"Schema version: {version} (latest: {migrations.LATEST_VERSION})")
+
+
+def rebuild_rollup():
+    """Recompute the monthly_metrics rollup from the raw tables"""
+    started = time.perf_counter()
+    if not DatabaseManager().rebuild_monthly_metrics():
+        print("❌ Rollup rebuild failed, see log for details")
+        sys.exit(1)
+    print(f"✅ Monthly metrics rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def prune_changes():
+    """Drop change-feed rows older than a week (readers that far behind reload)"""
+    deleted = DatabaseManager().prune_change_log()
+    print(f"✅ Pruned {deleted:,} change_log rows")
+
+
+def purge_sessions():
+    """Delete every expired user session"""
+    db = DatabaseManager()
+    total = 0
+    while True:
+        deleted = db.purge_expired_sessions()
+        total += deleted
+        if deleted == 0:
+            break
+    print(f"✅ Purged {total:,} expired sessions")
+
 
 if __name__ == "__main__":
-    with DatabaseManager() as db:
-        print("✅ Database tables created successfully")
\ No newline at end of file
+    command = sys.argv[1] if len(sys.argv) > 1 else "migrate"
+    commands = {
+        "migrate": run_migrations,
+        "status": show_status,
+        "rollup": rebuild_rollup,
+        "prune-changes": prune_changes,
+        "purge-sessions": purge_sessions,
+    }
+
+    if command not in commands:
+        print(USAGE)
+        sys.exit(2)
+
+    try:
+        commands[command]()
+    finally:
+        close_connection_pool()
@@ -1,7 +1,5 @@
 import customtkinter as ctk
 import tkinter as tk
-from PIL import Image, ImageTk, ImageFilter
-import os
 from tkinter import Canvas
 
 
@@ -145,38 +143,15 @@ class HotelBookingSystem(ctk.CTkFrame):
             self.create_gradient_background()
 
     def load_background_image(self):
-        """Attempt to load the hotel lobby background image"""
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "hotel_lobby.jpg")
-
-            print(f"Attempting to load image from: {image_path}")
-
-            if not os.path.exists(image_path):
-                print("Image not found at:", image_path)
-                return False
-
-            # Load and prepare the image
-            pil_image = Image.open(image_path)
-            blurred_image = pil_image.filter(ImageFilter.GaussianBlur(radius=3))
-
-            # Create CTkImage
-            self.bg_image = ctk.CTkImage(
-                light_image=blurred_image,
-                dark_image=blurred_image,
-                size=(self.winfo_screenwidth(), self.winfo_screenheight())
-            )
-
-            # Create background label
-            self.bg_label = ctk.CTkLabel(self, text="", image=self.bg_image)
-            self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-
-            print("Background image loaded successfully")
+        """Attach the blurred hotel lobby background (rendered off the Tk thread)"""
+        self.bg_label = ctk.CTkLabel(self, text="")
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        if self.controller.bg_assets.attach(self, self.bg_label, "hotel_lobby.jpg", radius=3):
             return True
 
-        except Exception as e:
-            print(f"Error loading background image: {e}")
-            return False
+        self.bg_label.destroy()
+        del self.bg_label
+        return False
 
     def create_gradient_background(self):
         """Create a gradient background as fallback"""
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageFilter
 import tkinter.messagebox as messagebox
 import hashlib
 import re
@@ -14,16 +13,10 @@ class LoginApp(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Background Image
-        try:
-            bg_image = Image.open("Welcome.jpg")
-            bg_image = bg_image.resize((1920, 1080), Image.LANCZOS)
-            blurred_bg_image = bg_image.filter(ImageFilter.GaussianBlur(radius=5))
-            self.bg_photo = ImageTk.PhotoImage(blurred_bg_image)
-            self.bg_label = ctk.CTkLabel(self, image=self.bg_photo, text="")
-            self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-        except Exception as e:
-            print(f"Background image error: {e}")
+        # Background image: scaled to the window and blurred off the Tk thread
+        self.bg_label = ctk.CTkLabel(self, text="")
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        controller.bg_assets.attach(self, self.bg_label, "Welcome.jpg", radius=5)
 
         # Main login frame
         self.main_frame = ctk.CTkFrame(self, 
@@ -148,24 +141,27 @@ class LoginApp(ctk.CTkFrame):
             messagebox.showerror("Error", "Please enter a valid email address")
             return
 
-        try:
-            # Pass the raw password directly to authenticate_user
-            # The method will handle the hashing internally
-            user = self.controller.db.authenticate_user(email, password)
-            
+        def on_result(user):
             if user:
                 messagebox.showinfo("Success", f"Welcome back, {user['full_name']}!")
                 self.controller.successful_login(user)
-                
+
                 # Clear fields after successful login
                 self.email_entry.delete(0, 'end')
                 self.password_entry.delete(0, 'end')
             else:
                 messagebox.showerror("Error", "Invalid email or password")
-                
-        except Exception as e:
+
+        def on_error(e):
             messagebox.showerror("Database Error", f"Login failed: {str(e)}")
 
+        # Pass the raw password directly to authenticate_user
+        # The method will handle the hashing internally
+        self.controller.db_executor.submit(
+            lambda: self.controller.db.authenticate_user(email, password),
+            on_success=on_result, on_error=on_error, key="login"
+        )
+
     def __del__(self):
         """Clean up resources"""
         pass
\ No newline at end of file
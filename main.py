@@ -90,29 +90,69 @@
 
 
 
+import os
+import time
+import logging
+import importlib
+import threading
 import customtkinter as ctk
-from dashboard import HotelBookingDashboard
-from login import LoginApp
-from register import RegistrationApp
-from landing import HotelBookingSystem
-from password_recovery import PasswordRecoveryApp
-from mcustomer import CustomerManagementScreen
-from Report import HotelReportsPage
-from Reservations import HotelReservationsPage
-from staff_member import StaffMemberScreen
-from db_helper import DatabaseManager
+from db_executor import DBExecutor
+from bg_assets import BackgroundAssetService
+
+logger = logging.getLogger(__name__)
+
+# Screens built in idle time after login, most likely next first
+PREWARM_FRAMES = ("HotelReservationsPage", "CustomerManagementScreen", "HotelReportsPage")
+
+# Screen name -> (module, class). Modules are imported on first use so
+# matplotlib, fpdf, tksheet and mysql.connector stay out of startup
+FRAME_CLASSES = {
+    "HotelBookingSystem": ("landing", "HotelBookingSystem"),
+    "LoginApp": ("login", "LoginApp"),
+    "RegistrationApp": ("register", "RegistrationApp"),
+    "PasswordRecoveryApp": ("password_recovery", "PasswordRecoveryApp"),
+    "HotelBookingDashboard": ("dashboard", "HotelBookingDashboard"),
+    "CustomerManagementScreen": ("mcustomer", "CustomerManagementScreen"),
+    "HotelReportsPage": ("Report", "HotelReportsPage"),
+    "HotelReservationsPage": ("Reservations", "HotelReservationsPage"),
+    "StaffMemberScreen": ("staff_member", "StaffMemberScreen"),
+    "DiagnosticsScreen": ("diagnostics", "DiagnosticsScreen"),
+    "DataImportScreen": ("import_screen", "DataImportScreen")
+}
+
+# How often expired user_sessions rows are purged in the background
+SESSION_PURGE_INTERVAL_MS = int(float(os.getenv("SESSION_PURGE_INTERVAL", "900")) * 1000)
+
+# HOTEL_EAGER_FRAMES=1 builds every screen up front (the old behaviour),
+# for comparing time to first paint
+EAGER_FRAMES = os.getenv("HOTEL_EAGER_FRAMES", "0") == "1"
 
 class HotelApp(ctk.CTk):
     def __init__(self):
+        self._started = time.perf_counter()
         super().__init__()
         self.title("Hotel Management System")
         self.geometry("1400x900")
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
         
-        # Initialize database connection
-        self.db = DatabaseManager()
+        # Database access (one connection pool for every screen) is set up
+        # on first use of self.db
+        self._db = None
+        self._db_lock = threading.Lock()
         self.current_user = None
+
+        # Screens run their database calls through this executor so the Tk
+        # thread never waits on a network round trip
+        self.db_executor = DBExecutor(self, on_busy_change=self.set_busy)
+
+        # Connect and check the schema on a worker while the landing page draws
+        self.db_executor.submit(lambda: self.db, on_error=self._on_db_error)
+        self.after(60000, self._purge_sessions)
+
+        # Login/register/recovery/landing backgrounds are decoded and blurred
+        # on worker threads and cached on disk
+        self.bg_assets = BackgroundAssetService(self.db_executor)
         
         # Create container frame
         self.container = ctk.CTkFrame(self)
@@ -120,32 +160,99 @@ class HotelApp(ctk.CTk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
         
-        # Initialize all frames
+        # Screens are built on first use (see get_frame)
         self.frames = {}
+        if EAGER_FRAMES:
+            for name in FRAME_CLASSES:
+                self.get_frame(name)
         
-        frames_classes = [
-            ("HotelBookingSystem", HotelBookingSystem),
-            ("LoginApp", LoginApp),
-            ("RegistrationApp", RegistrationApp),
-            ("PasswordRecoveryApp", PasswordRecoveryApp),
-            ("HotelBookingDashboard", HotelBookingDashboard),
-            ("CustomerManagementScreen", CustomerManagementScreen),
-            ("HotelReportsPage", HotelReportsPage),
-            ("HotelReservationsPage", HotelReservationsPage),
-            ("StaffMemberScreen", StaffMemberScreen)
-        ]
-        
-        for name, FrameClass in frames_classes:
-            frame = FrameClass(self.container, self)
-            self.frames[name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
-        
+        # Busy indicator shown while background database calls are running
+        self.busy_label = ctk.CTkLabel(
+            self,
+            text="Working…",
+            font=("Arial", 12),
+            fg_color="#2c3e50",
+            text_color="white",
+            corner_radius=6
+        )
+
+        # Hidden query diagnostics
+        self.bind_all("<Control-Shift-D>", lambda e: self.show_frame("DiagnosticsScreen"))
+
         # Show landing page first
         self.show_frame("HotelBookingSystem")
+        self.after(0, self._log_first_paint)
+
+    def _log_first_paint(self):
+        """Log the time from HotelApp() to the landing page being drawn"""
+        self.update_idletasks()
+        logger.info(
+            f"First paint after {(time.perf_counter() - self._started) * 1000:.0f} ms "
+            f"({'eager' if EAGER_FRAMES else 'lazy'} frames, {len(self.frames)} built)"
+        )
+
+    @property
+    def db(self):
+        """Shared DatabaseManager, created on first use (from any thread)"""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    from db_helper import DatabaseManager
+                    self._db = DatabaseManager()
+        return self._db
+
+    def _purge_sessions(self):
+        """Delete expired sessions on a worker, then reschedule"""
+        self.db_executor.submit(lambda: self.db.purge_expired_sessions(), key="sessions:purge")
+        self.after(SESSION_PURGE_INTERVAL_MS, self._purge_sessions)
+
+    def _on_db_error(self, e):
+        """Tk thread: the database could not be reached or is not migrated"""
+        from tkinter import messagebox
+        messagebox.showerror("Database Error", f"Could not open the database: {str(e)}")
+
+    def get_frame(self, page_name):
+        """Return a screen, importing and constructing it on first use (None if unknown)"""
+        frame = self.frames.get(page_name)
+        if frame is None:
+            if page_name not in FRAME_CLASSES:
+                return None
+            module_name, class_name = FRAME_CLASSES[page_name]
+            started = time.perf_counter()
+            FrameClass = getattr(importlib.import_module(module_name), class_name)
+            frame = FrameClass(self.container, self)
+            self.frames[page_name] = frame
+            frame.grid(row=0, column=0, sticky="nsew")
+            logger.info(f"Built {page_name} in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return frame
+
+    def prewarm_frames(self, names=PREWARM_FRAMES):
+        """Build likely next screens one at a time while the UI is idle"""
+        pending = [name for name in names if name not in self.frames]
+        if not pending:
+            return
+
+        def build_next():
+            name = pending.pop(0)
+            if name not in self.frames:
+                # A new grid child stacks on top; keep it behind the visible screen
+                self.get_frame(name).lower()
+            if pending:
+                self.after(50, lambda: self.after_idle(build_next))
+
+        self.after_idle(build_next)
+
+    def set_busy(self, busy):
+        """Show or hide the busy indicator"""
+        if busy:
+            self.busy_label.place(relx=1.0, rely=1.0, x=-12, y=-12, anchor="se")
+            self.busy_label.lift()
+        else:
+            self.busy_label.place_forget()
     
     def show_frame(self, page_name):
         """Show a frame and update window title"""
-        frame = self.frames.get(page_name)
+        frame = self.get_frame(page_name)
         if not frame:
             print(f"Error: Frame {page_name} not found!")
             return
@@ -162,23 +269,39 @@ class HotelApp(ctk.CTk):
             "CustomerManagementScreen": "Customers - Hotel Management",
             "HotelReportsPage": "Reports - Hotel Management",
             "HotelReservationsPage": "Reservations - Hotel Management",
-            "StaffMemberScreen": "Staff Members - Hotel Management"
+            "StaffMemberScreen": "Staff Members - Hotel Management",
+            "DiagnosticsScreen": "Diagnostics - Hotel Management",
+            "DataImportScreen": "Data Import - Hotel Management"
         }
         self.title(titles.get(page_name, "Hotel Management System"))
         
         if page_name == "HotelBookingDashboard" and self.current_user:
             frame.update_user_display(self.current_user)
+            frame.refresh_metrics()
+        elif page_name == "DiagnosticsScreen":
+            frame.refresh()
     
     def successful_login(self, user_data):
         """Handle post-login operations"""
         self.current_user = user_data
         self.show_frame("HotelBookingDashboard")
+        self.prewarm_frames()
     
     def __del__(self):
         """Cleanup resources"""
-        if hasattr(self, 'db'):
-            self.db.close()
+        if hasattr(self, 'bg_assets'):
+            self.bg_assets.shutdown()
+        if hasattr(self, 'db_executor'):
+            self.db_executor.shutdown()
+        if getattr(self, '_db', None) is not None:
+            from db_helper import close_connection_pool
+            self._db.close()
+            close_connection_pool()
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
     app = HotelApp()
     app.mainloop()
\ No newline at end of file
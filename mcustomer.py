@@ -1,13 +1,26 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox
-from db_helper import DatabaseManager
+from db_helper import search_text_matches
+from search_controller import SearchController
+from virtual_views import PagedTreeview
 
 class CustomerManagementScreen(ctk.CTkFrame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
-        self.db = DatabaseManager()
+
+        # Debounced type-ahead search; shares the list key with the filters
+        self.search = SearchController(
+            self,
+            get_query=lambda: self.search_entry.get().strip(),
+            fetch=lambda query: self.db.search_customers(query),
+            match=self._customer_matches,
+            on_results=self.populate_table,
+            on_clear=lambda: self.filter_customers(self.active_filter.get()),
+            executor=controller.db_executor,
+            key="customers:search"
+        )
         
         # Configure grid layout
         self.grid_rowconfigure(0, weight=1)
@@ -17,9 +30,29 @@ class CustomerManagementScreen(ctk.CTkFrame):
         self.create_sidebar()
         self.create_main_content()
         
+        # Only a window of pages is kept in the table; more are fetched as
+        # the user scrolls
+        self.pager = PagedTreeview(
+            self.tree,
+            self.y_scroll,
+            row_key=lambda c: (c['full_name'], c['customer_id']),
+            row_values=lambda c: (
+                c['customer_id'], c['full_name'], c['email'],
+                c['address'], c['phone'], c['status']
+            ),
+            row_tags=lambda c: ('active_badge',) if c['status'] == 'Active' else ('inactive_badge',),
+            executor=controller.db_executor,
+            key="customers:page"
+        )
+
         # Load initial data
         self.filter_customers("all")
     
+    @property
+    def db(self):
+        """The app's DatabaseManager; only read on worker threads, since first use connects"""
+        return self.controller.db
+
     def create_sidebar(self):
         sidebar = ctk.CTkFrame(self, width=250, fg_color="#f0f9ff", corner_radius=0)
         sidebar.grid(row=0, column=0, sticky="nsew")
@@ -158,6 +191,15 @@ class CustomerManagementScreen(ctk.CTkFrame):
             command=self.open_add_customer_dialog,
             width=120
         ).grid(row=0, column=1, padx=(10, 0))
+
+        # Bulk import (CSV / JSON Lines)
+        ctk.CTkButton(
+            search_filter_frame,
+            text="Import…",
+            fg_color="#64748b",
+            command=lambda: self.controller.show_frame("DataImportScreen"),
+            width=100
+        ).grid(row=0, column=2, padx=(10, 0))
         
         # Filter buttons
         filter_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -248,13 +290,13 @@ class CustomerManagementScreen(ctk.CTkFrame):
         self.tree.tag_configure('inactive_badge', background='#6b7280', foreground='white')
         
         # Add scrollbars
-        y_scroll = ctk.CTkScrollbar(tree_frame, orientation="vertical", command=self.tree.yview)
+        self.y_scroll = ctk.CTkScrollbar(tree_frame, orientation="vertical", command=self.tree.yview)
         x_scroll = ctk.CTkScrollbar(tree_frame, orientation="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.tree.configure(yscrollcommand=self.y_scroll.set, xscrollcommand=x_scroll.set)
         
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
-        y_scroll.grid(row=0, column=1, sticky="ns")
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
         x_scroll.grid(row=1, column=0, sticky="ew")
         
         # Action buttons frame
@@ -285,30 +327,8 @@ class CustomerManagementScreen(ctk.CTkFrame):
         self.tree.bind("<Double-1>", lambda e: self.edit_selected_customer())
     
     def populate_table(self, customers):
-        """Populate the Treeview with customer data"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not customers:
-            return
-        
-        # Add customer data
-        for customer in customers:
-            item_id = self.tree.insert("", "end", values=(
-                customer['customer_id'],
-                customer['full_name'],
-                customer['email'],
-                customer['address'],
-                customer['phone'],
-                customer['status']
-            ))
-            
-            # Apply tag based on status
-            if customer['status'] == 'Active':
-                self.tree.item(item_id, tags=('active_badge',))
-            else:
-                self.tree.item(item_id, tags=('inactive_badge',))
+        """Show a complete customer list (search results) in the table"""
+        self.pager.show_rows(customers)
     
     def get_selected_customer(self):
         """Get the currently selected customer"""
@@ -342,19 +362,25 @@ class CustomerManagementScreen(ctk.CTkFrame):
     def filter_customers(self, status):
         """Filter customers by status"""
         self.active_filter.set(status)
-        customers = self.db.get_customers(status)
-        self.populate_table(customers)
+        self.search.reset()
+        # Paging has its own key so scrolling cannot drop a search result;
+        # a pending search is cancelled here so it cannot replace the list
+        self.controller.db_executor.cancel("customers:search")
+        self.pager.reset(
+            lambda after_key, before_key, limit: self.db.get_customers_page(
+                after_key, limit, status, before_key=before_key
+            )
+        )
     
     def search_customers(self, event):
-        """Search customers based on input"""
-        query = self.search_entry.get().strip()
-        
-        if not query:
-            self.filter_customers(self.active_filter.get())
-            return
-        
-        customers = self.db.search_customers(query)
-        self.populate_table(customers)
+        """Search customers based on input (debounced)"""
+        self.search.on_key(event)
+
+    @staticmethod
+    def _customer_matches(customer, query):
+        """Local equivalent of DatabaseManager.search_customers (email is case-sensitive)"""
+        return (search_text_matches(customer['email'], query, case_sensitive=True)
+                or any(search_text_matches(customer[column], query) for column in ('full_name', 'address', 'phone')))
     
     def open_add_customer_dialog(self):
         """Open dialog to add new customer"""
@@ -363,9 +389,8 @@ class CustomerManagementScreen(ctk.CTkFrame):
         dialog.geometry("500x500")
         dialog.grab_set()
         
-        # Form fields
+        # Form fields (the customer ID is allocated on save)
         fields = [
-            ("ID Number", "text", ""),
             ("Name", "text", ""),
             ("Email", "text", ""),
             ("Address", "text", ""),
@@ -436,7 +461,6 @@ class CustomerManagementScreen(ctk.CTkFrame):
     def add_customer(self, entries, dialog):
         """Add new customer to database"""
         customer_data = {
-            'customer_id': entries["ID Number"].get(),
             'full_name': entries["Name"].get(),
             'email': entries["Email"].get(),
             'address': entries["Address"].get(),
@@ -448,12 +472,18 @@ class CustomerManagementScreen(ctk.CTkFrame):
             messagebox.showerror("Error", "Please fill in all fields")
             return
         
-        if self.db.add_customer(customer_data):
-            messagebox.showinfo("Success", "Customer added successfully!")
-            self.filter_customers(self.active_filter.get())
-            dialog.destroy()
-        else:
-            messagebox.showerror("Error", "Failed to add customer")
+        def on_done(added):
+            if added:
+                messagebox.showinfo("Success", f"Customer {customer_data['customer_id']} added successfully!")
+                self.filter_customers(self.active_filter.get())
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Failed to add customer")
+
+        self.controller.db_executor.submit(
+            lambda: self.db.add_customer(customer_data), on_success=on_done,
+            on_error=self._on_write_error
+        )
     
     def update_customer(self, customer_id, entries, dialog):
         """Update existing customer in database"""
@@ -469,23 +499,34 @@ class CustomerManagementScreen(ctk.CTkFrame):
             messagebox.showerror("Error", "Please fill in all fields")
             return
         
-        if self.db.update_customer(customer_id, updated_data):
-            messagebox.showinfo("Success", "Customer updated successfully!")
-            self.filter_customers(self.active_filter.get())
-            dialog.destroy()
-        else:
-            messagebox.showerror("Error", "Failed to update customer")
+        def on_done(updated):
+            if updated:
+                messagebox.showinfo("Success", "Customer updated successfully!")
+                self.filter_customers(self.active_filter.get())
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Failed to update customer")
+
+        self.controller.db_executor.submit(
+            lambda: self.db.update_customer(customer_id, updated_data), on_success=on_done,
+            on_error=self._on_write_error
+        )
     
+    def _on_write_error(self, e):
+        """Tk thread: a background add/update/delete raised"""
+        messagebox.showerror("Database Error", f"Database operation failed: {str(e)}")
+
     def delete_customer(self, customer):
         """Delete customer from database"""
         if messagebox.askyesno("Confirm", f"Delete customer {customer['full_name']}?"):
-            if self.db.delete_customer(customer['customer_id']):
-                messagebox.showinfo("Success", "Customer deleted")
-                self.filter_customers(self.active_filter.get())
-            else:
-                messagebox.showerror("Error", "Failed to delete customer")
-    
-    def __del__(self):
-        """Clean up database connection when frame is destroyed"""
-        if hasattr(self, 'db'):
-            self.db.close()
\ No newline at end of file
+            def on_done(deleted):
+                if deleted:
+                    messagebox.showinfo("Success", "Customer deleted")
+                    self.filter_customers(self.active_filter.get())
+                else:
+                    messagebox.showerror("Error", "Failed to delete customer")
+
+            self.controller.db_executor.submit(
+                lambda: self.db.delete_customer(customer['customer_id']), on_success=on_done,
+                on_error=self._on_write_error
+            )
@@ -0,0 +1,387 @@
+import logging
+from typing import List, Tuple
+
+from mysql.connector import Error, errorcode
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """Raised when the database has not been migrated to the latest version"""
+
+
+# Ordered schema migrations: (version, description, statements).
+# Append new entries only; never edit a migration that has shipped.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "Initial schema", [
+        # users
+        """
+            CREATE TABLE IF NOT EXISTS users (
+                user_id INT AUTO_INCREMENT PRIMARY KEY,
+                full_name VARCHAR(100) NOT NULL,
+                email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
+                password_hash VARCHAR(255) NOT NULL,
+                gender ENUM('Male','Female','Other') NOT NULL,
+                is_active BOOLEAN DEFAULT TRUE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                UNIQUE INDEX idx_email (email)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # user_sessions
+        """
+            CREATE TABLE IF NOT EXISTS user_sessions (
+                session_id VARCHAR(255) PRIMARY KEY,
+                user_id INT NOT NULL,
+                ip_address VARCHAR(45),
+                user_agent TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at TIMESTAMP NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # auth_logs
+        """
+            CREATE TABLE IF NOT EXISTS auth_logs (
+                log_id INT AUTO_INCREMENT PRIMARY KEY,
+                user_id INT NULL,
+                email VARCHAR(100) NOT NULL,
+                action ENUM('register','login','logout','fail') NOT NULL,
+                ip_address VARCHAR(45),
+                user_agent TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # reservations
+        """
+            CREATE TABLE IF NOT EXISTS reservations (
+                reservation_id VARCHAR(20) PRIMARY KEY,
+                user_id INT NOT NULL,
+                guest_name VARCHAR(100) NOT NULL,
+                checkin_date DATE NOT NULL,
+                checkout_date DATE NOT NULL,
+                booking_amount DECIMAL(10,2) NOT NULL,
+                payment_status ENUM('Paid', 'Pending', 'Cancelled') DEFAULT 'Pending',
+                fulfillment_status ENUM('Confirmed', 'Pending', 'Cancelled') DEFAULT 'Pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+                INDEX idx_reservations_created (created_at)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # customers
+        """
+            CREATE TABLE IF NOT EXISTS customers (
+                customer_id VARCHAR(20) PRIMARY KEY,
+                full_name VARCHAR(100) NOT NULL,
+                email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
+                address TEXT NOT NULL,
+                phone VARCHAR(20) NOT NULL,
+                status ENUM('Active','Inactive') NOT NULL DEFAULT 'Active',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                UNIQUE INDEX idx_email (email),
+                INDEX idx_status (status)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # transactions
+        """
+            CREATE TABLE IF NOT EXISTS transactions (
+                transaction_id INT AUTO_INCREMENT PRIMARY KEY,
+                customer_id VARCHAR(20),
+                reservation_id VARCHAR(20),
+                amount DECIMAL(10,2) NOT NULL,
+                transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (customer_id) REFERENCES customers(customer_id) 
+                    ON DELETE SET NULL
+                    ON UPDATE CASCADE,
+                FOREIGN KEY (reservation_id) REFERENCES reservations(reservation_id)
+                    ON DELETE SET NULL
+                    ON UPDATE CASCADE,
+                INDEX idx_transactions_date (transaction_date)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # room_occupancy
+        """
+            CREATE TABLE IF NOT EXISTS room_occupancy (
+                record_id INT AUTO_INCREMENT PRIMARY KEY,
+                date DATE NOT NULL,
+                occupied_rooms INT NOT NULL,
+                total_rooms INT NOT NULL,
+                UNIQUE KEY unique_date (date)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # staff
+        """
+            CREATE TABLE IF NOT EXISTS staff (
+                staff_id VARCHAR(20) PRIMARY KEY,
+                full_name VARCHAR(100) NOT NULL,
+                email VARCHAR(100) NOT NULL COLLATE utf8mb4_bin,
+                phone VARCHAR(20) NOT NULL,
+                address TEXT NOT NULL,
+                status ENUM('Active','Inactive') NOT NULL DEFAULT 'Active',
+                password VARCHAR(255) NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                UNIQUE INDEX idx_staff_email (email)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """
+    ]),
+    (2, "Monthly metrics rollup", [
+        """
+            CREATE TABLE IF NOT EXISTS monthly_metrics (
+                month_start DATE PRIMARY KEY,
+                new_customers INT NOT NULL DEFAULT 0,
+                bookings INT NOT NULL DEFAULT 0,
+                revenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # How far each source table has been folded into monthly_metrics
+        """
+            CREATE TABLE IF NOT EXISTS rollup_watermarks (
+                source VARCHAR(50) PRIMARY KEY,
+                last_created_at TIMESTAMP NULL,
+                last_id BIGINT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            INSERT IGNORE INTO rollup_watermarks (source)
+            VALUES ('customers'), ('reservations'), ('transactions')
+        """,
+        # The incremental fold range-scans customers by creation time
+        "ALTER TABLE customers ADD INDEX idx_customers_created (created_at)",
+    ]),
+    (3, "Full-text search indexes", [
+        # The default stopword list would drop ngrams such as "an" or "at"
+        # from the indexes; the setting is read when an index is built
+        "SET SESSION innodb_ft_enable_stopword = OFF",
+        # A FULLTEXT index needs one collation, so the binary email column
+        # gets its own index
+        """
+            ALTER TABLE customers
+                ADD FULLTEXT INDEX ft_customers_text (full_name, address, phone) WITH PARSER ngram
+        """,
+        "ALTER TABLE customers ADD FULLTEXT INDEX ft_customers_email (email) WITH PARSER ngram",
+        "ALTER TABLE staff ADD FULLTEXT INDEX ft_staff_text (full_name, phone) WITH PARSER ngram",
+        "ALTER TABLE staff ADD FULLTEXT INDEX ft_staff_email (email) WITH PARSER ngram",
+        "SET SESSION innodb_ft_enable_stopword = ON",
+    ]),
+    (4, "Customer keyset pagination indexes", [
+        # Seek + ordered scan for get_customers_page, with and without a
+        # status filter
+        """
+            ALTER TABLE customers
+                ADD INDEX idx_customers_name_id (full_name, customer_id),
+                ADD INDEX idx_customers_status_name_id (status, full_name, customer_id)
+        """,
+    ]),
+    # Creating triggers needs the TRIGGER privilege, and with binary logging
+    # on also SUPER or log_bin_trust_function_creators = 1
+    (5, "Change feed", [
+        """
+            CREATE TABLE IF NOT EXISTS change_log (
+                version BIGINT AUTO_INCREMENT PRIMARY KEY,
+                table_name VARCHAR(32) NOT NULL,
+                row_key VARCHAR(50) NOT NULL,
+                owner_id INT NULL,
+                operation ENUM('insert','update','delete') NOT NULL,
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_change_log_owner (table_name, owner_id, version),
+                INDEX idx_change_log_changed (changed_at)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            CREATE TRIGGER trg_customers_insert AFTER INSERT ON customers FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('customers', NEW.customer_id, NULL, 'insert')
+        """,
+        # A changed key is logged as a delete of the old key plus an update
+        """
+            CREATE TRIGGER trg_customers_update AFTER UPDATE ON customers FOR EACH ROW
+            BEGIN
+                IF NOT (OLD.customer_id <=> NEW.customer_id) THEN
+                    INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                    VALUES ('customers', OLD.customer_id, NULL, 'delete');
+                END IF;
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('customers', NEW.customer_id, NULL, 'update');
+            END
+        """,
+        """
+            CREATE TRIGGER trg_customers_delete AFTER DELETE ON customers FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('customers', OLD.customer_id, NULL, 'delete')
+        """,
+        """
+            CREATE TRIGGER trg_reservations_insert AFTER INSERT ON reservations FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('reservations', NEW.reservation_id, NEW.user_id, 'insert')
+        """,
+        """
+            CREATE TRIGGER trg_reservations_update AFTER UPDATE ON reservations FOR EACH ROW
+            BEGIN
+                IF NOT (OLD.reservation_id <=> NEW.reservation_id) THEN
+                    INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                    VALUES ('reservations', OLD.reservation_id, OLD.user_id, 'delete');
+                END IF;
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('reservations', NEW.reservation_id, NEW.user_id, 'update');
+            END
+        """,
+        """
+            CREATE TRIGGER trg_reservations_delete AFTER DELETE ON reservations FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('reservations', OLD.reservation_id, OLD.user_id, 'delete')
+        """,
+        """
+            CREATE TRIGGER trg_transactions_insert AFTER INSERT ON transactions FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('transactions', NEW.transaction_id, NULL, 'insert')
+        """,
+        """
+            CREATE TRIGGER trg_transactions_update AFTER UPDATE ON transactions FOR EACH ROW
+            BEGIN
+                IF NOT (OLD.transaction_id <=> NEW.transaction_id) THEN
+                    INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                    VALUES ('transactions', OLD.transaction_id, NULL, 'delete');
+                END IF;
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('transactions', NEW.transaction_id, NULL, 'update');
+            END
+        """,
+        """
+            CREATE TRIGGER trg_transactions_delete AFTER DELETE ON transactions FOR EACH ROW
+                INSERT INTO change_log (table_name, row_key, owner_id, operation)
+                VALUES ('transactions', OLD.transaction_id, NULL, 'delete')
+        """,
+    ]),
+    (6, "Session expiry index", [
+        # purge_expired_sessions deletes by expires_at range in batches
+        "ALTER TABLE user_sessions ADD INDEX idx_user_sessions_expires (expires_at)",
+    ]),
+    (7, "Room inventory", [
+        """
+            CREATE TABLE IF NOT EXISTS room_types (
+                type_id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(50) NOT NULL,
+                base_rate DECIMAL(10,2) NOT NULL DEFAULT 0,
+                capacity INT NOT NULL DEFAULT 2,
+                UNIQUE INDEX idx_room_types_name (name)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS rooms (
+                room_id INT AUTO_INCREMENT PRIMARY KEY,
+                room_number VARCHAR(10) NOT NULL,
+                type_id INT NOT NULL,
+                floor INT NULL,
+                status ENUM('Available','Maintenance') NOT NULL DEFAULT 'Available',
+                UNIQUE INDEX idx_rooms_number (room_number),
+                FOREIGN KEY (type_id) REFERENCES room_types(type_id)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            INSERT IGNORE INTO room_types (name, base_rate, capacity)
+            VALUES ('Standard', 120.00, 2), ('Deluxe', 180.00, 2), ('Suite', 320.00, 4)
+        """,
+        # Existing reservations have no room; the availability index loads
+        # room bookings with one ordered scan of this index
+        """
+            ALTER TABLE reservations
+                ADD COLUMN room_id INT NULL AFTER user_id,
+                ADD INDEX idx_reservations_room_dates (room_id, checkin_date, checkout_date),
+                ADD FOREIGN KEY (room_id) REFERENCES rooms(room_id) ON DELETE SET NULL
+        """,
+    ]),
+    (8, "ID sequences for block-allocated record IDs", [
+        # Clients reserve a block with one autocommitted
+        # UPDATE ... SET next_value = LAST_INSERT_ID(next_value + n)
+        """
+            CREATE TABLE IF NOT EXISTS id_sequences (
+                name VARCHAR(32) PRIMARY KEY,
+                next_value BIGINT NOT NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            INSERT IGNORE INTO id_sequences (name, next_value)
+            VALUES ('reservations', 1), ('customers', 1), ('staff', 1)
+        """,
+    ]),
+    (9, "Monthly rollup folds from the change feed", [
+        # Inserts within CHANGE_LOOKBACK versions of the watermark that are
+        # already in monthly_metrics, so one committing late is folded once
+        """
+            CREATE TABLE IF NOT EXISTS rollup_folded (
+                version BIGINT PRIMARY KEY
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        # One change_log version watermark replaces the per-table ones; its
+        # NULL last_id makes the next refresh recount everything
+        "DELETE FROM rollup_watermarks",
+        "INSERT INTO rollup_watermarks (source) VALUES ('change_log')",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_MIGRATION_LOCK = "hotel_schema_migration"
+
+
+def _ensure_version_table(cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            description VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+
+def get_schema_version(conn) -> int:
+    """Return the applied schema version (0 for an unmigrated database)"""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT MAX(version) FROM schema_version")
+            row = cursor.fetchone()
+            return int(row[0]) if row and row[0] is not None else 0
+    except Error as err:
+        if err.errno == errorcode.ER_NO_SUCH_TABLE:
+            return 0
+        raise
+
+
+def migrate(conn, target: int = LATEST_VERSION) -> List[int]:
+    """Apply pending migrations up to ``target`` and return the versions applied"""
+    applied = []
+    with conn.cursor() as cursor:
+        # Serialize concurrent deploys; DDL auto-commits so there is no
+        # wrapping transaction to rely on
+        cursor.execute("SELECT GET_LOCK(%s, 60)", (_MIGRATION_LOCK,))
+        if cursor.fetchone()[0] != 1:
+            raise RuntimeError("Timed out waiting for the schema migration lock")
+
+        try:
+            _ensure_version_table(cursor)
+            current = get_schema_version(conn)
+
+            for version, description, statements in MIGRATIONS:
+                if version <= current or version > target:
+                    continue
+
+                logger.info(f"Applying migration {version}: {description}")
+                for statement in statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                    (version, description),
+                )
+                conn.commit()
+                applied.append(version)
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (_MIGRATION_LOCK,))
+            cursor.fetchall()
+
+    return applied
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageFilter
 import tkinter.messagebox as messagebox
 import re
 
@@ -12,20 +11,10 @@ class PasswordRecoveryApp(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Background Image (Blurred)
-        try:
-            bg_image = Image.open("password.jpg") 
-            bg_image = bg_image.resize((1920, 1080), Image.LANCZOS)
-            
-            # Apply blur effect
-            blurred_bg_image = bg_image.filter(ImageFilter.GaussianBlur(radius=5))
-            
-            self.bg_photo = ImageTk.PhotoImage(blurred_bg_image)
-            
-            self.bg_label = ctk.CTkLabel(self, image=self.bg_photo, text="")
-            self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-        except Exception as e:
-            print(f"Error loading background image: {e}")
+        # Background image: scaled to the window and blurred off the Tk thread
+        self.bg_label = ctk.CTkLabel(self, text="")
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        controller.bg_assets.attach(self, self.bg_label, "password.jpg", radius=5)
 
         # Main Password Recovery Frame
         self.main_frame = ctk.CTkFrame(self, 
@@ -1,10 +1,6 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageFilter
 import re
 import tkinter.messagebox as messagebox
-import mysql.connector
-from dotenv import load_dotenv
-import os
 import hashlib
 
 class RegistrationApp(ctk.CTkFrame):
@@ -17,19 +13,10 @@ class RegistrationApp(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Load environment variables
-        load_dotenv()
-
-        # Background Image
-        try:
-            bg_image = Image.open("registration.jpg") 
-            bg_image = bg_image.resize((1920, 1080), Image.LANCZOS)
-            blurred_bg_image = bg_image.filter(ImageFilter.GaussianBlur(radius=5))
-            self.bg_photo = ImageTk.PhotoImage(blurred_bg_image)
-            self.bg_label = ctk.CTkLabel(self, image=self.bg_photo, text="")
-            self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-        except Exception as e:
-            print(f"Error loading background image: {e}")
+        # Background image: scaled to the window and blurred off the Tk thread
+        self.bg_label = ctk.CTkLabel(self, text="")
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        controller.bg_assets.attach(self, self.bg_label, "registration.jpg", radius=5)
 
         # Main registration frame
         self.main_frame = ctk.CTkFrame(self, 
@@ -237,22 +224,6 @@ class RegistrationApp(ctk.CTkFrame):
             
         return valid
 
-    def _get_db_connection(self):
-        """Establish secure MySQL connection with SSL"""
-        try:
-            return mysql.connector.connect(
-                host=os.getenv("DB_HOST"),
-                port=int(os.getenv("DB_PORT")),
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                database=os.getenv("DB_NAME"),
-                ssl_ca=None,  # SSL will be used but without certificate verification
-                ssl_disabled=False
-            )
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Cannot connect to database: {str(e)}")
-            return None
-
     def register_user(self):
         if not self.validate_form():
             return
@@ -265,38 +236,43 @@ class RegistrationApp(ctk.CTkFrame):
         # Hash password
         hashed_password = hashlib.sha256(password.encode()).hexdigest()
         
-        try:
-            conn = self._get_db_connection()
-            if conn:
-                cursor = conn.cursor()
-                
-                # Check if email exists
-                cursor.execute("SELECT email FROM users WHERE email = %s", (email,))
-                if cursor.fetchone():
-                    messagebox.showerror("Error", "Email already registered")
-                    return
-                
-                # Insert new user
-                cursor.execute(
-                    "INSERT INTO users (full_name, email, password_hash, gender) VALUES (%s, %s, %s, %s)",
-                    (name, email, hashed_password, gender)
-                )
+        def insert_user():
+            # Runs on a DB worker thread; borrows from the shared pool
+            with self.controller.db.borrow() as conn:
+                with conn.cursor() as cursor:
+                    # Check if email exists
+                    cursor.execute("SELECT email FROM users WHERE email = %s", (email,))
+                    if cursor.fetchone():
+                        return False
+
+                    # Insert new user
+                    cursor.execute(
+                        "INSERT INTO users (full_name, email, password_hash, gender) VALUES (%s, %s, %s, %s)",
+                        (name, email, hashed_password, gender)
+                    )
                 conn.commit()
-                
-                messagebox.showinfo("Success", "Registration successful!")
-                
-                # Clear form
-                self.name_entry.delete(0, 'end')
-                self.email_entry.delete(0, 'end')
-                self.password_entry.delete(0, 'end')
-                self.terms_checkbox.deselect()
-                self.gender_var.set("Male")
-                
-                # Redirect to login
-                self.controller.show_frame("LoginApp")
-                
-        except Exception as e:
+            return True
+
+        def on_result(created):
+            if not created:
+                messagebox.showerror("Error", "Email already registered")
+                return
+
+            messagebox.showinfo("Success", "Registration successful!")
+
+            # Clear form
+            self.name_entry.delete(0, 'end')
+            self.email_entry.delete(0, 'end')
+            self.password_entry.delete(0, 'end')
+            self.terms_checkbox.deselect()
+            self.gender_var.set("Male")
+
+            # Redirect to login
+            self.controller.show_frame("LoginApp")
+
+        def on_error(e):
             messagebox.showerror("Database Error", f"Registration failed: {str(e)}")
-        finally:
-            if 'conn' in locals() and conn.is_connected():
-                conn.close()
\ No newline at end of file
+
+        self.controller.db_executor.submit(
+            insert_user, on_success=on_result, on_error=on_error, key="register"
+        )
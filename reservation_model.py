@@ -0,0 +1,111 @@
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DATE_FORMAT = "%b %d, %Y"
+
+
+class Reservation(NamedTuple):
+    """One reservation row with native values; formatting happens at render time"""
+    id: str
+    name: str
+    checkin: date
+    amount: Decimal
+
+    def display_values(self) -> Tuple[str, str, str, str]:
+        return self.id, self.name, format_date(self.checkin), format_amount(self.amount)
+
+
+# ========== FORMATTING ==========
+@lru_cache(maxsize=4096)
+def format_date(value: date) -> str:
+    # Bookings share a few thousand distinct dates, so this is mostly cache hits
+    return value.strftime(DATE_FORMAT)
+
+
+def format_amount(value: Decimal) -> str:
+    return f"${value:,.2f}"
+
+
+def parse_date(text: str) -> date:
+    """Parse a date typed in DATE_FORMAT; raises ValueError"""
+    return datetime.strptime(text.strip(), DATE_FORMAT).date()
+
+
+def parse_amount(text: str) -> Decimal:
+    """Parse "$1,234.50" or "1234.5"; raises ValueError"""
+    try:
+        amount = Decimal(text.strip().replace("$", "").replace(",", ""))
+    except InvalidOperation:
+        raise ValueError(f"not an amount: {text!r}")
+    if not amount.is_finite():
+        raise ValueError(f"not an amount: {text!r}")
+    return amount.quantize(Decimal("0.01"))
+
+
+# ========== SORTING ==========
+SORT_KEYS: Dict[str, Callable[[Reservation], object]] = {
+    "id": lambda r: r.id.lower(),
+    "name": lambda r: r.name.lower(),
+    "checkin": attrgetter("checkin"),
+    "amount": attrgetter("amount"),
+}
+
+
+class ReservationStore:
+    """Reservations keyed by ID.
+
+    Lookups, duplicate checks and single-row writes are O(1). The default
+    listing (newest check-in first) and the per-column sort orders are
+    built on first use and cached until the next write, so repeated sorts
+    by a column reuse one O(n log n) sort.
+    """
+
+    def __init__(self, reservations: Iterable[Reservation] = ()):
+        self.replace(reservations)
+
+    # ========== WRITES ==========
+    def replace(self, reservations: Iterable[Reservation]) -> None:
+        self._by_id: Dict[str, Reservation] = {r.id: r for r in reservations}
+        self._invalidate()
+
+    def upsert(self, reservation: Reservation) -> bool:
+        """Insert or replace one reservation; returns True if it was new"""
+        is_new = reservation.id not in self._by_id
+        self._by_id[reservation.id] = reservation
+        self._invalidate()
+        return is_new
+
+    def remove(self, reservation_id: str) -> Optional[Reservation]:
+        reservation = self._by_id.pop(reservation_id, None)
+        if reservation is not None:
+            self._invalidate()
+        return reservation
+
+    def _invalidate(self) -> None:
+        self._listing: Optional[List[Reservation]] = None
+        self._orders: Dict[str, List[Reservation]] = {}
+
+    # ========== READS ==========
+    def get(self, reservation_id: str) -> Optional[Reservation]:
+        return self._by_id.get(reservation_id)
+
+    def __contains__(self, reservation_id: str) -> bool:
+        return reservation_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def values(self) -> List[Reservation]:
+        """Every reservation, newest check-in first"""
+        if self._listing is None:
+            self._listing = sorted(self._by_id.values(), key=attrgetter("checkin"), reverse=True)
+        return self._listing
+
+    def sorted(self, column: str, descending: bool = False) -> List[Reservation]:
+        order = self._orders.get(column)
+        if order is None:
+            order = self._orders[column] = sorted(self._by_id.values(), key=SORT_KEYS[column])
+        return order[::-1] if descending else order
@@ -0,0 +1,109 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SearchController:
+    """Debounced type-ahead search shared by the list screens.
+
+    Keystrokes are coalesced for ``delay_ms`` before a search runs. When the
+    new query extends the previous one, every match is already in the
+    previous result set (the backends use substring matching), so it is
+    filtered locally with ``match`` instead of asking the server again.
+    Server searches go through the DB executor under ``key``, so a newer
+    search (or a list reload sharing the key) drops any stale result.
+    """
+
+    def __init__(
+            self,
+            widget,
+            get_query: Callable[[], str],
+            fetch: Callable[[str], List[Dict]],
+            match: Callable[[Dict, str], bool],
+            on_results: Callable[[List[Dict]], None],
+            on_clear: Callable[[], None],
+            executor=None,
+            key: str = "search",
+            delay_ms: int = 250,
+    ):
+        self.widget = widget
+        self.get_query = get_query
+        self.fetch = fetch
+        self.match = match
+        self.on_results = on_results
+        self.on_clear = on_clear
+        self.executor = executor  # None: ``fetch`` is local and runs inline
+        self.key = key
+        self.delay_ms = delay_ms
+
+        self._job = None
+        self._last_query: Optional[str] = None
+        self._cache: Optional[Tuple[str, List[Dict]]] = None
+
+        self._counters = {
+            "keystrokes": 0,
+            "queries_sent": 0,
+            "served_locally": 0,
+            "unchanged": 0,
+        }
+
+    # ========== INPUT ==========
+    def on_key(self, event=None) -> None:
+        """Bind to ``<KeyRelease>``: restart the debounce timer"""
+        self._counters["keystrokes"] += 1
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+        self._job = self.widget.after(self.delay_ms, self._run)
+
+    def reset(self) -> None:
+        """Forget cached results (call when the underlying data changed)"""
+        self._last_query = None
+        self._cache = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus how many server round trips the controller avoided"""
+        snapshot = dict(self._counters)
+        snapshot["saved"] = snapshot["keystrokes"] - snapshot["queries_sent"]
+        return snapshot
+
+    # ========== SEARCH ==========
+    def _run(self) -> None:
+        self._job = None
+        query = self.get_query()
+
+        if query == self._last_query:
+            self._counters["unchanged"] += 1
+            return
+        self._last_query = query
+
+        if not query:
+            self._cache = None
+            self.on_clear()
+            return
+
+        if self._cache is not None and query.startswith(self._cache[0]):
+            rows = [row for row in self._cache[1] if self.match(row, query)]
+            self._counters["served_locally"] += 1
+            self._deliver(query, rows)
+            return
+
+        self._counters["queries_sent"] += 1
+        if self.executor is None:
+            self._deliver(query, self.fetch(query))
+            return
+
+        self.executor.submit(
+            self.fetch, query,
+            on_success=lambda rows: self._deliver(query, rows),
+            key=self.key
+        )
+        stats = self.stats()
+        logger.debug(
+            f"{self.key}: {stats['queries_sent']} queries sent, "
+            f"{stats['saved']} saved by debounce/local refinement"
+        )
+
+    def _deliver(self, query: str, rows: List[Dict]) -> None:
+        self._cache = (query, rows)
+        self.on_results(rows)
@@ -1,13 +1,100 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from db_helper import DatabaseManager
+from db_helper import search_text_matches
+from search_controller import SearchController
+from virtual_views import RecycledRowList
+
+STAFF_FIELDS = ["staff_id", "full_name", "email", "phone", "address", "status"]
+
+
+class StaffRow:
+    """Widgets for one staff table row, rebound to different staff as the list scrolls"""
+
+    def __init__(self, master):
+        self.frame = ctk.CTkFrame(master, fg_color="white")
+        self.labels = {}
+
+        for col, field in enumerate(STAFF_FIELDS):
+            if field == "status":  # Status column
+                self.status_frame = ctk.CTkFrame(
+                    self.frame,
+                    fg_color="#10b981",
+                    corner_radius=12,
+                    width=80,
+                    height=25
+                )
+                self.status_frame.grid(row=0, column=col, padx=5, sticky="w")
+                self.status_frame.grid_propagate(False)
+
+                self.status_label = ctk.CTkLabel(
+                    self.status_frame,
+                    text="",
+                    font=("Arial", 10),
+                    text_color="white"
+                )
+                self.status_label.place(relx=0.5, rely=0.5, anchor="center")
+            else:
+                self.labels[field] = ctk.CTkLabel(
+                    self.frame,
+                    text="",
+                    font=("Arial", 12),
+                    text_color="#334155"
+                )
+                self.labels[field].grid(row=0, column=col, padx=5, sticky="w")
+
+            self.frame.grid_columnconfigure(col, weight=1 if col < 5 else 0)
+
+        # Action buttons
+        action_frame = ctk.CTkFrame(self.frame, fg_color="white")
+        action_frame.grid(row=0, column=6, padx=5, sticky="e")
+
+        self.edit_btn = ctk.CTkButton(
+            action_frame,
+            text="Edit",
+            fg_color="#3b82f6",
+            text_color="white",
+            width=60,
+            height=25
+        )
+        self.edit_btn.pack(side="left", padx=2)
+
+        self.delete_btn = ctk.CTkButton(
+            action_frame,
+            text="Delete",
+            fg_color="#ef4444",
+            text_color="white",
+            width=60,
+            height=25
+        )
+        self.delete_btn.pack(side="left", padx=2)
+
+    def bind(self, staff, on_edit, on_delete):
+        """Show a staff member in this row"""
+        for field, label in self.labels.items():
+            label.configure(text=staff[field])
+        self.status_frame.configure(fg_color="#10b981" if staff["status"] == "Active" else "#ef4444")
+        self.status_label.configure(text=staff["status"])
+        self.edit_btn.configure(command=lambda: on_edit(staff))
+        self.delete_btn.configure(command=lambda: on_delete(staff))
+
 
 class StaffMemberScreen(ctk.CTkFrame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
-        self.db = DatabaseManager()
+
+        # Debounced type-ahead search; shares the list key with the filters
+        self.search = SearchController(
+            self,
+            get_query=lambda: self.search_entry.get().strip(),
+            fetch=lambda query: self.db.search_staff_members(query),
+            match=self._staff_matches,
+            on_results=self.populate_table,
+            on_clear=lambda: self.filter_staff(self.active_filter.get()),
+            executor=controller.db_executor,
+            key="staff:list"
+        )
         
         # Configure grid layout
         self.grid_rowconfigure(0, weight=1)
@@ -20,6 +107,11 @@ class StaffMemberScreen(ctk.CTkFrame):
         # Load initial data
         self.filter_staff("all")
     
+    @property
+    def db(self):
+        """The app's DatabaseManager; only read on worker threads, since first use connects"""
+        return self.controller.db
+
     def create_sidebar(self):
         sidebar = ctk.CTkFrame(self, width=250, fg_color="#f0f9ff", corner_radius=0)
         sidebar.grid(row=0, column=0, sticky="nsew")
@@ -219,105 +311,56 @@ class StaffMemberScreen(ctk.CTkFrame):
         # Separator
         ctk.CTkFrame(self.table_frame, height=2, fg_color="#e2e8f0").pack(fill="x", padx=15)
         
-        # Table content frame
-        self.table_content = ctk.CTkFrame(self.table_frame, fg_color="white")
-        self.table_content.pack(fill="both", expand=True, padx=15, pady=10)
+        # Table content: a fixed pool of recycled rows, only the visible
+        # ones are ever built
+        body_frame = ctk.CTkFrame(self.table_frame, fg_color="white")
+        body_frame.pack(fill="both", expand=True, padx=15, pady=10)
+
+        self.table_content = ctk.CTkFrame(body_frame, fg_color="white")
+        self.table_content.pack(side="left", fill="both", expand=True)
+
+        y_scroll = ctk.CTkScrollbar(body_frame, orientation="vertical")
+        y_scroll.pack(side="right", fill="y")
+
+        # Message shown if no staff members found
+        empty_label = ctk.CTkLabel(
+            self.table_content,
+            text="No staff members found",
+            text_color="#64748b",
+            font=("Arial", 12)
+        )
+
+        self.rows = RecycledRowList(
+            self.table_content,
+            y_scroll,
+            create_row=StaffRow,
+            bind_row=lambda row, staff: row.bind(staff, self.edit_staff, self.delete_staff),
+            empty_label=empty_label
+        )
     
     def populate_table(self, staff_members):
         """Populate the table with staff member data"""
-        # Clear existing rows
-        for widget in self.table_content.winfo_children():
-            widget.destroy()
-        
-        if not staff_members:
-            # Show message if no staff members found
-            ctk.CTkLabel(
-                self.table_content,
-                text="No staff members found",
-                text_color="#64748b",
-                font=("Arial", 12)
-            ).pack(pady=20)
-            return
-        
-        # Add staff member rows
-        for row, staff in enumerate(staff_members):
-            row_frame = ctk.CTkFrame(self.table_content, fg_color="white")
-            row_frame.pack(fill="x", pady=5)
-            
-            # Display staff member data
-            for col, field in enumerate(["staff_id", "full_name", "email", "phone", "address", "status"]):
-                value = staff[field]
-                if field == "status":  # Status column
-                    status_frame = ctk.CTkFrame(
-                        row_frame,
-                        fg_color="#10b981" if value == "Active" else "#ef4444",
-                        corner_radius=12,
-                        width=80,
-                        height=25
-                    )
-                    status_frame.grid(row=0, column=col, padx=5, sticky="w")
-                    status_frame.grid_propagate(False)
-                    
-                    ctk.CTkLabel(
-                        status_frame,
-                        text=value,
-                        font=("Arial", 10),
-                        text_color="white"
-                    ).place(relx=0.5, rely=0.5, anchor="center")
-                else:
-                    ctk.CTkLabel(
-                        row_frame,
-                        text=value,
-                        font=("Arial", 12),
-                        text_color="#334155"
-                    ).grid(row=0, column=col, padx=5, sticky="w")
-                
-                row_frame.grid_columnconfigure(col, weight=1 if col < 5 else 0)
-            
-            # Action buttons
-            action_frame = ctk.CTkFrame(row_frame, fg_color="white")
-            action_frame.grid(row=0, column=6, padx=5, sticky="e")
-            
-            # Edit button
-            edit_btn = ctk.CTkButton(
-                action_frame,
-                text="Edit",
-                fg_color="#3b82f6",
-                text_color="white",
-                width=60,
-                height=25,
-                command=lambda s=staff: self.edit_staff(s)
-            )
-            edit_btn.pack(side="left", padx=2)
-            
-            # Delete button
-            delete_btn = ctk.CTkButton(
-                action_frame,
-                text="Delete",
-                fg_color="#ef4444",
-                text_color="white",
-                width=60,
-                height=25,
-                command=lambda s=staff: self.delete_staff(s)
-            )
-            delete_btn.pack(side="left", padx=2)
+        self.rows.set_items(staff_members or [])
     
     def filter_staff(self, status):
         """Filter staff members by status"""
         self.active_filter.set(status)
-        staff_members = self.db.get_staff_members(status)
-        self.populate_table(staff_members)
+        self.search.reset()
+        # Filter and search share a key so only the newest list is shown
+        self.controller.db_executor.submit(
+            lambda: self.db.get_staff_members(status),
+            on_success=self.populate_table, key="staff:list"
+        )
     
     def search_staff(self, event):
-        """Search staff members based on input"""
-        query = self.search_entry.get().strip()
-        
-        if not query:
-            self.filter_staff(self.active_filter.get())
-            return
-        
-        staff_members = self.db.search_staff_members(query)
-        self.populate_table(staff_members)
+        """Search staff members based on input (debounced)"""
+        self.search.on_key(event)
+
+    @staticmethod
+    def _staff_matches(staff, query):
+        """Local equivalent of DatabaseManager.search_staff_members (email is case-sensitive)"""
+        return (search_text_matches(staff['email'], query, case_sensitive=True)
+                or any(search_text_matches(staff[column], query) for column in ('full_name', 'phone')))
     
     def open_add_staff_dialog(self):
         """Open dialog to add new staff member"""
@@ -326,9 +369,8 @@ class StaffMemberScreen(ctk.CTkFrame):
         dialog.geometry("500x600")
         dialog.grab_set()
         
-        # Form fields
+        # Form fields (the staff ID is allocated on save)
         fields = [
-            ("Staff ID", "text", ""),
             ("Name", "text", ""),
             ("Email", "text", ""),
             ("Phone", "text", ""),
@@ -407,7 +449,6 @@ class StaffMemberScreen(ctk.CTkFrame):
     def add_staff(self, entries, dialog):
         """Add new staff member to database"""
         staff_data = {
-            'staff_id': entries["Staff ID"].get(),
             'full_name': entries["Name"].get(),
             'email': entries["Email"].get(),
             'phone': entries["Phone"].get(),
@@ -420,12 +461,18 @@ class StaffMemberScreen(ctk.CTkFrame):
             messagebox.showerror("Error", "Please fill in all fields")
             return
         
-        if self.db.add_staff_member(staff_data):
-            messagebox.showinfo("Success", "Staff member added successfully!")
-            self.filter_staff(self.active_filter.get())
-            dialog.destroy()
-        else:
-            messagebox.showerror("Error", "Failed to add staff member")
+        def on_done(added):
+            if added:
+                messagebox.showinfo("Success", f"Staff member {staff_data['staff_id']} added successfully!")
+                self.filter_staff(self.active_filter.get())
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Failed to add staff member")
+
+        self.controller.db_executor.submit(
+            lambda: self.db.add_staff_member(staff_data), on_success=on_done,
+            on_error=self._on_write_error
+        )
     
     def update_staff(self, staff_id, entries, dialog):
         """Update existing staff member in database"""
@@ -446,23 +493,34 @@ class StaffMemberScreen(ctk.CTkFrame):
             messagebox.showerror("Error", "Please fill in all fields")
             return
         
-        if self.db.update_staff_member(staff_id, updated_data):
-            messagebox.showinfo("Success", "Staff member updated successfully!")
-            self.filter_staff(self.active_filter.get())
-            dialog.destroy()
-        else:
-            messagebox.showerror("Error", "Failed to update staff member")
+        def on_done(updated):
+            if updated:
+                messagebox.showinfo("Success", "Staff member updated successfully!")
+                self.filter_staff(self.active_filter.get())
+                dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Failed to update staff member")
+
+        self.controller.db_executor.submit(
+            lambda: self.db.update_staff_member(staff_id, updated_data), on_success=on_done,
+            on_error=self._on_write_error
+        )
     
+    def _on_write_error(self, e):
+        """Tk thread: a background add/update/delete raised"""
+        messagebox.showerror("Database Error", f"Database operation failed: {str(e)}")
+
     def delete_staff(self, staff):
         """Delete staff member from database"""
         if messagebox.askyesno("Confirm", f"Delete staff member {staff['full_name']}?"):
-            if self.db.delete_staff_member(staff['staff_id']):
-                messagebox.showinfo("Success", "Staff member deleted")
-                self.filter_staff(self.active_filter.get())
-            else:
-                messagebox.showerror("Error", "Failed to delete staff member")
-    
-    def __del__(self):
-        """Clean up database connection when frame is destroyed"""
-        if hasattr(self, 'db'):
-            self.db.close()
\ No newline at end of file
+            def on_done(deleted):
+                if deleted:
+                    messagebox.showinfo("Success", "Staff member deleted")
+                    self.filter_staff(self.active_filter.get())
+                else:
+                    messagebox.showerror("Error", "Failed to delete staff member")
+
+            self.controller.db_executor.submit(
+                lambda: self.db.delete_staff_member(staff['staff_id']), on_success=on_done,
+                on_error=self._on_write_error
+            )
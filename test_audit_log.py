@@ -0,0 +1,47 @@
+import threading
+
+from audit_log import AuditLogWriter
+
+
+def test_events_are_batched_and_flushed_on_close():
+    batches = []
+    writer = AuditLogWriter(batches.append, batch_size=3, flush_interval=60)
+
+    for i in range(7):
+        assert writer.log(i, f"user{i}@example.com", "login")
+    writer.close()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert batches[0][0] == (0, "user0@example.com", "login", "127.0.0.1", "Python App")
+    stats = writer.stats()
+    assert stats["written"] == 7 and stats["flushes"] == 3 and stats["dropped"] == 0
+    assert not writer.log(8, "late@example.com", "login")
+
+
+def test_full_queue_drops_and_failures_are_counted():
+    release = threading.Event()
+
+    def slow_write(batch):
+        release.wait(5)
+        raise RuntimeError("database down")
+
+    writer = AuditLogWriter(slow_write, max_queue=2, batch_size=1, flush_interval=60)
+    writer.log(1, "a@example.com", "fail")
+    # Wait for the writer to pick up the first event, then fill the queue
+    while writer.stats()["pending"]:
+        pass
+    results = [writer.log(i, "b@example.com", "fail") for i in range(3)]
+    release.set()
+    assert writer.flush()
+
+    stats = writer.stats()
+    assert results == [True, True, False]
+    assert stats["dropped"] == 1
+    assert stats["failed"] == 3 and stats["written"] == 0
+    writer.close()
+
+
+if __name__ == "__main__":
+    test_events_are_batched_and_flushed_on_close()
+    test_full_queue_drops_and_failures_are_counted()
+    print("✅ Audit log tests passed")
@@ -6,9 +6,10 @@ def test_authentication():
     
     with DatabaseManager() as db:
         # Cleanup existing test user
-        with db.connection.cursor() as cursor:
-            cursor.execute("DELETE FROM users WHERE email = %s", (test_email,))
-            db.connection.commit()
+        with db.borrow() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("DELETE FROM users WHERE email = %s", (test_email,))
+            conn.commit()
         
         # Test registration
         print("\n=== TESTING REGISTRATION ===")
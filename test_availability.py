@@ -0,0 +1,85 @@
+from datetime import date
+
+from availability import AvailabilityIndex
+
+ROOMS = [
+    {"room_id": 1, "room_number": "101", "room_type": "Standard", "status": "Available"},
+    {"room_id": 2, "room_number": "102", "room_type": "Standard", "status": "Available"},
+    {"room_id": 3, "room_number": "201", "room_type": "Suite", "status": "Available"},
+    {"room_id": 4, "room_number": "202", "room_type": "Suite", "status": "Maintenance"},
+]
+
+
+def free_numbers(index, checkin, checkout, room_type=None):
+    return [room["room_number"] for room in index.find_available_rooms(checkin, checkout, room_type)]
+
+
+def test_search_respects_overlaps_and_checkout_day():
+    index = AvailabilityIndex()
+    index.set_rooms(ROOMS)
+    index.load([
+        ("RES1", 1, date(2024, 5, 1), date(2024, 5, 4)),
+        ("RES2", 1, date(2024, 5, 10), date(2024, 5, 12)),
+        ("RES3", 3, date(2024, 5, 3), date(2024, 5, 6)),
+    ])
+
+    # Checkout day is free for the next arrival; maintenance rooms never show
+    assert free_numbers(index, date(2024, 5, 4), date(2024, 5, 10)) == ["101", "102"]
+    assert free_numbers(index, date(2024, 5, 2), date(2024, 5, 3)) == ["102", "201"]
+    assert free_numbers(index, date(2024, 5, 5), date(2024, 5, 11), "Suite") == []
+    assert len(index) == 3
+
+    try:
+        index.find_available_rooms(date(2024, 5, 4), date(2024, 5, 4))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty stay accepted")
+
+
+def test_incremental_updates_match_a_rebuild():
+    index = AvailabilityIndex()
+    index.set_rooms(ROOMS)
+    index.add("RES1", 1, date(2024, 5, 1), date(2024, 5, 4))
+    index.add("RES2", 2, date(2024, 5, 1), date(2024, 5, 4))
+    assert free_numbers(index, date(2024, 5, 2), date(2024, 5, 3)) == ["201"]
+
+    # Moving a booking frees its old room; removing frees it entirely
+    index.add("RES1", 3, date(2024, 5, 2), date(2024, 5, 3))
+    assert free_numbers(index, date(2024, 5, 2), date(2024, 5, 3)) == ["101"]
+    assert index.remove("RES2") and not index.remove("RES2")
+    assert free_numbers(index, date(2024, 5, 2), date(2024, 5, 3)) == ["101", "102"]
+
+    # Overlapping data (double booking) still answers correctly
+    index.add("RES4", 1, date(2024, 6, 1), date(2024, 6, 20))
+    index.add("RES5", 1, date(2024, 6, 2), date(2024, 6, 3))
+    assert not index.is_free(1, date(2024, 6, 10), date(2024, 6, 11))
+    index.remove("RES4")
+    assert index.is_free(1, date(2024, 6, 10), date(2024, 6, 11))
+
+
+def test_chunked_load_keeps_earlier_chunks():
+    index = AvailabilityIndex()
+    index.set_rooms(ROOMS)
+    index.load([
+        ("RES1", 1, date(2024, 5, 1), date(2024, 5, 4)),
+        ("RES2", 2, date(2024, 5, 1), date(2024, 5, 4)),
+    ])
+    # A later chunk adds to room 101 and reloads RES2 into room 201
+    index.load([
+        ("RES3", 1, date(2024, 5, 10), date(2024, 5, 12)),
+        ("RES2", 3, date(2024, 5, 1), date(2024, 5, 4)),
+    ])
+
+    assert len(index) == 3
+    assert free_numbers(index, date(2024, 5, 2), date(2024, 5, 3)) == ["102"]
+    assert free_numbers(index, date(2024, 5, 11), date(2024, 5, 12)) == ["102", "201"]
+    assert index.remove("RES1") and index.remove("RES2") and index.remove("RES3")
+    assert free_numbers(index, date(2024, 5, 1), date(2024, 5, 12)) == ["101", "102", "201"]
+
+
+if __name__ == "__main__":
+    test_search_respects_overlaps_and_checkout_day()
+    test_incremental_updates_match_a_rebuild()
+    test_chunked_load_keeps_earlier_chunks()
+    print("✅ Availability tests passed")
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+from datetime import datetime
+from decimal import Decimal
+
+from bulk_import import BulkImporter
+
+
+class FakeDatabase:
+    """Records upserts; rejects rows whose reservation_id is unknown, like the FK would"""
+
+    def __init__(self, existing=None):
+        self.chunks = []
+        self.owner_columns = set()
+        self.existing = existing or {}
+        self.next_value = 0
+        self.invalidated = False
+
+    def import_rows(self, table, columns, rows, key_columns=(), owner_column=None):
+        self.chunks.append((table, rows))
+        self.owner_columns.add(owner_column)
+        return [(i, "foreign key constraint fails") for i, row in enumerate(rows)
+                if table == "transactions" and row[2] == "MISSING"]
+
+    def find_existing(self, table, match_columns, keys, columns):
+        keys = set(keys)
+        return [row for row in self.existing.get(table, []) if tuple(row[c] for c in match_columns) in keys]
+
+    def next_id(self, sequence):
+        self.next_value += 1
+        return f"CUST{self.next_value:010d}"
+
+    def invalidate_caches(self):
+        self.invalidated = True
+
+
+def write_file(suffix, text):
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(handle, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def read_rejects(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_csv_rows_are_validated_chunked_and_rejected_to_side_file():
+    path = write_file(".csv", "\ufeffcustomer_id,full_name,email,address,phone,status\n"
+                              "C1,Ada Obi,ada@example.com,1 Main St,555-0100,Active\n"
+                              ",Kwame Mensah,kwame@example.com,\"2 Oak Ave\nAccra\",555-0101,\n"
+                              "C3,No Email,,3 Pine Rd,555-0102,Active\n"
+                              "C4,Bad Status,b@example.com,4 Elm St,555-0103,Retired\n")
+    db = FakeDatabase()
+    updates = []
+    result = BulkImporter(db, "customers", chunk_size=1, workers=0, on_progress=updates.append).run(path)
+
+    assert (result.read, result.written, result.rejected) == (4, 2, 2)
+    assert result.done and result.fraction == 1.0 and updates[-1] == result
+    assert [rows for _, rows in db.chunks] == [
+        [("C1", "Ada Obi", "ada@example.com", "1 Main St", "555-0100", "Active")],
+        [("CUST0000000001", "Kwame Mensah", "kwame@example.com", "2 Oak Ave\nAccra", "555-0101", "Active")],
+    ]
+    assert db.invalidated
+
+    rejects = read_rejects(path + ".rejects.jsonl")
+    assert [(r["line"], r["error"]) for r in rejects] == [
+        (5, "email is required"),
+        (6, "status must be one of Active, Inactive"),
+    ]
+    os.remove(path)
+    os.remove(path + ".rejects.jsonl")
+
+
+def test_jsonl_in_worker_pool_reports_database_failures():
+    lines = [json.dumps({"reservation_id": "RES1" if n % 2 else "MISSING", "amount": "12.50",
+                         "transaction_date": "2024-05-01T10:00:00"}) for n in range(10)]
+    lines.insert(3, "{not json")
+    path = write_file(".jsonl", "\n".join(lines) + "\n")
+    db = FakeDatabase({"transactions": [{"transaction_id": 7, "customer_id": None, "reservation_id": "RES1",
+                                         "amount": Decimal("12.50"), "transaction_date": datetime(2024, 5, 1, 10)}]})
+    result = BulkImporter(db, "transactions", chunk_size=4, workers=2).run(path)
+
+    assert (result.read, result.written, result.rejected) == (11, 5, 6)
+    written = [row for _, rows in db.chunks for row in rows if row[2] == "RES1"]
+    assert written[0][3] == Decimal("12.50")
+    # Already imported: every copy updates transaction 7 instead of adding a row
+    assert {row[0] for row in written} == {7}
+
+    rejects = read_rejects(path + ".rejects.jsonl")
+    assert rejects[0]["line"] == 4 and rejects[0]["error"].startswith("invalid JSON")
+    assert {r["error"] for r in rejects[1:]} == {"foreign key constraint fails"}
+    os.remove(path)
+    os.remove(path + ".rejects.jsonl")
+
+
+def test_rows_never_take_over_another_customer_or_reservation():
+    db = FakeDatabase({
+        "customers": [{"customer_id": "C1", "email": "ada@example.com"}],
+        "reservations": [{"reservation_id": "RES1", "user_id": 2}],
+    })
+    path = write_file(".csv", "customer_id,full_name,email,address,phone\n"
+                              ",Ada Obi,ada@example.com,1 Main St,555-0100\n"
+                              "C2,Ada Capital,Ada@example.com,1 Main St,555-0100\n"
+                              "C9,Ada Copy,ada@example.com,1 Main St,555-0100\n"
+                              ",Kwame Mensah,kwame@example.com,2 Oak Ave,555-0101\n"
+                              ",Kwame Again,kwame@example.com,2 Oak Ave,555-0101\n")
+    result = BulkImporter(db, "customers", workers=0).run(path)
+
+    # Emails are case-sensitive: Ada@ is a different customer from ada@
+    assert (result.written, result.rejected) == (4, 1)
+    assert [row[0] for _, rows in db.chunks for row in rows] == ["C1", "C2", "CUST0000000001", "CUST0000000001"]
+    assert read_rejects(path + ".rejects.jsonl")[0]["error"] == "email already used by customer_id C1"
+    os.remove(path)
+    os.remove(path + ".rejects.jsonl")
+
+    path = write_file(".jsonl", "\n".join(json.dumps({"reservation_id": rid, "guest_name": "Ada Obi",
+                                                       "checkin_date": "2024-05-01", "booking_amount": "90"})
+                                           for rid in ("RES1", "RES2")) + "\n")
+    result = BulkImporter(db, "reservations", {"user_id": 1}, workers=0).run(path)
+
+    assert (result.written, result.rejected) == (1, 1)
+    assert read_rejects(path + ".rejects.jsonl")[0]["error"] == "reservation_id RES1 belongs to another user"
+    assert "user_id" in db.owner_columns
+    os.remove(path)
+    os.remove(path + ".rejects.jsonl")
+
+
+if __name__ == "__main__":
+    test_csv_rows_are_validated_chunked_and_rejected_to_side_file()
+    test_jsonl_in_worker_pool_reports_database_failures()
+    test_rows_never_take_over_another_customer_or_reservation()
+    print("✅ Bulk import tests passed")
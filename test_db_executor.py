@@ -0,0 +1,106 @@
+import threading
+import time
+
+from db_executor import DBExecutor
+
+
+class FakeRoot:
+    """Stand-in for a Tk root: ``after`` callbacks run when ``pump`` is called"""
+
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+        return callback
+
+    def after_cancel(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+
+    def pump(self, seconds=0.5):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            jobs, self.jobs = self.jobs, []
+            for job in jobs:
+                job()
+            time.sleep(0.01)
+
+
+def test_results_are_delivered_on_the_ui_thread():
+    root = FakeRoot()
+    busy_changes = []
+    executor = DBExecutor(root, on_busy_change=busy_changes.append)
+    results = []
+
+    executor.submit(lambda: 42, on_success=lambda r: results.append((r, threading.current_thread())))
+    root.pump(0.2)
+    executor.shutdown()
+
+    assert results == [(42, threading.current_thread())]
+    assert busy_changes == [True, False]
+
+
+def test_superseded_results_are_dropped():
+    root = FakeRoot()
+    executor = DBExecutor(root)
+    release = threading.Event()
+    results = []
+
+    def slow():
+        release.wait(1)
+        return "stale"
+
+    executor.submit(slow, on_success=results.append, key="search")
+    executor.submit(lambda: "fresh", on_success=results.append, key="search")
+    release.set()
+    root.pump(0.2)
+    executor.shutdown()
+
+    assert results == ["fresh"]
+
+
+def test_superseding_a_queued_request_does_not_deadlock():
+    root = FakeRoot()
+    executor = DBExecutor(root, max_workers=1)
+    release = threading.Event()
+    results = []
+
+    # The only worker is busy, so the first keyed request stays queued
+    executor.submit(release.wait, 1)
+    executor.submit(lambda: "stale", on_success=results.append, key="list")
+    submitter = threading.Thread(
+        target=lambda: executor.submit(lambda: "fresh", on_success=results.append, key="list"),
+        daemon=True
+    )
+    submitter.start()
+    submitter.join(1)
+    assert not submitter.is_alive(), "submit deadlocked"
+
+    release.set()
+    root.pump(0.2)
+    executor.shutdown()
+    assert results == ["fresh"]
+
+
+def test_errors_go_to_on_error():
+    root = FakeRoot()
+    executor = DBExecutor(root)
+    errors = []
+
+    def fail():
+        raise ValueError("boom")
+
+    executor.submit(fail, on_error=errors.append)
+    root.pump(0.2)
+    executor.shutdown()
+
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+if __name__ == "__main__":
+    test_results_are_delivered_on_the_ui_thread()
+    test_superseded_results_are_dropped()
+    test_superseding_a_queued_request_does_not_deadlock()
+    test_errors_go_to_on_error()
+    print("✅ DB executor tests passed")
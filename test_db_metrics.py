@@ -0,0 +1,82 @@
+import os
+import tempfile
+
+from db_metrics import (
+    InstrumentedCursor, QueryMetrics, instrument_methods, params_fingerprint
+)
+
+
+class FakeCursor:
+    """Stand-in for a MySQL cursor"""
+
+    def __init__(self, rows=(), fail=False):
+        self.rows = list(rows)
+        self.fail = fail
+        self.with_rows = bool(rows)
+
+    def execute(self, statement, params=None):
+        if self.fail:
+            raise RuntimeError("boom")
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+@instrument_methods
+class FakeManager:
+    def __init__(self, registry):
+        self.registry = registry
+
+    def list_guests(self):
+        with InstrumentedCursor(FakeCursor([("Ada", 1), ("Bo", None)]), self.registry) as cursor:
+            cursor.execute("SELECT name, room FROM guests WHERE name LIKE %s", ("A%",))
+            return self.count_guests() + len(cursor.fetchall())
+
+    def count_guests(self):
+        with InstrumentedCursor(FakeCursor(fail=True), self.registry) as cursor:
+            try:
+                cursor.execute("SELECT COUNT(*) FROM guests")
+            except RuntimeError:
+                return 0
+
+
+def test_queries_are_attributed_to_the_outer_method():
+    registry = QueryMetrics(slow_query_ms=0)
+    assert FakeManager(registry).list_guests() == 2
+
+    stats = registry.snapshot()
+    assert set(stats) == {"list_guests"}
+    assert stats["list_guests"]["count"] == 1
+    assert stats["list_guests"]["rows"] == 2
+    assert stats["list_guests"]["bytes"] == 3 + 8 + 2
+    assert stats["list_guests"]["errors"] == 1
+
+    slow = registry.slow_queries()
+    assert slow[0]["params"] == "(str(2))"
+    assert params_fingerprint({"id": 5}) == "(int)"
+
+
+def test_prometheus_export():
+    registry = QueryMetrics()
+    registry.record("get_customers", "SELECT 1", None, 3.0, 10, 100)
+    registry.record("get_customers", "SELECT 1", None, 30.0, 0, 0)
+
+    path = os.path.join(tempfile.mkdtemp(), "db.prom")
+    registry.export_prometheus(path, {"checkouts": 4})
+    with open(path) as f:
+        text = f.read()
+
+    assert 'hotel_db_query_duration_seconds_bucket{method="get_customers",le="0.005"} 1' in text
+    assert 'hotel_db_query_duration_seconds_bucket{method="get_customers",le="+Inf"} 2' in text
+    assert 'hotel_db_rows_fetched_total{method="get_customers"} 10' in text
+    assert 'hotel_db_pool{stat="checkouts"} 4' in text
+    assert registry.snapshot()["get_customers"]["p50_ms"] == 5.0
+
+
+if __name__ == "__main__":
+    test_queries_are_attributed_to_the_outer_method()
+    test_prometheus_export()
+    print("✅ Query metrics tests passed")
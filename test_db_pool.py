@@ -0,0 +1,88 @@
+import threading
+import time
+
+from db_pool import ConnectionPool, PoolExhaustedError
+
+
+class FakeConnection:
+    """Stand-in for a MySQL connection"""
+
+    def __init__(self):
+        self.healthy = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.healthy and not self.closed
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_connections_are_reused():
+    created = []
+    pool = ConnectionPool(lambda: created.append(FakeConnection()) or created[-1], size=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["created"] == 1
+
+
+def test_failed_validation_replaces_connection():
+    pool = ConnectionPool(FakeConnection, size=1)
+
+    with pool.connection() as conn:
+        pass
+    conn.healthy = False
+
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert conn.closed
+    assert pool.stats()["failed_validations"] == 1
+
+
+def test_idle_connections_are_evicted():
+    pool = ConnectionPool(FakeConnection, size=1, idle_timeout=0.01)
+
+    with pool.connection() as conn:
+        pass
+    time.sleep(0.05)
+
+    with pool.connection() as fresh:
+        assert fresh is not conn
+    assert conn.closed
+    assert pool.stats()["evicted_idle"] == 1
+
+
+def test_waits_are_counted_and_time_out():
+    pool = ConnectionPool(FakeConnection, size=1, checkout_timeout=0.05)
+    held = pool.acquire()
+
+    try:
+        pool.acquire()
+        assert False, "checkout should have timed out"
+    except PoolExhaustedError:
+        pass
+
+    released = threading.Timer(0.02, pool.release, args=(held,))
+    pool.checkout_timeout = 1.0
+    released.start()
+    assert pool.acquire() is held
+    assert pool.stats()["waits"] == 2
+
+
+if __name__ == "__main__":
+    test_connections_are_reused()
+    test_failed_validation_replaces_connection()
+    test_idle_connections_are_evicted()
+    test_waits_are_counted_and_time_out()
+    print("✅ Connection pool tests passed")
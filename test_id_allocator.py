@@ -0,0 +1,61 @@
+import threading
+
+from id_allocator import IdAllocator
+
+
+class FakeSequences:
+    """Stands in for id_sequences: next_value = LAST_INSERT_ID(next_value + size)"""
+
+    def __init__(self):
+        self.next_value = {"reservations": 1, "customers": 1, "staff": 1}
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def reserve_block(self, sequence, size):
+        with self.lock:
+            self.calls += 1
+            self.next_value[sequence] += size
+            return self.next_value[sequence] - size
+
+
+def test_ids_come_from_blocks_with_one_reservation_each():
+    sequences = FakeSequences()
+    allocator = IdAllocator(sequences.reserve_block, block_size=3)
+
+    ids = [allocator.next_id("reservations") for _ in range(7)]
+    assert ids[0] == "RES0000000001" and ids[-1] == "RES0000000007"
+    assert allocator.next_id("staff") == "STAFF0000000001"
+    assert sequences.calls == 4  # three reservation blocks, one staff block
+    assert allocator.stats()["remaining"] == {"reservations": 2, "staff": 2}
+
+    try:
+        allocator.next_id("rooms")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown sequence accepted")
+
+
+def test_terminals_sharing_a_sequence_never_collide():
+    sequences = FakeSequences()
+    terminals = [IdAllocator(sequences.reserve_block, block_size=size) for size in (1, 5, 50)]
+    issued = []
+
+    def work(allocator):
+        ids = [allocator.next_id("customers") for _ in range(500)]
+        with sequences.lock:
+            issued.extend(ids)
+
+    threads = [threading.Thread(target=work, args=(t,)) for t in terminals for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(issued) == 3000 and len(set(issued)) == 3000
+
+
+if __name__ == "__main__":
+    test_ids_come_from_blocks_with_one_reservation_each()
+    test_terminals_sharing_a_sequence_never_collide()
+    print("✅ ID allocator tests passed")
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time allowed for ``import main`` (IMPORT_BUDGET_MS overrides)
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+# Loaded only when their screen or action is first used
+DEFERRED = ("matplotlib", "fpdf", "tksheet", "mysql")
+
+
+def import_times(module):
+    """{module: cumulative µs} from ``python -X importtime -c 'import module'``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_main_import_stays_within_budget():
+    for dependency in ("customtkinter", "PIL"):
+        if importlib.util.find_spec(dependency) is None:
+            raise unittest.SkipTest(f"{dependency} is not installed")
+
+    times = import_times("main")
+
+    loaded = sorted(name for name in times if name.split(".")[0] in DEFERRED)
+    assert not loaded, f"imported at startup: {loaded}"
+    assert times["main"] / 1000 <= IMPORT_BUDGET_MS, (
+        f"import main took {times['main'] / 1000:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    test_main_import_stays_within_budget()
+    print("✅ Import time tests passed")
@@ -0,0 +1,50 @@
+from datetime import date
+from decimal import Decimal
+
+from reservation_model import Reservation, ReservationStore, parse_amount, parse_date
+
+RESERVATIONS = [
+    Reservation("RES002", "bob", date(2024, 5, 3), Decimal("1200.00")),
+    Reservation("res001", "Alice", date(2024, 12, 1), Decimal("99.50")),
+    Reservation("RES003", "Carol", date(2023, 1, 15), Decimal("250.00")),
+]
+
+
+def test_values_are_native_and_formatted_for_display():
+    record = RESERVATIONS[0]
+    assert record.display_values() == ("RES002", "bob", "May 03, 2024", "$1,200.00")
+    assert parse_date(" May 03, 2024 ") == record.checkin
+    assert parse_amount("$1,200") == record.amount
+    for bad in ("abc", "NaN", ""):
+        try:
+            parse_amount(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} parsed as an amount")
+
+
+def test_store_is_keyed_and_caches_sort_orders():
+    store = ReservationStore(RESERVATIONS)
+    assert "RES002" in store and "RES999" not in store
+    assert [r.id for r in store.values()] == ["res001", "RES002", "RES003"]
+
+    by_date = store.sorted("checkin")
+    assert [r.id for r in by_date] == ["RES003", "RES002", "res001"]
+    assert store.sorted("checkin") is by_date
+    assert [r.id for r in store.sorted("amount", descending=True)] == ["RES002", "RES003", "res001"]
+    assert [r.name for r in store.sorted("name")] == ["Alice", "bob", "Carol"]
+    assert [r.id for r in store.sorted("id")] == ["res001", "RES002", "RES003"]
+
+    # Writes invalidate the cached orders
+    assert not store.upsert(RESERVATIONS[2]._replace(checkin=date(2025, 1, 1)))
+    assert store.upsert(Reservation("RES004", "Dan", date(2022, 2, 2), Decimal("10.00")))
+    assert store.remove("RES002").name == "bob" and store.remove("RES002") is None
+    assert [r.id for r in store.values()] == ["RES003", "res001", "RES004"]
+    assert [r.id for r in store.sorted("checkin")] == ["RES004", "res001", "RES003"]
+    assert len(store) == 3
+
+
+if __name__ == "__main__":
+    test_values_are_native_and_formatted_for_display()
+    test_store_is_keyed_and_caches_sort_orders()
+    print("✅ Reservation model tests passed")
@@ -0,0 +1,67 @@
+from search_controller import SearchController
+
+
+class FakeWidget:
+    """Stand-in for a Tk widget: keeps the last scheduled ``after`` job"""
+
+    def __init__(self):
+        self.job = None
+
+    def after(self, ms, callback):
+        self.job = callback
+        return callback
+
+    def after_cancel(self, job):
+        self.job = None
+
+    def fire(self):
+        job, self.job = self.job, None
+        job()
+
+
+ROWS = [{"name": "John"}, {"name": "Joan"}, {"name": "Mary"}]
+
+
+def make_controller(widget, box, fetched, shown):
+    return SearchController(
+        widget,
+        get_query=lambda: box[0],
+        fetch=lambda q: fetched.append(q) or [r for r in ROWS if q in r["name"].lower()],
+        match=lambda r, q: q in r["name"].lower(),
+        on_results=shown.append,
+        on_clear=lambda: shown.append(ROWS),
+    )
+
+
+def test_keystrokes_are_debounced():
+    widget, box, fetched, shown = FakeWidget(), [""], [], []
+    search = make_controller(widget, box, fetched, shown)
+
+    for text in ("j", "jo", "joh"):
+        box[0] = text
+        search.on_key()
+    widget.fire()
+
+    assert fetched == ["joh"]
+    assert shown == [[{"name": "John"}]]
+
+
+def test_refinements_are_served_locally():
+    widget, box, fetched, shown = FakeWidget(), ["jo"], [], []
+    search = make_controller(widget, box, fetched, shown)
+    search.on_key()
+    widget.fire()
+
+    box[0] = "joa"
+    search.on_key()
+    widget.fire()
+
+    assert fetched == ["jo"]
+    assert shown[-1] == [{"name": "Joan"}]
+    assert search.stats()["served_locally"] == 1
+
+
+if __name__ == "__main__":
+    test_keystrokes_are_debounced()
+    test_refinements_are_served_locally()
+    print("✅ Search controller tests passed")
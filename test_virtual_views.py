@@ -0,0 +1,163 @@
+import bisect
+
+from virtual_views import PagedTreeview, RecycledRowList
+
+
+class FakeTree:
+    """Stand-in for a ttk.Treeview holding rows in display order"""
+
+    def __init__(self):
+        self.rows = []
+        self.counter = 0
+
+    def configure(self, **kwargs):
+        pass
+
+    def insert(self, parent, index, values=(), tags=()):
+        self.counter += 1
+        iid = f"I{self.counter}"
+        self.rows.insert(len(self.rows) if index == "end" else index, (iid, values))
+        return iid
+
+    def delete(self, *iids):
+        gone = set(iids)
+        self.rows = [row for row in self.rows if row[0] not in gone]
+
+    def get_children(self):
+        return [iid for iid, _ in self.rows]
+
+    def yview_scroll(self, number, what):
+        pass
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+
+DATA = [{"name": f"Guest {n:05d}", "id": n} for n in range(1000)]
+KEYS = [(row["name"], row["id"]) for row in DATA]
+
+
+def fetch_page(after_key, before_key, limit):
+    if before_key is not None:
+        end = bisect.bisect_left(KEYS, before_key)
+        return DATA[max(0, end - limit):end]
+    start = 0 if after_key is None else bisect.bisect_right(KEYS, after_key)
+    return DATA[start:start + limit]
+
+
+def make_pager(tree):
+    return PagedTreeview(
+        tree, FakeScrollbar(),
+        row_key=lambda row: (row["name"], row["id"]),
+        row_values=lambda row: (row["id"], row["name"]),
+        page_size=50, max_pages=3
+    )
+
+
+def shown_ids(tree):
+    return [values[0] for _, values in tree.rows]
+
+
+def test_window_stays_bounded_while_scrolling():
+    tree = FakeTree()
+    pager = make_pager(tree)
+    pager.reset(fetch_page)
+
+    for _ in range(10):
+        pager._on_yview("0.9", "1.0")
+    assert pager.row_count == 150
+    assert shown_ids(tree) == list(range(400, 550))
+
+    pager._on_yview("0.0", "0.1")
+    assert shown_ids(tree) == list(range(350, 500))
+
+
+def test_show_rows_disables_paging():
+    tree = FakeTree()
+    pager = make_pager(tree)
+    pager.reset(fetch_page)
+    pager.show_rows(DATA[:3])
+
+    pager._on_yview("0.9", "1.0")
+    assert shown_ids(tree) == [0, 1, 2]
+
+
+def test_failed_page_fetch_is_retried_on_next_scroll():
+    tree = FakeTree()
+    pager = make_pager(tree)
+    pager.reset(fetch_page)
+    failures = [1]
+
+    def flaky(after_key, before_key, limit):
+        if failures:
+            failures.pop()
+            raise ConnectionError("server went away")
+        return fetch_page(after_key, before_key, limit)
+
+    pager._fetch_page = flaky
+    pager._on_yview("0.9", "1.0")
+    assert pager.row_count == 50 and pager._loading is None
+
+    pager._on_yview("0.9", "1.0")
+    assert shown_ids(tree) == list(range(100))
+
+
+class FakeWidget:
+    """Stand-in for a Tk frame / scrollbar"""
+
+    def __init__(self, height=400):
+        self.height = height
+        self.placed = None
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def winfo_children(self):
+        return []
+
+    def winfo_height(self):
+        return self.height
+
+    def configure(self, **kwargs):
+        pass
+
+    def set(self, first, last):
+        pass
+
+    def place(self, **kwargs):
+        self.placed = kwargs
+
+    def place_forget(self):
+        self.placed = None
+
+
+class FakeRow:
+    def __init__(self, master):
+        self.frame = FakeWidget()
+        self.item = None
+
+
+def test_recycled_rows_are_bounded_and_rebound_lazily():
+    binds = []
+
+    def bind_row(row, item):
+        binds.append(item)
+        row.item = item
+
+    rows = RecycledRowList(FakeWidget(height=400), FakeWidget(), FakeRow, bind_row, row_height=40)
+    rows.set_items(list(range(100_000)))
+
+    assert rows.widget_rows == 13  # 10 visible + 1 partial + 2 overscan
+    binds.clear()
+    rows._on_scrollbar("scroll", 1, "units")
+    assert binds == [13]
+
+
+if __name__ == "__main__":
+    test_window_stays_bounded_while_scrolling()
+    test_show_rows_disables_paging()
+    test_failed_page_fetch_is_retried_on_next_scroll()
+    test_recycled_rows_are_bounded_and_rebound_lazily()
+    print("✅ Virtual view tests passed")
@@ -0,0 +1,284 @@
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PagedTreeview:
+    """Shows a large keyset-ordered result in a ``ttk.Treeview`` one page at a time.
+
+    Only a sliding window of ``max_pages`` pages is kept in the tree. When
+    the view nears the bottom the next page (after the last row's key) is
+    appended and the top page dropped; near the top the previous page
+    (before the first row's key) is prepended and the bottom page dropped.
+    The scroll position is shifted by the rows added or removed so the
+    visible rows stay put.
+
+    ``fetch_page(after_key, before_key, limit)`` must return rows in
+    ascending key order; ``row_key``, ``row_values`` and ``row_tags`` map a
+    row to its keyset key, Treeview values and tags.
+    """
+
+    def __init__(
+            self,
+            tree,
+            scrollbar,
+            row_key: Callable[[Dict], Tuple],
+            row_values: Callable[[Dict], Tuple],
+            row_tags: Callable[[Dict], Tuple] = lambda row: (),
+            page_size: int = 100,
+            max_pages: int = 3,
+            prefetch_margin: float = 0.15,
+            executor=None,
+            key: str = "paged",
+    ):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_key = row_key
+        self.row_values = row_values
+        self.row_tags = row_tags
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.prefetch_margin = prefetch_margin
+        self.executor = executor  # None: pages are fetched inline
+        self.key = key
+
+        self._fetch_page: Optional[Callable[..., List[Dict]]] = None
+        self._pages = deque()  # each page is a list of (iid, key)
+        self._at_start = True
+        self._at_end = True
+        self._loading: Optional[str] = None
+
+        self.tree.configure(yscrollcommand=self._on_yview)
+
+    # ========== PUBLIC API ==========
+    def reset(self, fetch_page: Callable[..., List[Dict]]) -> None:
+        """Start over from the first page of a new result"""
+        self._fetch_page = fetch_page
+        self._clear()
+        self._at_start = True
+        self._at_end = False
+        self._load("first", None, None)
+
+    def show_rows(self, rows: List[Dict]) -> None:
+        """Show a complete, unpaged result (e.g. search results)"""
+        self._fetch_page = None
+        self._clear()
+        self._at_start = self._at_end = True
+        if rows:
+            self._pages.append(self._insert(rows, "end"))
+
+    @property
+    def row_count(self) -> int:
+        """Rows currently materialized in the tree"""
+        return sum(len(page) for page in self._pages)
+
+    # ========== SCROLLING ==========
+    def _on_yview(self, first, last) -> None:
+        self.scrollbar.set(first, last)
+        if self._fetch_page is None or self._loading:
+            return
+
+        first, last = float(first), float(last)
+        if last >= 1.0 - self.prefetch_margin and not self._at_end:
+            self._load("next", self._pages[-1][-1][1], None)
+        elif first <= self.prefetch_margin and not self._at_start:
+            self._load("previous", None, self._pages[0][0][1])
+
+    def _load(self, direction: str, after_key, before_key) -> None:
+        self._loading = direction
+        fetch = self._fetch_page
+        if self.executor is None:
+            try:
+                rows = fetch(after_key, before_key, self.page_size)
+            except Exception as err:
+                self._on_page_error(fetch, direction, err)
+                return
+            self._on_page(fetch, direction, rows)
+            return
+        self.executor.submit(
+            fetch, after_key, before_key, self.page_size,
+            on_success=lambda rows: self._on_page(fetch, direction, rows),
+            on_error=lambda err: self._on_page_error(fetch, direction, err),
+            key=self.key
+        )
+
+    def _on_page_error(self, fetch, direction: str, err: Exception) -> None:
+        if fetch is not self._fetch_page:
+            return
+        # Clear the flag so the next scroll retries instead of paging stopping for good
+        self._loading = None
+        logger.error(f"{self.key}: loading the {direction} page failed: {err}")
+
+    def _on_page(self, fetch, direction: str, rows: List[Dict]) -> None:
+        if fetch is not self._fetch_page:
+            return  # the result was reset while this page was loading
+        self._loading = None
+        full = len(rows) == self.page_size
+
+        if direction == "previous":
+            self._at_start = not full
+            if rows:
+                self._pages.appendleft(self._insert(rows, 0))
+                # Keep the same rows on screen after inserting above them
+                self.tree.yview_scroll(len(rows), "units")
+            if len(self._pages) > self.max_pages:
+                self._drop(self._pages.pop())
+                self._at_end = False
+        else:
+            self._at_end = not full
+            if rows:
+                self._pages.append(self._insert(rows, "end"))
+            if len(self._pages) > self.max_pages:
+                dropped = self._pages.popleft()
+                self._drop(dropped)
+                self._at_start = False
+                self.tree.yview_scroll(-len(dropped), "units")
+
+    # ========== TREE HELPERS ==========
+    def _insert(self, rows: List[Dict], index) -> List[Tuple[str, Any]]:
+        page = []
+        # Inserting at 0 in reverse keeps ascending order above existing rows
+        for row in (reversed(rows) if index == 0 else rows):
+            iid = self.tree.insert("", index, values=self.row_values(row), tags=self.row_tags(row))
+            page.append((iid, self.row_key(row)))
+        if index == 0:
+            page.reverse()
+        return page
+
+    def _drop(self, page: List[Tuple[str, Any]]) -> None:
+        self.tree.delete(*(iid for iid, _ in page))
+
+    def _clear(self) -> None:
+        self._loading = None
+        self._pages.clear()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+
+class RecycledRowList:
+    """Renders a long list with a fixed pool of recycled row widgets.
+
+    Only enough rows to fill ``body`` (plus ``overscan``) are ever created.
+    Rows are positioned with ``place`` and each pool slot serves every
+    item whose index maps to it, so scrolling by one row rebinds one slot
+    instead of rebuilding the list. ``create_row(master)`` builds a row and
+    returns an object with a ``frame`` attribute; ``bind_row(row, item)``
+    fills it with an item's data.
+    """
+
+    WHEEL_ROWS = 3
+
+    def __init__(
+            self,
+            body,
+            scrollbar,
+            create_row: Callable[[Any], Any],
+            bind_row: Callable[[Any, Any], None],
+            row_height: int = 40,
+            overscan: int = 2,
+            empty_label=None,
+    ):
+        self.body = body
+        self.scrollbar = scrollbar
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.overscan = overscan
+        self.empty_label = empty_label  # shown (packed) when there are no items
+
+        self._items: List[Any] = []
+        self._offset = 0  # pixels scrolled from the top
+        self._pool: List[Any] = []
+        self._bound: List[Any] = []  # item currently bound to each pool slot
+
+        self.scrollbar.configure(command=self._on_scrollbar)
+        self.body.bind("<Configure>", lambda e: self._render())
+        self._bind_wheel(self.body)
+
+    # ========== PUBLIC API ==========
+    def set_items(self, items: List[Any]) -> None:
+        """Show a new list, scrolled back to the top"""
+        self._items = items
+        self._offset = 0
+        self._bound = [None] * len(self._pool)
+        if self.empty_label is not None:
+            if items:
+                self.empty_label.pack_forget()
+            else:
+                self.empty_label.pack(pady=20)
+        self._render()
+
+    @property
+    def widget_rows(self) -> int:
+        """Row widgets created so far (bounded by the viewport, not the data)"""
+        return len(self._pool)
+
+    # ========== SCROLLING ==========
+    def _max_offset(self) -> int:
+        return max(0, len(self._items) * self.row_height - self.body.winfo_height())
+
+    def _scroll_to(self, offset: float) -> None:
+        self._offset = int(min(max(offset, 0), self._max_offset()))
+        self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        if action == "moveto":
+            self._scroll_to(float(amount) * len(self._items) * self.row_height)
+        elif unit == "pages":
+            self._scroll_to(self._offset + int(amount) * self.body.winfo_height())
+        else:
+            self._scroll_to(self._offset + int(amount) * self.row_height)
+
+    def _on_wheel(self, event) -> str:
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            steps = -self.WHEEL_ROWS
+        else:
+            steps = self.WHEEL_ROWS
+        self._scroll_to(self._offset + steps * self.row_height)
+        return "break"
+
+    def _bind_wheel(self, widget) -> None:
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    # ========== RENDERING ==========
+    def _ensure_pool(self) -> None:
+        needed = self.body.winfo_height() // self.row_height + 1 + self.overscan
+        while len(self._pool) < needed:
+            row = self.create_row(self.body)
+            self._bind_wheel(row.frame)
+            self._pool.append(row)
+            self._bound.append(None)
+
+    def _render(self) -> None:
+        self._ensure_pool()
+        size = len(self._pool)
+        first = self._offset // self.row_height
+        shift = self._offset % self.row_height
+
+        for position in range(size):
+            index = first + position
+            slot = index % size
+            row = self._pool[slot]
+            if index >= len(self._items):
+                row.frame.place_forget()
+                self._bound[slot] = None
+                continue
+            item = self._items[index]
+            if self._bound[slot] is not item:
+                self.bind_row(row, item)
+                self._bound[slot] = item
+            row.frame.place(x=0, y=position * self.row_height - shift,
+                            relwidth=1.0, height=self.row_height)
+
+        total = len(self._items) * self.row_height
+        if total:
+            self.scrollbar.set(self._offset / total,
+                               min(1.0, (self._offset + self.body.winfo_height()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)